@@ -3,36 +3,240 @@
 This module initializes the Flask application and defines the API routes.
 """
 
+import atexit
+import functools
+import hmac
+import mimetypes
 import os
+import re
 import sys
+import uuid
 
-from flask import Flask, jsonify, render_template, request, send_from_directory
+from flask import Flask, Response, g, jsonify, render_template, request, send_from_directory, url_for
+from werkzeug.security import safe_join
 from litellm import completion # Added for Ask-a-Pro
 
 from banditgui.chat.chat_manager import ChatManager
-from banditgui.config.logging import get_logger, setup_logging
+from banditgui.chat.storage import create_chat_store
+from banditgui.config.logging import get_log_levels, get_logger, get_logging_stats, set_log_level, setup_logging
 
 # Initialize configuration and logging
 from banditgui.config.settings import config
+from banditgui.exceptions import JobLimitError
+from banditgui.ssh.ssh_command import parse_ssh_command
 from banditgui.ssh.ssh_manager import SSHManager
+from banditgui.terminal.command_log import CommandLog
+from banditgui.terminal.command_usage import CommandUsageTracker
+from banditgui.terminal.jobs import JobManager
 from banditgui.terminal.terminal_manager import TerminalManager
+from banditgui.utils.assets import DIST_DIR, STATIC_DIR, AssetManifest
+from banditgui.utils.extract_commands import get_commands_catalog
+from banditgui.utils.hints import get_hints, hint_engine
+from banditgui.utils.lazy import register_warmup, warmup_all
+from banditgui.utils.profiling import profiler
 from banditgui.utils.quotes import get_random_quote, get_terminal_welcome_quotes
+from banditgui.utils.responses import FastJSONProvider, compress_response
+from banditgui.utils.tracing import tracer
 
 # Set up logging
-setup_logging(log_level=os.getenv('LOG_LEVEL', 'INFO'))
+setup_logging(
+    log_level=os.getenv('LOG_LEVEL', 'INFO'),
+    log_format=config.log_format,
+    queue_size=config.log_queue_size,
+    sampling=config.log_sampling
+)
 logger = get_logger('app')
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 
 # Initialize managers
 ssh_manager = SSHManager()
-terminal_manager = TerminalManager(ssh_manager=ssh_manager)
-chat_manager = ChatManager()
+usage_tracker = CommandUsageTracker(config.usage_dir, flush_interval=config.usage_flush_interval,
+                                    max_sessions=config.usage_max_sessions)
+atexit.register(usage_tracker.close)
+command_log = CommandLog(max_commands_per_level=config.command_log_max_per_level)
+terminal_manager = TerminalManager(ssh_manager=ssh_manager, usage_tracker=usage_tracker, command_log=command_log)
+terminal_manager.load_plugins(config.terminal_plugins)
+if config.chat_backend == 'sqlite':
+    chat_store = create_chat_store(
+        'sqlite',
+        db_path=config.chat_db_path,
+        batch_size=config.chat_batch_size,
+        flush_interval=config.chat_flush_interval
+    )
+else:
+    chat_store = create_chat_store(
+        'memory',
+        max_messages=config.chat_max_messages,
+        max_messages_per_level=config.chat_max_messages_per_level
+    )
+chat_manager = ChatManager(store=chat_store)
+atexit.register(chat_manager.close)
+asset_manifest = AssetManifest()
+atexit.register(tracer.close)
+
+# Browser sessions are identified by an opaque cookie
+SESSION_COOKIE = 'banditgui_session'
+SESSION_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+# Longest time a long-polling /chat/messages request is held open, in seconds
+CHAT_MAX_WAIT = 30.0
+
+# Longest time an /execute request waits for its command's result, in seconds;
+# kept short so slow commands are polled rather than holding a request thread
+JOB_MAX_WAIT = 2.0
+
+# Most recent commands from the command log included in an Ask-a-Pro prompt
+ASK_A_PRO_MAX_COMMANDS = 50
+
+# Seconds browsers may reuse a /quotes/welcome response
+QUOTES_WELCOME_MAX_AGE = 300
+
+# Seconds browsers may cache a fingerprinted /assets file (a new build changes its URL)
+ASSET_MAX_AGE = 365 * 24 * 3600
+
+# Precompressed copies written by the asset build, in order of preference
+ASSET_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+# Static file endpoints, which are not traced or profiled
+UNTRACED_ENDPOINTS = frozenset({'static', 'serve_asset', 'serve_js'})
+
+# Level data, quotes and hints load on first use; main() warms them up front
+register_warmup('terminal_levels', terminal_manager.warmup)
+register_warmup('commands_catalog', get_commands_catalog)
 
 logger.info("BanditGUI application initialized")
 
 
+def get_session_id() -> str:
+    """Get the session ID of the current request, assigning a new one if needed."""
+    if 'session_id' not in g:
+        session_id = request.cookies.get(SESSION_COOKIE, '')
+        if not SESSION_ID_PATTERN.fullmatch(session_id):
+            session_id = uuid.uuid4().hex
+            g.new_session = True
+        g.session_id = session_id
+    return g.session_id
+
+
+def is_admin_request() -> bool:
+    """
+    Check the request for the admin token.
+
+    Without ADMIN_TOKEN set no request is an admin request: the client
+    address cannot stand in for it, since behind a reverse proxy every
+    request arrives from the local machine.
+    """
+    if not config.admin_token:
+        return False
+    # compare_digest rejects str arguments with non-ASCII characters, so
+    # compare bytes: the header's raw bytes (WSGI decodes them as latin-1)
+    # with the UTF-8 encoded token
+    token = request.headers.get('X-Admin-Token', '')
+    return hmac.compare_digest(token.encode('latin-1'), config.admin_token.encode('utf-8'))
+
+
+def admin_required(view):
+    """Only serve a view to requests with the admin token."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if not is_admin_request():
+            logger.warning(f"Rejected admin request to {request.path} from {request.remote_addr}")
+            return jsonify({'status': 'error', 'message': 'Forbidden'}), 403
+        return view(*args, **kwargs)
+    return wrapper
+
+
+@app.before_request
+def start_request_trace():
+    """Give the request an ID and start its trace."""
+    if request.endpoint in UNTRACED_ENDPOINTS:
+        return
+    route = request.url_rule.rule if request.url_rule else request.path
+    g.trace = tracer.start_trace(
+        f"{request.method} {route}",
+        request_id=request.headers.get('X-Request-ID'),
+        traceparent=request.headers.get('traceparent'),
+        attributes={'http.method': request.method, 'http.route': route}
+    )
+
+
+@app.after_request
+def add_request_id(response):
+    """Tell the client its request ID and record the response status."""
+    if 'trace' in g:
+        span = g.trace[0]
+        span.set_attribute('http.status_code', response.status_code)
+        if response.status_code >= 500:
+            span.record_error(f"HTTP {response.status_code}")
+        response.headers['X-Request-ID'] = span.trace.request_id
+    return response
+
+
+@app.teardown_request
+def finish_request_trace(error):
+    """End the request's trace, exporting it if it is kept."""
+    trace = g.pop('trace', None)
+    if trace is not None:
+        tracer.finish_trace(*trace, error=error)
+
+
+@app.before_request
+def start_request_profile():
+    """Profile the request if an admin asked for it or profiling is armed."""
+    if request.endpoint in UNTRACED_ENDPOINTS:
+        return
+    requested = 'X-Profile' in request.headers and is_admin_request()
+    g.profile = profiler.start(request.endpoint, requested)
+
+
+@app.after_request
+def add_profile_id(response):
+    """Tell the client the name of its request's profile and note the status to save with it."""
+    if g.get('profile') is not None:
+        response.headers['X-Profile-ID'] = g.profile[1]
+        g.profile_status = response.status_code
+    return response
+
+
+@app.teardown_request
+def finish_request_profile(error):
+    """Stop and save the request's profile."""
+    profile = g.pop('profile', None)
+    if profile is None:
+        return
+    span = tracer.current_span()
+    profiler.stop(*profile, {
+        'method': request.method,
+        'path': request.path,
+        'endpoint': request.endpoint,
+        'status': g.get('profile_status', 500),
+        'request_id': span.trace.request_id if span else None,
+        'error': str(error) if error else None,
+    })
+
+
+@app.after_request
+def set_session_cookie(response):
+    """Send the session cookie to browsers that were just assigned a session."""
+    if g.get('new_session'):
+        response.set_cookie(SESSION_COOKIE, g.session_id, httponly=True, samesite='Lax')
+    return response
+
+
+@app.after_request
+def compress(response):
+    """Compress large API and page responses for clients that accept it."""
+    return compress_response(
+        response,
+        request.accept_encodings,
+        min_size=config.compression_min_size,
+        gzip_level=config.compression_level
+    )
+
+
 @app.route("/")
 def home():
     """Render the home page."""
@@ -96,42 +300,168 @@ def disconnect():
         return jsonify({'status': 'error', 'message': error_msg})
 
 
-@app.route('/execute', methods=['POST'])
-def execute():
-    """Execute a command."""
-    command = request.json.get('command')
-    if not command:
-        logger.warning("Execute request with no command")
-        return jsonify({'status': 'error', 'message': 'No command provided'})
-
+def run_command_job(job):
+    """Run an /execute job's command and build the response the browser gets for it."""
+    command = job.command
     logger.info(f"Executing command: {command}")
-    output = terminal_manager.execute_command(command)
+    output = terminal_manager.execute_command(command, session_id=job.session_id, level=job.level,
+                                             cancel_event=job.cancel_event)
 
     if output == "<clear>":
         logger.debug("Clear command executed")
-        return jsonify({'status': 'clear'})
+        return {'status': 'clear'}
 
     # Check if this is a level change command (like ssh bandit1@bandit.labs.overthewire.org)
-    # Parse SSH commands to detect level changes
-    if command.startswith('ssh bandit') and '@' in command:
-        try:
-            # Extract the level number from the command
-            level_part = command.split('bandit')[1].split('@')[0]
-            new_level = int(level_part)
-            terminal_manager.current_level = new_level
-            logger.info(f"Level changed to {new_level}")
-        except (ValueError, IndexError):
-            # If we can't parse the level, ignore it
-            pass
+    target = parse_ssh_command(command)
+    if target is not None and target.level is not None:
+        terminal_manager.current_level = target.level
+        logger.info(f"Level changed to {target.level}")
 
     # Process output to handle ANSI color codes for xterm.js
     # xterm.js can handle ANSI color codes directly, so we don't need to convert them
     logger.debug(f"Command executed, output length: {len(output)}")
-    return jsonify({
+    return {
         'status': 'success',
         'output': output,
         'currentLevel': terminal_manager.current_level
-    })
+    }
+
+
+# Commands run on a worker pool rather than in the request thread
+job_manager = JobManager(
+    run_command_job,
+    max_workers=config.job_workers,
+    max_per_session=config.job_max_per_session,
+    result_ttl=config.job_result_ttl
+)
+atexit.register(job_manager.close)
+
+
+def job_response(job, wait: float):
+    """
+    Respond with a job's result, waiting up to ``wait`` seconds for it.
+
+    Returns the result with the job's ID if the job has finished, otherwise
+    a 202 with status 'pending' for the browser to poll again.
+    """
+    wait = min(max(wait, 0.0), JOB_MAX_WAIT)
+    if wait and not job.finished:
+        # Waiting on a command is slow by design; don't keep the trace for it
+        tracer.exempt_from_slow()
+        job_manager.wait(job, wait)
+    if job.finished:
+        return jsonify(dict(job.result, jobId=job.id))
+    return jsonify({'status': 'pending', 'jobId': job.id}), 202
+
+
+@app.route('/execute', methods=['POST'])
+def execute():
+    """
+    Run a command.
+
+    The command runs in the background. The result is returned directly if
+    it is ready within ``wait`` seconds (JSON, default 0); otherwise the
+    response is a 202 with the job's ID, to poll with GET /execute/<job_id>.
+    """
+    command = request.json.get('command')
+    if not command:
+        logger.warning("Execute request with no command")
+        return jsonify({'status': 'error', 'message': 'No command provided'})
+
+    level = request.json.get('level')
+    if not isinstance(level, int):
+        level = None
+    wait = request.json.get('wait', 0)
+    if not isinstance(wait, (int, float)):
+        wait = 0
+
+    try:
+        job = job_manager.submit(command, session_id=get_session_id(), level=level)
+    except JobLimitError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 429
+    span = tracer.current_span()
+    if span is not None:
+        span.set_attribute('job.id', job.id)
+    return job_response(job, float(wait))
+
+
+@app.route('/execute/<job_id>', methods=['GET', 'DELETE'])
+def execute_job(job_id):
+    """
+    Poll for, or cancel, a command started with POST /execute.
+
+    A GET returns the result once the command has finished; with
+    ``wait=<seconds>`` the request is held until it does or the time is up.
+    A DELETE cancels the command.
+    """
+    session_id = get_session_id()
+    if request.method == 'DELETE':
+        job = job_manager.cancel(job_id, session_id)
+    else:
+        job = job_manager.get(job_id, session_id)
+    if job is None:
+        return jsonify({'status': 'error', 'message': 'Command not found'}), 404
+    return job_response(job, request.args.get('wait', 0, type=float))
+
+
+@app.route('/commands/usage', methods=['GET'])
+def commands_usage():
+    """Get the command catalog with this session's usage."""
+    session_id = get_session_id()
+    catalog = get_commands_catalog()
+    etag = f"{session_id}-{usage_tracker.get_version(session_id)}-{id(catalog)}"
+
+    # Unchanged usage is answered without building the payload (compressed
+    # responses carry the ETag as weak, so compare weakly)
+    if request.if_none_match.contains_weak(etag):
+        return '', 304, {'ETag': f'"{etag}"', 'Cache-Control': 'no-cache'}
+
+    version, commands = usage_tracker.get_usage(session_id, catalog)
+    response = jsonify({'status': 'success', 'commands': commands})
+    response.set_etag(f"{session_id}-{version}-{id(catalog)}")
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+@app.template_global()
+def asset_url(name):
+    """
+    Get the URL a page should load a static asset from.
+
+    Args:
+        name: The asset name, e.g. 'js/bandit-app.js'
+
+    Returns:
+        The fingerprinted /assets URL if the asset is built and up to date,
+        the plain /static URL if the file is in the static folder, or None
+        (so the template can fall back to a CDN copy)
+    """
+    filename = asset_manifest.get_file(name)
+    if filename:
+        return url_for('serve_asset', filename=filename)
+    if (STATIC_DIR / name).is_file():
+        return url_for('static', filename=name)
+    return None
+
+
+@app.route('/assets/<path:filename>')
+def serve_asset(filename):
+    """Serve a fingerprinted asset, precompressed if the browser accepts it."""
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    path, encoding = filename, None
+    for candidate, suffix in ASSET_ENCODINGS:
+        compressed = safe_join(str(DIST_DIR), filename + suffix)
+        if request.accept_encodings[candidate] and compressed and os.path.isfile(compressed):
+            path, encoding = filename + suffix, candidate
+            break
+
+    response = send_from_directory(DIST_DIR, path, mimetype=mimetype, max_age=ASSET_MAX_AGE)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
 
 
 @app.route('/static/js/<path:filename>')
@@ -158,13 +488,21 @@ def ask_a_pro():
     selected_llm_value = data.get('llm') # e.g., "openai/gpt-4o"
     level_name = data.get('level_name')
     level_description = data.get('level_description')
-    command_history_list = data.get('command_history', [])
+    command_history_list = data.get('command_history')
 
     # Basic validation
     if not all([selected_llm_value, level_name is not None, level_description]): # level_name can be 0
         logger.warning("Ask-a-Pro request missing required data.")
         return jsonify({'status': 'error', 'message': 'Missing required data for Ask-a-Pro.'}), 400
 
+    # Use the commands this session ran on the level unless the client sent its own list
+    if command_history_list is None:
+        try:
+            level = int(level_name)
+        except (TypeError, ValueError):
+            level = None
+        command_history_list = command_log.get_commands(get_session_id(), level, count=ASK_A_PRO_MAX_COMMANDS)
+
     command_history_str = "\n".join([f"- {cmd}" for cmd in command_history_list])
 
     prompt_template = f"""
@@ -266,6 +604,108 @@ Goal: Help them understand their current situation. Provide some technical expla
         return jsonify({'status': 'error', 'message': error_msg}), 500
 
 
+@app.route('/admin/command-log', methods=['GET'])
+@admin_required
+def export_command_log():
+    """
+    Export the terminal command log for instructors.
+
+    ``session=<id>`` limits the export to one session and ``format=csv``
+    returns a CSV file instead of JSON.
+    """
+    session_id = request.args.get('session')
+    if request.args.get('format') == 'csv':
+        return Response(
+            command_log.export_csv(session_id),
+            mimetype='text/csv',
+            headers={'Content-Disposition': 'attachment; filename=command_log.csv'}
+        )
+    return jsonify({'status': 'success', 'sessions': command_log.export(session_id)})
+
+
+@app.route('/admin/logging', methods=['GET', 'PUT'])
+@admin_required
+def admin_logging():
+    """
+    Report logger levels and logging queue counters, or change a level live.
+
+    A PUT takes JSON ``{"level": "DEBUG", "logger": "ssh.ssh_manager"}``;
+    ``logger`` is relative to 'banditgui' and may be omitted for the
+    application logger, and a null ``level`` makes a child logger follow its
+    parent again.
+    """
+    if request.method == 'PUT':
+        data = request.get_json(silent=True) or {}
+        try:
+            set_log_level(data.get('level'), data.get('logger'))
+        except ValueError as e:
+            return jsonify({'status': 'error', 'message': str(e)}), 400
+    return jsonify({'status': 'success', 'levels': get_log_levels(), 'logging': get_logging_stats()})
+
+
+@app.route('/admin/terminal', methods=['GET'])
+@admin_required
+def admin_terminal():
+    """
+    Report command jobs and SSH channels, including threads and channels
+    still held by cancelled or overdue commands.
+    """
+    return jsonify({'status': 'success', 'jobs': job_manager.get_stats(), 'ssh': ssh_manager.get_stats()})
+
+
+@app.route('/admin/profiles', methods=['GET', 'POST'])
+@admin_required
+def admin_profiles():
+    """
+    List recent request profiles, or arm profiling for upcoming requests.
+
+    A POST takes JSON ``{"count": 5, "endpoint": "execute"}`` to profile the
+    next five requests to /execute; ``endpoint`` may be omitted to profile
+    any request, and a count of 0 disarms. ``limit=<n>`` caps the listing.
+    """
+    if request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+        count = data.get('count', 1)
+        if not isinstance(count, int) or isinstance(count, bool):
+            return jsonify({'status': 'error', 'message': 'count must be an integer'}), 400
+        try:
+            profiler.arm(count, data.get('endpoint'))
+        except ValueError as e:
+            return jsonify({'status': 'error', 'message': str(e)}), 400
+    limit = request.args.get('limit', 50, type=int)
+    return jsonify({
+        'status': 'success',
+        'armed': profiler.armed(),
+        'profiles': profiler.list_profiles(limit)
+    })
+
+
+@app.route('/admin/profiles/<name>', methods=['GET'])
+@admin_required
+def admin_profile(name):
+    """
+    Get a request profile as a pstats report.
+
+    ``sort=<key>`` (cumulative, tottime, ncalls or filename) and
+    ``limit=<n>`` shape the report; ``format=pstats`` downloads the raw
+    profile instead.
+    """
+    if request.args.get('format') == 'pstats':
+        path = profiler.path(name)
+        if path is None:
+            return jsonify({'status': 'error', 'message': 'Profile not found'}), 404
+        return send_from_directory(path.parent, path.name, as_attachment=True,
+                                   mimetype='application/octet-stream')
+    try:
+        report = profiler.summary(name, request.args.get('sort', 'cumulative'),
+                                  request.args.get('limit', 40, type=int))
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    if report is None:
+        return jsonify({'status': 'error', 'message': 'Profile not found'}), 404
+    return Response(report, mimetype='text/plain')
+
+
 @app.route('/level-info', methods=['POST'])
 def level_info():
     """Get information about a specific level."""
@@ -308,28 +748,56 @@ def chat_message():
         return jsonify({'status': 'error', 'message': 'No message provided'})
 
     logger.info(f"Adding chat message for level {level}")
-    chat_manager.add_message(message, level, is_system)
+    chat_manager.add_message(message, level, is_system, session_id=get_session_id())
 
     return jsonify({'status': 'success', 'message': 'Message added'})
 
 
 @app.route('/chat/messages', methods=['GET'])
 def get_chat_messages():
-    """Get chat messages."""
+    """
+    Get chat messages.
+
+    Without a cursor the latest ``count`` messages are returned; ``before=<id>``
+    pages back through older ones. ``since=<id>`` returns only the messages
+    added after that ID, and with ``wait=<seconds>`` the request is held until
+    one arrives (long-polling) instead of returning an empty list.
+    """
     level = request.args.get('level')
     count = request.args.get('count', 50, type=int)
+    before = request.args.get('before', type=int)
+    since = request.args.get('since', type=int)
+    wait = request.args.get('wait', 0, type=float)
 
     level = int(level) if level and level.isdigit() else None
+    session_id = get_session_id()
     logger.info(f"Getting chat messages for level {level}")
-    messages = chat_manager.get_messages(level, count)
+    if since is not None and wait > 0:
+        # Long-polls are slow by design; don't keep their traces for it
+        tracer.exempt_from_slow()
+        messages = chat_manager.wait_for_messages(
+            since, min(wait, CHAT_MAX_WAIT), level, count, session_id=session_id
+        )
+    else:
+        messages = chat_manager.get_messages(level, count, session_id=session_id, before=before, since=since)
 
-    return jsonify({'status': 'success', 'messages': messages})
+    # Cursor for the next (older) page, if this one was full
+    next_before = messages[0].id if messages and since is None and 0 < count <= len(messages) else None
+    # Cursor for fetching newer messages
+    last_id = messages[-1].id if messages else since
+    return jsonify({
+        'status': 'success',
+        'messages': [msg.to_dict() for msg in messages],
+        'nextBefore': next_before,
+        'lastId': last_id
+    })
 
 
 @app.route('/chat/hint', methods=['POST'])
 def get_hint():
-    """Get a hint for the current level."""
+    """Get the next hint tier for the current level."""
     level = request.json.get('level')
+    tier = request.json.get('tier', 1)
 
     if not isinstance(level, int):
         logger.warning("Hint request with invalid level")
@@ -337,14 +805,36 @@ def get_hint():
             'status': 'error',
             'message': 'Invalid level provided'
         })
+    if not isinstance(tier, int):
+        tier = 1
 
-    logger.info(f"Getting hint for level {level}")
-    hint = chat_manager.get_hint(level)
+    logger.info(f"Getting hint tier {tier} for level {level}")
+    hint = chat_manager.get_hint(level, tier)
 
     # Add the hint as a system message
-    chat_manager.add_message(hint, level, is_system=True)
+    chat_manager.add_message(hint['hint'], level, is_system=True, session_id=get_session_id())
 
-    return jsonify({'status': 'success', 'hint': hint})
+    return jsonify({
+        'status': 'success',
+        'hint': hint['hint'],
+        'tier': hint['tier'],
+        'totalTiers': hint['total_tiers'],
+        'version': hint['version']
+    })
+
+
+@app.route('/hints/<int:level>', methods=['GET'])
+def level_hints(level):
+    """Get a level's hints up to a tier (all tiers by default)."""
+    up_to_tier = request.args.get('tier', type=int)
+    hints = get_hints(level, up_to_tier)
+    return jsonify({
+        'status': 'success',
+        'level': level,
+        'hints': hints,
+        'totalTiers': len(hint_engine.get_tiers(level)),
+        'version': hint_engine.get_version()
+    })
 
 
 @app.route('/quotes/random', methods=['GET'])
@@ -362,12 +852,20 @@ def random_quote():
 
 @app.route('/quotes/welcome', methods=['GET'])
 def welcome_quotes():
-    """Get quotes for terminal welcome message."""
+    """
+    Get quotes for terminal welcome message.
+
+    Quotes are not repeated to a session until it has seen them all. The
+    response may be cached by the browser for a few minutes.
+    """
     count = request.args.get('count', 3, type=int)
     logger.debug(f"Getting {count} welcome quotes")
     try:
-        quotes = get_terminal_welcome_quotes(count)
-        return jsonify({'status': 'success', 'quotes': quotes})
+        quotes = get_terminal_welcome_quotes(count, session_id=get_session_id())
+        response = jsonify({'status': 'success', 'quotes': quotes})
+        response.cache_control.private = True
+        response.cache_control.max_age = QUOTES_WELCOME_MAX_AGE
+        return response
     except Exception as e:
         error_msg = f"Error getting welcome quotes: {str(e)}"
         logger.error(error_msg)
@@ -382,7 +880,15 @@ def main():
         logger.error(f"Configuration error: {validation_error}")
         sys.exit(1)
 
+    # Load data files now so the first requests don't pay for it
+    warmup_all()
+
     # Run the Flask app
+    if not config.debug:
+        logger.warning(
+            "Flask's development server is not meant for production; use "
+            "gunicorn -c python:banditgui.config.gunicorn banditgui.wsgi:application"
+        )
     logger.info(f"Starting Flask app on {config.host}:{config.port}")
     app.run(debug=config.debug, host=config.host, port=config.port)
 
@@ -3,5 +3,6 @@ Chat-related functionality for BanditGUI.
 """
 
 from banditgui.chat.chat_manager import ChatManager
+from banditgui.chat.storage import ChatMessage, ChatStore, MemoryChatStore, SQLiteChatStore, create_chat_store
 
-__all__ = ['ChatManager']
+__all__ = ['ChatManager', 'ChatMessage', 'ChatStore', 'MemoryChatStore', 'SQLiteChatStore', 'create_chat_store']
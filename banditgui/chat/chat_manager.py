@@ -4,26 +4,52 @@ Chat Manager for BanditGUI.
 This module provides functionality for handling chat interactions and messages.
 """
 
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional
 
+from banditgui.chat.storage import ChatMessage, ChatStore, MemoryChatStore
 from banditgui.config.logging import get_logger
+from banditgui.utils.hints import HintEngine, hint_engine as default_hint_engine
 
 logger = get_logger('chat.chat_manager')
 
+# Partition used when no session is given
+DEFAULT_SESSION = 'default'
+
+# Longest a waiting request sleeps before checking the store again, so
+# messages added by other processes sharing the store are still picked up
+WAIT_POLL_INTERVAL = 1.0
+
 
 class ChatManager:
     """
     Manager for chat interactions and messages.
+
+    Messages are kept per session in a pluggable ChatStore. By default they
+    live in bounded in-memory ring buffers; a SQLiteChatStore keeps them on
+    disk across restarts.
     """
 
-    def __init__(self):
-        """Initialize the chat manager."""
-        self.messages = []
-        self.chat_history = {}  # Dictionary to store chat history by level
+    def __init__(self, max_messages: int = 1000, max_messages_per_level: int = 200,
+                 store: Optional[ChatStore] = None, hint_engine: Optional[HintEngine] = None):
+        """
+        Initialize the chat manager.
+
+        Args:
+            max_messages: Number of messages kept across all levels (in-memory store only)
+            max_messages_per_level: Number of messages kept for each level (in-memory store only)
+            store: Storage backend (defaults to a MemoryChatStore)
+            hint_engine: Source of level hints (defaults to the shared HintEngine)
+        """
+        self.store = store if store is not None else MemoryChatStore(max_messages, max_messages_per_level)
+        self.hint_engine = hint_engine if hint_engine is not None else default_hint_engine
         self.current_level = None
-        logger.debug("ChatManager initialized")
+        self._new_message = threading.Condition()
+        logger.debug(f"ChatManager initialized with {type(self.store).__name__}")
 
-    def add_message(self, message: str, level: Optional[int] = None, is_system: bool = False) -> None:
+    def add_message(self, message: str, level: Optional[int] = None, is_system: bool = False,
+                    session_id: Optional[str] = None) -> None:
         """
         Add a message to the chat history.
 
@@ -31,6 +57,7 @@ class ChatManager:
             message: The message content
             level: The level associated with the message (if any)
             is_system: Whether this is a system message
+            session_id: The session the message belongs to
         """
         if not message:
             logger.debug("Empty message provided to ChatManager.add_message; no action taken.")
@@ -40,105 +67,97 @@ class ChatManager:
         if level is None:
             level = self.current_level
 
-        # Create message object
-        msg_obj = {
-            'content': message,
-            'level': level,
-            'is_system': is_system,
-            'timestamp': self._get_timestamp()
-        }
-
-        # Add to current messages list
-        self.messages.append(msg_obj)
-
-        # Add to level-specific history if level is specified
-        if level is not None:
-            if level not in self.chat_history:
-                self.chat_history[level] = []
-            self.chat_history[level].append(msg_obj)
+        self.store.add(session_id or DEFAULT_SESSION, ChatMessage(message, level, is_system, time.time()))
+        with self._new_message:
+            self._new_message.notify_all()
 
         logger.debug(f"Added {'system' if is_system else 'user'} message for level {level}")
 
-    def get_messages(self, level: Optional[int] = None, count: int = 50) -> List[Dict]:
+    def get_messages(self, level: Optional[int] = None, count: int = 50, session_id: Optional[str] = None,
+                     before: Optional[int] = None, since: Optional[int] = None) -> List[ChatMessage]:
         """
         Get recent messages, optionally filtered by level.
 
         Args:
             level: The level to filter messages by (if None, returns all messages)
             count: Maximum number of messages to return
+            session_id: The session to get messages for
+            before: Only return messages older than the message with this ID
+            since: Only return messages newer than the message with this ID
 
         Returns:
-            List[Dict]: List of message objects
+            List[ChatMessage]: Message records, serialized with ``to_dict``
         """
-        messages = self.messages if level is None else self.chat_history.get(level, [])
-        # Return the most recent messages up to count
-        return messages[-count:] if messages else []
+        return self.store.get(session_id or DEFAULT_SESSION, level, count, before, since)
 
-    def set_current_level(self, level: Optional[int]) -> None:
+    def wait_for_messages(self, since: int, timeout: float, level: Optional[int] = None, count: int = 50,
+                          session_id: Optional[str] = None) -> List[ChatMessage]:
+        """
+        Get the messages newer than ``since``, waiting for one to arrive if there are none yet.
+
+        Args:
+            since: Return messages newer than the message with this ID
+            timeout: Maximum number of seconds to wait
+            level: The level to filter messages by (if None, waits for any level)
+            count: Maximum number of messages to return
+            session_id: The session to get messages for
+
+        Returns:
+            List[ChatMessage]: The new messages, empty if none arrived in time
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            messages = self.get_messages(level, count, session_id=session_id, since=since)
+            remaining = deadline - time.monotonic()
+            if messages or remaining <= 0:
+                return messages
+            with self._new_message:
+                self._new_message.wait(min(remaining, WAIT_POLL_INTERVAL))
+
+    def set_current_level(self, level: Optional[int], session_id: Optional[str] = None) -> None:
         """
         Set the current level for chat context.
 
         Args:
             level: The current level
+            session_id: The session to add the level switch message to
         """
         self.current_level = level
         logger.info(f"Chat context set to level {level}")
 
         # Add a system message when changing levels
         if level is not None:
-            self.add_message(f"Switched to level {level}", level=level, is_system=True)
+            self.add_message(f"Switched to level {level}", level=level, is_system=True, session_id=session_id)
 
-    def clear_messages(self, level: Optional[int] = None) -> None:
+    def clear_messages(self, level: Optional[int] = None, session_id: Optional[str] = None) -> None:
         """
         Clear messages, optionally only for a specific level.
 
         Args:
             level: The level to clear messages for (if None, clears all messages)
+            session_id: The session to clear messages for
         """
+        self.store.clear(session_id or DEFAULT_SESSION, level)
         if level is not None:
-            # Clear only messages for the specified level
-            if level in self.chat_history:
-                self.chat_history[level] = []
-                logger.info(f"Cleared messages for level {level}")
-            
-            # Also remove these messages from the main messages list
-            self.messages = [msg for msg in self.messages if msg.get('level') != level]
+            logger.info(f"Cleared messages for level {level}")
         else:
-            # Clear all messages
-            self.messages = []
-            self.chat_history = {}
             logger.info("Cleared all messages")
 
-    def get_hint(self, level: int) -> str:
+    def close(self) -> None:
+        """Close the storage backend."""
+        self.store.close()
+
+    def get_hint(self, level: int, tier: int = 1) -> Dict[str, Any]:
         """
         Get a hint for the specified level.
 
         Args:
             level: The level to get a hint for
+            tier: Which hint to get, from 1 (most general) to the level's number of tiers
 
         Returns:
-            str: A hint for the level
+            Dict[str, Any]: The hint text with its tier, total number of tiers and data version
         """
-        # This is a placeholder - in a real implementation, hints would be loaded from a database or file
-        hints = {
-            0: "Try using the 'ls' command to list files, and 'cat' to read file contents.",
-            1: "Look for hidden files using 'ls -la'. Files starting with a dot are hidden.",
-            2: "Spaces in filenames can be tricky. Use quotes or escape the spaces with backslashes.",
-            3: "Files can have special characters. Try using tab completion to help with filenames.",
-            4: "Some files might be hidden in directories. Use 'find' to search recursively.",
-            5: "Check file permissions with 'ls -l'. You might need to use 'chmod' to change them.",
-        }
-        
-        hint = hints.get(level, "No hint available for this level.")
-        logger.info(f"Provided hint for level {level}")
+        hint = self.hint_engine.get_hint(level, tier)
+        logger.info(f"Provided hint tier {hint['tier']}/{hint['total_tiers']} for level {level}")
         return hint
-
-    def _get_timestamp(self) -> str:
-        """
-        Get the current timestamp in a readable format.
-
-        Returns:
-            str: Formatted timestamp
-        """
-        from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,458 @@
+"""
+Chat history storage for BanditGUI.
+
+This module provides the storage backends used by the ChatManager. History is
+partitioned by session, and every stored message gets an ID that increases
+with insertion order, which clients use as a pagination cursor.
+"""
+
+import abc
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import dropwhile, islice, takewhile
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from banditgui.config.logging import get_logger
+
+logger = get_logger('chat.storage')
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@lru_cache(maxsize=256)
+def _format_second(second: int) -> str:
+    return time.strftime(TIMESTAMP_FORMAT, time.localtime(second))
+
+
+def format_timestamp(created_at: float) -> str:
+    """
+    Format an epoch timestamp the way chat messages show it.
+
+    Messages arrive in bursts within the same second, so formatted seconds are
+    cached.
+
+    Args:
+        created_at: Seconds since the epoch
+
+    Returns:
+        str: Local time as 'YYYY-MM-DD HH:MM:SS'
+    """
+    return _format_second(int(created_at))
+
+
+class ChatMessage:
+    """
+    A stored chat message.
+
+    The timestamp is kept as epoch seconds and only formatted by ``to_dict``
+    when the message is serialized.
+    """
+
+    __slots__ = ('id', 'content', 'level', 'is_system', 'created_at')
+
+    def __init__(self, content: str, level: Optional[int] = None, is_system: bool = False,
+                 created_at: float = 0.0, id: Optional[int] = None):
+        """
+        Initialize a message record.
+
+        Args:
+            content: The message content
+            level: The level associated with the message (if any)
+            is_system: Whether this is a system message
+            created_at: Seconds since the epoch when the message was added
+            id: The ID assigned by the store, None until the message is stored
+        """
+        self.id = id
+        self.content = content
+        self.level = level
+        self.is_system = is_system
+        self.created_at = created_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the message for the API.
+
+        Returns:
+            Dict[str, Any]: 'id', 'content', 'level', 'is_system' and a formatted 'timestamp'
+        """
+        return {
+            'id': self.id,
+            'content': self.content,
+            'level': self.level,
+            'is_system': self.is_system,
+            'timestamp': _format_second(int(self.created_at))
+        }
+
+    def __repr__(self) -> str:
+        return f"ChatMessage(id={self.id!r}, level={self.level!r}, content={self.content!r})"
+
+
+class ChatStore(abc.ABC):
+    """
+    Interface of chat history storage backends.
+
+    Stores keep ChatMessage records per session and assign each one an ID
+    that increases with insertion order.
+    """
+
+    @abc.abstractmethod
+    def add(self, session_id: str, message: ChatMessage) -> None:
+        """
+        Store a message for a session.
+
+        Args:
+            session_id: The session the message belongs to
+            message: The message to store
+        """
+
+    @abc.abstractmethod
+    def get(self, session_id: str, level: Optional[int] = None, count: int = 50,
+            before: Optional[int] = None, since: Optional[int] = None) -> List[ChatMessage]:
+        """
+        Get the most recent messages of a session, oldest first.
+
+        With ``since``, the oldest ``count`` messages added after that ID are
+        returned instead, so clients can fetch only what is new.
+
+        Args:
+            session_id: The session
+            level: Only return messages for this level (if None, all levels)
+            count: Maximum number of messages to return (0 or less for all)
+            before: Only return messages older than the message with this ID
+            since: Only return messages newer than the message with this ID
+
+        Returns:
+            List[ChatMessage]: The messages
+        """
+
+    @abc.abstractmethod
+    def clear(self, session_id: str, level: Optional[int] = None) -> None:
+        """
+        Delete a session's messages.
+
+        Args:
+            session_id: The session
+            level: Only delete messages for this level (if None, all levels)
+        """
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+
+
+class _Partition:
+    """Bounded ring buffers holding one session's messages."""
+
+    def __init__(self, max_messages: int, max_messages_per_level: int):
+        self.max_messages_per_level = max_messages_per_level
+        self.messages: Deque[ChatMessage] = deque(maxlen=max_messages)
+        self.by_level: Dict[int, Deque[ChatMessage]] = {}
+        self.cleared_through: Dict[int, int] = {}  # Last message ID cleared per level
+
+
+class MemoryChatStore(ChatStore):
+    """
+    In-memory chat history kept in bounded ring buffers.
+
+    Each session has one ring across all levels and one per level; when a ring
+    is full its oldest message is dropped. The least recently used session is
+    dropped once more than ``max_sessions`` are held.
+    """
+
+    def __init__(self, max_messages: int = 1000, max_messages_per_level: int = 200, max_sessions: int = 1000):
+        """
+        Initialize the memory store.
+
+        Args:
+            max_messages: Number of messages kept per session across all levels
+            max_messages_per_level: Number of messages kept per session for each level
+            max_sessions: Number of sessions kept
+        """
+        self.max_messages = max_messages
+        self.max_messages_per_level = max_messages_per_level
+        self.max_sessions = max_sessions
+        self._partitions: "OrderedDict[str, _Partition]" = OrderedDict()
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def _partition(self, session_id: str, create: bool = False) -> Optional[_Partition]:
+        """Get a session's partition and mark it recently used. Caller holds the lock."""
+        partition = self._partitions.get(session_id)
+        if partition is not None:
+            self._partitions.move_to_end(session_id)
+        elif create:
+            partition = self._partitions[session_id] = _Partition(self.max_messages, self.max_messages_per_level)
+            if len(self._partitions) > self.max_sessions:
+                evicted, _ = self._partitions.popitem(last=False)
+                logger.debug(f"Dropped chat history of session {evicted}")
+        return partition
+
+    def add(self, session_id: str, message: ChatMessage) -> None:
+        with self._lock:
+            partition = self._partition(session_id, create=True)
+            message.id = self._next_id
+            self._next_id += 1
+
+            partition.messages.append(message)
+            level = message.level
+            if level is not None:
+                history = partition.by_level.get(level)
+                if history is None:
+                    history = partition.by_level[level] = deque(maxlen=partition.max_messages_per_level)
+                history.append(message)
+
+    def get(self, session_id: str, level: Optional[int] = None, count: int = 50,
+            before: Optional[int] = None, since: Optional[int] = None) -> List[ChatMessage]:
+        with self._lock:
+            partition = self._partition(session_id)
+            if partition is None:
+                return []
+
+            # Walk back from the newest message
+            if level is not None:
+                candidates = reversed(partition.by_level.get(level, ()))
+            else:
+                # Skip messages of cleared levels
+                cleared = partition.cleared_through
+                candidates = (
+                    msg for msg in reversed(partition.messages)
+                    if msg.level is None or msg.id > cleared.get(msg.level, 0)
+                )
+
+            if since is not None:
+                newer = list(takewhile(lambda msg: msg.id > since, candidates))
+                newer.reverse()
+                return newer[:count] if count > 0 else newer
+
+            if before is not None:
+                candidates = dropwhile(lambda msg: msg.id >= before, candidates)
+            if count > 0:
+                candidates = islice(candidates, count)
+            recent = list(candidates)
+            recent.reverse()
+            return recent
+
+    def clear(self, session_id: str, level: Optional[int] = None) -> None:
+        with self._lock:
+            if level is None:
+                self._partitions.pop(session_id, None)
+                return
+
+            partition = self._partition(session_id)
+            if partition is None:
+                return
+            if level in partition.by_level:
+                partition.by_level[level].clear()
+            # Hide this level's older messages in the session ring without scanning it
+            partition.cleared_through[level] = self._next_id - 1
+
+
+class SQLiteChatStore(ChatStore):
+    """
+    Chat history stored in an embedded SQLite database.
+
+    The database runs in WAL mode so reads don't block the writer. New messages
+    are buffered and inserted in batches, either once ``batch_size`` are
+    pending or every ``flush_interval`` seconds; reads and clears flush first,
+    so a process always sees its own writes.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS chat_messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT NOT NULL,
+            level INTEGER,
+            content TEXT NOT NULL,
+            is_system INTEGER NOT NULL DEFAULT 0,
+            created_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_chat_messages_session_level_time
+            ON chat_messages (session_id, level, created_at);
+        CREATE INDEX IF NOT EXISTS idx_chat_messages_session_time
+            ON chat_messages (session_id, created_at);
+        CREATE INDEX IF NOT EXISTS idx_chat_messages_session_level_id
+            ON chat_messages (session_id, level, id);
+        CREATE INDEX IF NOT EXISTS idx_chat_messages_session_id
+            ON chat_messages (session_id, id);
+    """
+
+    def __init__(self, db_path: Path, batch_size: int = 50, flush_interval: Optional[float] = 1.0):
+        """
+        Initialize the SQLite store, creating the database if needed.
+
+        Args:
+            db_path: Path of the database file
+            batch_size: Number of pending messages that triggers an insert
+            flush_interval: Seconds between flushes, or None to only flush on demand
+        """
+        self.db_path = Path(db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: List[Tuple[str, Optional[int], str, int, float]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+        if flush_interval:
+            self._thread = threading.Thread(target=self._flush_loop, name='chat-store-flush', daemon=True)
+            self._thread.start()
+
+        logger.debug(f"SQLiteChatStore initialized at {self.db_path}")
+
+    def _flush_locked(self) -> int:
+        """Insert the pending messages in one transaction. Caller holds the lock."""
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, []
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO chat_messages (session_id, level, content, is_system, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    pending
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Error writing {len(pending)} chat messages: {e}")
+            self._pending = pending + self._pending
+            return 0
+        return len(pending)
+
+    def flush(self) -> int:
+        """
+        Insert the pending messages.
+
+        Returns:
+            int: Number of messages written
+        """
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def add(self, session_id: str, message: ChatMessage) -> None:
+        with self._lock:
+            self._pending.append((
+                session_id,
+                message.level,
+                message.content,
+                int(bool(message.is_system)),
+                message.created_at
+            ))
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def get(self, session_id: str, level: Optional[int] = None, count: int = 50,
+            before: Optional[int] = None, since: Optional[int] = None) -> List[ChatMessage]:
+        if since is not None:
+            return self._get_since(session_id, level, count, since)
+
+        where = ["session_id = ?"]
+        params: List[Any] = [session_id]
+        if level is not None:
+            where.append("level = ?")
+            params.append(level)
+
+        with self._lock:
+            self._flush_locked()
+
+            if before is not None:
+                # Keyset pagination on (created_at, id), which the indexes keep in order
+                row = self._conn.execute(
+                    "SELECT created_at FROM chat_messages WHERE id = ?", (before,)
+                ).fetchone()
+                if row is not None:
+                    where.append("(created_at, id) < (?, ?)")
+                    params.extend((row[0], before))
+                else:
+                    where.append("id < ?")
+                    params.append(before)
+
+            params.append(count if count > 0 else -1)
+            rows = self._conn.execute(
+                "SELECT id, content, level, is_system, created_at FROM chat_messages "
+                f"WHERE {' AND '.join(where)} ORDER BY created_at DESC, id DESC LIMIT ?",
+                params
+            ).fetchall()
+
+        return self._to_messages(reversed(rows))
+
+    def _get_since(self, session_id: str, level: Optional[int], count: int, since: int) -> List[ChatMessage]:
+        """Get the messages added after ``since`` in insertion order."""
+        # IDs follow insertion order, unlike created_at when several processes
+        # write. The (session_id, [level,] id) indexes bound the range to this
+        # session's new rows, however old the cursor is.
+        where = ["session_id = ?", "id > ?"]
+        params: List[Any] = [session_id, since]
+        if level is not None:
+            where.append("level = ?")
+            params.append(level)
+        params.append(count if count > 0 else -1)
+
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute(
+                "SELECT id, content, level, is_system, created_at FROM chat_messages "
+                f"WHERE {' AND '.join(where)} ORDER BY id LIMIT ?",
+                params
+            ).fetchall()
+        return self._to_messages(rows)
+
+    @staticmethod
+    def _to_messages(rows) -> List[ChatMessage]:
+        return [
+            ChatMessage(content, msg_level, bool(is_system), created_at, msg_id)
+            for msg_id, content, msg_level, is_system, created_at in rows
+        ]
+
+    def clear(self, session_id: str, level: Optional[int] = None) -> None:
+        with self._lock:
+            self._flush_locked()
+            with self._conn:
+                if level is None:
+                    self._conn.execute("DELETE FROM chat_messages WHERE session_id = ?", (session_id,))
+                else:
+                    self._conn.execute(
+                        "DELETE FROM chat_messages WHERE session_id = ? AND level = ?", (session_id, level)
+                    )
+
+    def close(self) -> None:
+        """Stop the flush thread, write pending messages and close the database."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+
+def create_chat_store(backend: str = 'memory', **options: Any) -> ChatStore:
+    """
+    Create a chat store by backend name.
+
+    Args:
+        backend: 'memory' or 'sqlite'
+        **options: Arguments for the backend's constructor
+
+    Returns:
+        ChatStore: The new store
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backends = {'memory': MemoryChatStore, 'sqlite': SQLiteChatStore}
+    store_class = backends.get(backend.lower())
+    if store_class is None:
+        raise ValueError(f"Unknown chat backend {backend!r}, expected one of: {', '.join(backends)}")
+    return store_class(**options)
@@ -0,0 +1,40 @@
+"""
+Gunicorn settings for BanditGUI.
+
+Usage:
+    gunicorn -c python:banditgui.config.gunicorn banditgui.wsgi:application
+
+Settings come from the same environment variables as the rest of the
+configuration (HOST, PORT, THREADS, WORKER_TIMEOUT, GRACEFUL_TIMEOUT).
+
+The SSH connection and terminal state are held by the worker process, so a
+single worker serves every request and THREADS sets how many run at once.
+Sending SIGHUP to the master reloads gracefully: a new worker is started and
+the old one finishes its in-flight requests (up to GRACEFUL_TIMEOUT seconds)
+before it exits, which closes its SSH connection.
+"""
+
+from banditgui.config.settings import config
+
+bind = f"{config.host}:{config.port}"
+# The SSH connection and terminal state live in the worker process, so a
+# second worker would not see the session opened in the first
+workers = 1
+threads = config.threads
+worker_class = 'gthread'
+timeout = config.worker_timeout
+graceful_timeout = config.graceful_timeout
+
+# The app opens its chat database and starts background flush threads at
+# import time; neither survives a fork, so each worker imports the app itself
+preload_app = False
+
+accesslog = '-'
+errorlog = '-'
+
+
+def worker_exit(server, worker):
+    """Stop the worker's command jobs and close its SSH connection when it stops."""
+    from banditgui.app import job_manager, ssh_manager
+    job_manager.close()
+    ssh_manager.close()
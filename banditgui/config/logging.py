@@ -1,65 +1,344 @@
 """
 Logging configuration for BanditGUI.
 
-This module sets up logging for the application.
+This module sets up logging for the application. Loggers only put records on
+a bounded in-memory queue; a background listener thread formats them and
+writes them to the console and log file, so a slow terminal or disk never
+holds up a request. When the queue is full, records are dropped and counted
+rather than waited on.
 """
 
+import atexit
+import json
 import logging
 import os
+import queue
+import random
 import sys
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Optional
 
+# Attributes every LogRecord has; anything else was passed with ``extra=``
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
 
-def setup_logging(log_level: str = 'INFO', log_file: Optional[str] = None) -> None:
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# ID of the request being handled, added to each record as 'request_id'
+request_id_var: ContextVar[Optional[str]] = ContextVar('banditgui_request_id', default=None)
+
+# Name of the handler setup_logging attaches to the 'banditgui' logger
+QUEUE_HANDLER_NAME = 'banditgui-queue'
+
+# The running pipeline and the settings it was built with, stopped at exit
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional['DroppingQueueHandler'] = None
+_pipeline_settings: Optional[tuple] = None
+_setup_lock = threading.RLock()
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record as JSON.
+
+        Args:
+            record: The record to format
+
+        Returns:
+            str: JSON with 'ts', 'level', 'logger', 'message' and 'thread',
+            plus 'exc' for exceptions and any fields passed with ``extra=``
+        """
+        entry: Dict[str, Any] = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record.created))
+                  + f".{int(record.msecs):03d}",
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a fraction of the records below WARNING from chosen loggers.
+
+    Rates apply to a logger and its children; warnings and errors are
+    always kept.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        """
+        Initialize the filter.
+
+        Args:
+            rates: Fraction of records to keep (0-1), by full logger name
+        """
+        super().__init__()
+        self.rates = rates
+        self.sampled_out = 0
+
+    def _rate(self, name: str) -> float:
+        """Sampling rate of a logger: its own, else its nearest ancestor's, else 1."""
+        while name:
+            rate = self.rates.get(name)
+            if rate is not None:
+                return rate
+            name = name.rpartition('.')[0]
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return whether to keep a record."""
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self._rate(record.name)
+        if rate >= 1.0 or random.random() < rate:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks.
+
+    Records that arrive while the queue is full are dropped and counted by
+    level. The message and any traceback are rendered to text on the
+    caller's thread, since arguments may change and frames should not be
+    kept alive after the call; the listener's formatter lays out the rest.
+    Records logged while handling a request get its 'request_id'.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        """
+        Initialize the handler.
+
+        Args:
+            log_queue: Bounded queue the listener reads from
+        """
+        super().__init__(log_queue)
+        self.dropped: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Copy a record with its message merged and its traceback rendered."""
+        record = logging.makeLogRecord(vars(record))
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        request_id = request_id_var.get()
+        if request_id is not None and not hasattr(record, 'request_id'):
+            record.request_id = request_id
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped[record.levelname] += 1
+
+
+def parse_sampling(spec: str) -> Dict[str, float]:
+    """
+    Parse a sampling spec such as 'ssh.ssh_manager=0.1,app=0.5'.
+
+    Args:
+        spec: Comma-separated logger=rate pairs; logger names are relative to 'banditgui'
+
+    Returns:
+        Dict[str, float]: Rates by full logger name
+
+    Raises:
+        ValueError: If a pair is malformed or a rate is outside 0-1
+    """
+    rates = {}
+    for pair in filter(None, (part.strip() for part in spec.split(','))):
+        name, sep, rate = pair.partition('=')
+        if not sep or not name.strip():
+            raise ValueError(f'Invalid log sampling entry: {pair}')
+        value = float(rate)
+        if not 0.0 <= value <= 1.0:
+            raise ValueError(f'Invalid log sampling rate for {name}: {rate}')
+        rates[f'banditgui.{name.strip()}'] = value
+    return rates
+
+
+def _parse_level(level: str) -> int:
+    """Convert a level name such as 'INFO' to its number, raising ValueError if unknown."""
+    numeric_level = getattr(logging, str(level).upper(), None)
+    if not isinstance(numeric_level, int):
+        raise ValueError(f'Invalid log level: {level}')
+    return numeric_level
+
+
+def setup_logging(log_level: str = 'INFO', log_file: Optional[str] = None,
+                  log_format: str = 'text', queue_size: int = 10000,
+                  sampling: Optional[str] = None) -> None:
     """
     Set up logging for the application.
 
+    Safe to call more than once: the same settings leave the running
+    pipeline alone, a new level is applied in place, and other changes
+    replace the pipeline, so the 'banditgui' logger always has exactly one
+    handler.
+
     Args:
         log_level: The log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to the log file, if None, logs to console only
+        log_format: 'text' for human-readable lines or 'json' for one JSON object per line
+        queue_size: Records buffered for the writer thread before new ones are dropped
+        sampling: Per-logger sampling spec for records below WARNING (see parse_sampling)
     """
+    global _listener, _queue_handler, _pipeline_settings
+
     # Convert log level string to logging level
-    numeric_level = getattr(logging, log_level.upper(), None)
-    if not isinstance(numeric_level, int):
-        raise ValueError(f'Invalid log level: {log_level}')
+    numeric_level = _parse_level(log_level)
+    if log_format not in ('text', 'json'):
+        raise ValueError(f'Invalid log format: {log_format}')
+    rates = parse_sampling(sampling or '')
 
-    # Create logger
     logger = logging.getLogger('banditgui')
-    logger.setLevel(numeric_level)
+    settings = (log_file, log_format, queue_size, tuple(sorted(rates.items())))
 
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    with _setup_lock:
+        if _listener is not None and settings == _pipeline_settings:
+            if logger.level != numeric_level:
+                logger.setLevel(numeric_level)
+                logger.info(f"Log level changed to {logging.getLevelName(numeric_level)}")
+            return
+
+        # Create formatter
+        formatter = JsonFormatter() if log_format == 'json' else logging.Formatter(TEXT_FORMAT)
+
+        # Create console handler; levels are enforced by the loggers, so a
+        # level changed at runtime needs no handler changes
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        handlers = [console_handler]
 
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(numeric_level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-
-    # Create file handler if log file is specified
-    if log_file:
-        # Create log directory if it doesn't exist
-        log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-
-        # Create rotating file handler (10 MB max size, keep 5 backups)
-        file_handler = RotatingFileHandler(
-            log_file, maxBytes=10*1024*1024, backupCount=5
-        )
-        file_handler.setLevel(numeric_level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
-    # Prevent logs from being propagated to the root logger
-    logger.propagate = False
+        # Create file handler if log file is specified
+        if log_file:
+            # Create log directory if it doesn't exist
+            log_dir = os.path.dirname(log_file)
+            if log_dir and not os.path.exists(log_dir):
+                os.makedirs(log_dir)
+
+            # Create rotating file handler (10 MB max size, keep 5 backups)
+            file_handler = RotatingFileHandler(
+                log_file, maxBytes=10*1024*1024, backupCount=5
+            )
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+
+        # Replace the pipeline from an earlier call (or an earlier import of
+        # this module) rather than running two
+        for handler in list(logger.handlers):
+            if handler.get_name() == QUEUE_HANDLER_NAME:
+                logger.removeHandler(handler)
+        stop_logging()
+
+        # Loggers enqueue; the listener thread does the writing
+        log_queue = queue.Queue(maxsize=queue_size)
+        queue_handler = DroppingQueueHandler(log_queue)
+        queue_handler.set_name(QUEUE_HANDLER_NAME)
+        queue_handler.addFilter(SamplingFilter(rates))
+        logger.addHandler(queue_handler)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listener, _queue_handler, _pipeline_settings = listener, queue_handler, settings
+
+        logger.setLevel(numeric_level)
+
+        # Prevent logs from being propagated to the root logger
+        logger.propagate = False
 
     logger.info(f"Logging initialized with level {log_level}")
 
 
+def set_log_level(level: Optional[str], name: Optional[str] = None) -> None:
+    """
+    Change a logger's level while the application runs.
+
+    Args:
+        level: The new level, or None to make a child logger follow its parent again
+        name: The logger, relative to 'banditgui' (if None, the 'banditgui' logger itself)
+
+    Raises:
+        ValueError: If the level is unknown, or None is given for the 'banditgui' logger
+    """
+    if level is None and not name:
+        raise ValueError('The banditgui logger needs a level')
+    numeric_level = logging.NOTSET if level is None else _parse_level(level)
+    logger = get_logger(name) if name else logging.getLogger('banditgui')
+    with _setup_lock:
+        logger.setLevel(numeric_level)
+    logging.getLogger('banditgui').info(
+        f"Log level of {logger.name} set to {logging.getLevelName(numeric_level)}"
+    )
+
+
+def get_log_levels() -> Dict[str, str]:
+    """
+    Get the levels set on the application's loggers.
+
+    Returns:
+        Dict[str, str]: Level names by logger name, for 'banditgui' and any
+        child logger with its own level
+    """
+    levels = {'banditgui': logging.getLevelName(logging.getLogger('banditgui').level)}
+    for name, logger in list(logging.Logger.manager.loggerDict.items()):
+        if (name.startswith('banditgui.') and isinstance(logger, logging.Logger)
+                and logger.level != logging.NOTSET):
+            levels[name] = logging.getLevelName(logger.level)
+    return levels
+
+
+@atexit.register
+def stop_logging() -> None:
+    """Write out the queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    """
+    Get counters for the logging queue.
+
+    Returns:
+        Dict[str, Any]: 'queued' (records waiting), 'capacity', 'dropped'
+        (by level, because the queue was full) and 'sampled_out'
+    """
+    if _queue_handler is None:
+        return {'queued': 0, 'capacity': 0, 'dropped': {}, 'sampled_out': 0}
+    sampled_out = sum(f.sampled_out for f in _queue_handler.filters if isinstance(f, SamplingFilter))
+    return {
+        'queued': _queue_handler.queue.qsize(),
+        'capacity': _queue_handler.queue.maxsize,
+        'dropped': dict(_queue_handler.dropped),
+        'sampled_out': sampled_out,
+    }
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the given name.
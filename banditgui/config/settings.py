@@ -28,6 +28,68 @@ class Config:
         self.host = os.getenv('HOST', '127.0.0.1')
         self.port = int(os.getenv('PORT', '5000'))
 
+        # Production server settings (gunicorn -c python:banditgui.config.gunicorn)
+        self.threads = int(os.getenv('THREADS', '16'))
+        self.worker_timeout = int(os.getenv('WORKER_TIMEOUT', '60'))
+        self.graceful_timeout = int(os.getenv('GRACEFUL_TIMEOUT', '30'))
+
+        # Response compression settings (JSON, HTML and CSV bodies of at least this many bytes)
+        self.compression_min_size = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))
+        self.compression_level = int(os.getenv('COMPRESSION_LEVEL', '6'))
+
+        # Logging settings (records are written by a background thread; see config/logging.py)
+        self.log_format = os.getenv('LOG_FORMAT', 'text').lower()
+        self.log_queue_size = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+        self.log_sampling = os.getenv('LOG_SAMPLING', '')
+
+        # Request tracing settings (slow and failed requests are always kept)
+        default_trace_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'traces', 'traces.jsonl')
+        self.trace_exporter = os.getenv('TRACE_EXPORTER', 'file').lower()
+        self.trace_file = os.getenv('TRACE_FILE', default_trace_file)
+        self.trace_file_max_bytes = int(os.getenv('TRACE_FILE_MAX_BYTES', str(10 * 1024 * 1024)))
+        self.trace_sample_rate = float(os.getenv('TRACE_SAMPLE_RATE', '0.1'))
+        self.trace_slow_ms = float(os.getenv('TRACE_SLOW_MS', '1000'))
+
+        # Profiling settings (profiles of requests chosen by an admin)
+        default_profile_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles')
+        self.profile_dir = os.getenv('PROFILE_DIR', default_profile_dir)
+        self.profile_max_files = int(os.getenv('PROFILE_MAX_FILES', '50'))
+
+        # Chat history settings
+        self.chat_max_messages = int(os.getenv('CHAT_MAX_MESSAGES', '1000'))
+        self.chat_max_messages_per_level = int(os.getenv('CHAT_MAX_MESSAGES_PER_LEVEL', '200'))
+
+        # Chat storage settings ('sqlite' keeps history across restarts, 'memory' does not)
+        default_chat_db = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'chat.db')
+        self.chat_backend = os.getenv('CHAT_BACKEND', 'sqlite').lower()
+        self.chat_db_path = os.getenv('CHAT_DB_PATH', default_chat_db)
+        self.chat_batch_size = int(os.getenv('CHAT_BATCH_SIZE', '50'))
+        self.chat_flush_interval = float(os.getenv('CHAT_FLUSH_INTERVAL', '1'))
+
+        # Command usage tracking settings
+        default_usage_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'usage')
+        self.usage_dir = os.getenv('USAGE_DIR', default_usage_dir)
+        self.usage_flush_interval = float(os.getenv('USAGE_FLUSH_INTERVAL', '30'))
+        self.usage_max_sessions = int(os.getenv('USAGE_MAX_SESSIONS', '1000'))
+
+        # Command log settings (commands kept per session and level, for Ask-a-Pro and export)
+        self.command_log_max_per_level = int(os.getenv('COMMAND_LOG_MAX_PER_LEVEL', '100'))
+
+        # Terminal plugins: comma-separated modules whose register(terminal_manager) adds local commands
+        self.terminal_plugins = [name.strip() for name in os.getenv('TERMINAL_PLUGINS', '').split(',')
+                                 if name.strip()]
+
+        # Command job settings (commands run on a worker pool, results polled by the browser)
+        self.job_workers = int(os.getenv('JOB_WORKERS', '8'))
+        self.job_max_per_session = int(os.getenv('JOB_MAX_PER_SESSION', '2'))
+        self.job_result_ttl = float(os.getenv('JOB_RESULT_TTL', '300'))
+        # Seconds a remote command may run before it is interrupted (0 means no limit)
+        self.command_timeout = float(os.getenv('COMMAND_TIMEOUT', '60'))
+
+        # Admin endpoints require this token in the X-Admin-Token header; without
+        # it they are disabled
+        self.admin_token = os.getenv('ADMIN_TOKEN', '')
+
     def get_ssh_config(self) -> Dict[str, Any]:
         """
         Get SSH configuration as a dictionary.
@@ -78,6 +140,30 @@ class Config:
         if not self.ssh_password:
             return "SSH_PASSWORD is not set"
 
+        if self.chat_backend not in ('memory', 'sqlite'):
+            return f"Invalid CHAT_BACKEND: {self.chat_backend}"
+
+        if self.trace_exporter not in ('file', 'console', 'none'):
+            return f"Invalid TRACE_EXPORTER: {self.trace_exporter}"
+
+        if not 0.0 <= self.trace_sample_rate <= 1.0:
+            return f"Invalid TRACE_SAMPLE_RATE: {self.trace_sample_rate}"
+
+        if self.threads < 1:
+            return f"Invalid THREADS: {self.threads}"
+
+        if self.usage_max_sessions < 1:
+            return f"Invalid USAGE_MAX_SESSIONS: {self.usage_max_sessions}"
+
+        if self.job_workers < 1:
+            return f"Invalid JOB_WORKERS: {self.job_workers}"
+
+        if self.job_max_per_session < 1:
+            return f"Invalid JOB_MAX_PER_SESSION: {self.job_max_per_session}"
+
+        if self.command_timeout < 0:
+            return f"Invalid COMMAND_TIMEOUT: {self.command_timeout}"
+
         return None
 
 
@@ -31,3 +31,8 @@ class ConfigError(BanditGUIError):
 class LevelInfoError(BanditGUIError):
     """Exception raised for level information errors."""
     pass
+
+
+class JobLimitError(BanditGUIError):
+    """Exception raised when a session already has as many running commands as it may."""
+    pass
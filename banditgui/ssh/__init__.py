@@ -2,6 +2,7 @@
 SSH-related functionality for BanditGUI.
 """
 
+from banditgui.ssh.ssh_command import SSHTarget, parse_ssh_command
 from banditgui.ssh.ssh_manager import SSHManager
 
-__all__ = ['SSHManager']
+__all__ = ['SSHManager', 'SSHTarget', 'parse_ssh_command']
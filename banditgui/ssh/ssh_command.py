@@ -0,0 +1,144 @@
+"""
+SSH command line parsing for BanditGUI.
+
+When a student types an ssh command in the terminal, the user, host, port and
+Bandit level it targets are read from it here, once per command line. Command
+lines are parsed the way ssh(1) reads its arguments: options may come before
+or after the destination, option values may be attached (``-p2220``) or
+separate, ``-l``, ``-o User=...``, ``-o Port=...`` and ``ssh://`` destinations
+are understood, and the first value given for a setting wins.
+"""
+
+import re
+import shlex
+from functools import lru_cache
+from typing import List, NamedTuple, Optional
+
+# The common forms, `ssh bandit3@host` with an optional `-p N` on either
+# side, parsed without tokenizing
+SIMPLE_SSH_COMMAND = re.compile(
+    r'ssh(?: +-p *([0-9]+))? +([\w.][\w.-]*)@([\w.-]+)(?: +-p *([0-9]+))? *', re.ASCII
+)
+
+# Bandit users are named after their level
+BANDIT_USER = re.compile(r'bandit([0-9]{1,3})', re.ASCII)
+
+# ssh(1) options that take a value
+OPTIONS_WITH_VALUE = frozenset('BbcDEeFIiJLlmOoPpQRSWw')
+
+
+class SSHTarget(NamedTuple):
+    """Where an ssh command connects; fields the command does not give are None."""
+
+    user: Optional[str]
+    host: Optional[str]
+    port: Optional[int]
+    level: Optional[int]
+
+
+def _port(value: str) -> Optional[int]:
+    """Convert a port argument, or return None if it is not a valid port."""
+    if not value.isdigit() or not value.isascii():
+        return None
+    port = int(value)
+    return port if 0 < port < 65536 else None
+
+
+def _target(user: Optional[str], host: Optional[str], port: Optional[int]) -> SSHTarget:
+    """Build a target, reading the level from a Bandit user name."""
+    match = BANDIT_USER.fullmatch(user) if user else None
+    return SSHTarget(user, host, port, int(match.group(1)) if match else None)
+
+
+def _split_destination(destination: str):
+    """Split ``[user@]host`` or ``ssh://[user@]host[:port]`` into user, host and port."""
+    port = None
+    if destination.startswith('ssh://'):
+        destination = destination[len('ssh://'):].rstrip('/')
+        head, sep, tail = destination.rpartition(':')
+        if sep and ']' not in tail:
+            destination, port = head, _port(tail)
+    user, sep, host = destination.rpartition('@')
+    host = host.strip('[]')
+    return (user if sep else None) or None, host or None, port
+
+
+def _parse_tokens(tokens: List[str]) -> Optional[SSHTarget]:
+    """Parse a tokenized ssh command line, or return None if it is not one."""
+    if not tokens or tokens[0] != 'ssh':
+        return None
+    user = host = port = None
+    index = 1
+    while index < len(tokens):
+        token = tokens[index]
+        index += 1
+        if token == '--' or not token.startswith('-') or token == '-':
+            if token == '--':
+                if index >= len(tokens):
+                    break
+                token = tokens[index]
+                index += 1
+            if host is not None:
+                # Everything after the destination is the remote command
+                break
+            dest_user, host, dest_port = _split_destination(token)
+            user = user or dest_user
+            port = port or dest_port
+            continue
+
+        # A cluster of flags, the last of which may take a value
+        for position in range(1, len(token)):
+            option = token[position]
+            if option not in OPTIONS_WITH_VALUE:
+                continue
+            value = token[position + 1:]
+            if not value:
+                if index >= len(tokens):
+                    break
+                value = tokens[index]
+                index += 1
+            if option == 'p':
+                port = port or _port(value)
+            elif option == 'l':
+                user = user or value or None
+            elif option == 'o':
+                key, _, setting = value.replace('=', ' ', 1).partition(' ')
+                key, setting = key.lower(), setting.strip()
+                if key == 'port':
+                    port = port or _port(setting)
+                elif key == 'user':
+                    user = user or setting or None
+            break
+    return _target(user, host, port)
+
+
+@lru_cache(maxsize=256)
+def parse_ssh_command(command: str) -> Optional[SSHTarget]:
+    """
+    Parse an ssh command line.
+
+    Results are cached, so the terminal and the /execute handler share one
+    parse of each command.
+
+    Args:
+        command: The command line
+
+    Returns:
+        Optional[SSHTarget]: The user, host, port and Bandit level the command
+        connects to, or None if the command line is not an ssh command
+    """
+    command = command.strip()
+    match = SIMPLE_SSH_COMMAND.fullmatch(command)
+    if match:
+        before, user, host, after = match.groups()
+        port = None
+        for value in (before, after):
+            if value is not None and port is None:
+                port = _port(value)
+        return _target(user, host, port)
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        # Unbalanced quotes; fall back to a plain split
+        tokens = command.split()
+    return _parse_tokens(tokens)
@@ -2,18 +2,69 @@
 SSH Manager for BanditGUI.
 
 This module provides functionality for connecting to and interacting with SSH servers.
+
+Each command runs on its own channel. While its output is read, the command
+can be interrupted: when its job is cancelled (Ctrl-C in the terminal) or it
+runs past COMMAND_TIMEOUT, the server is asked to send it SIGINT, and the
+channel is closed if it has not exited shortly after. Channels whose thread
+is stuck elsewhere are closed by reclaim_channels(), which a background
+thread runs while any command is running.
 """
 
 import socket
-from typing import Any, Dict, Union
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import paramiko
+from paramiko.common import cMSG_CHANNEL_REQUEST
 
 from banditgui.config.logging import get_logger
 from banditgui.config.settings import config
+from banditgui.utils.tracing import tracer
 
 logger = get_logger('ssh.ssh_manager')
 
+# Seconds between checks for a cancelled or overdue command while reading its output
+READ_POLL_INTERVAL = 0.2
+
+# Bytes read from a channel at a time
+READ_CHUNK = 32768
+
+# Seconds an interrupted command gets to exit before its channel is closed
+INTERRUPT_GRACE = 2.0
+
+# Seconds past its deadline, or past being cancelled, after which a command's
+# channel is closed from outside the thread running it
+RECLAIM_AFTER = 2 * INTERRUPT_GRACE
+
+# Seconds between checks for channels to reclaim while commands are running
+RECLAIM_INTERVAL = 1.0
+
+
+class RunningCommand:
+    """A command with an open channel."""
+
+    __slots__ = ('channel', 'command', 'started', 'cancel_event', 'reclaim_at')
+
+    def __init__(self, channel, command: str, cancel_event: Optional[threading.Event],
+                 deadline: Optional[float]):
+        """
+        Initialize a running command.
+
+        Args:
+            channel: The command's channel
+            command: The command line
+            cancel_event: Set when the command's job is cancelled
+            deadline: time.monotonic() by which the command must finish, if any
+        """
+        self.channel = channel
+        self.command = command
+        self.started = time.monotonic()
+        self.cancel_event = cancel_event
+        self.reclaim_at = deadline + RECLAIM_AFTER if deadline is not None else None
+
 
 class SSHManager:
     """
@@ -23,6 +74,12 @@ class SSHManager:
     def __init__(self):
         """Initialize the SSH manager."""
         self.client = None
+        self._running: Dict[int, RunningCommand] = {}
+        self._lock = threading.Lock()
+        # Reclaims channels while any command is running; exits when none are
+        self._reaper: Optional[threading.Thread] = None
+        # 'interrupted', 'timed_out' and 'reclaimed' commands (updated under the lock)
+        self.counters: Counter = Counter()
         logger.debug("SSHManager initialized")
 
     def connect(self) -> Union[bool, str]:
@@ -57,16 +114,23 @@ class SSHManager:
             logger.error(error_msg)
             return error_msg
 
-    def execute_command(self, command: str) -> str:
+    def execute_command(self, command: str, cancel_event: Optional[threading.Event] = None,
+                        timeout: Optional[float] = None) -> str:
         """
         Execute a command on the SSH server.
 
         Args:
             command: The command to execute
+            cancel_event: Interrupts the command when set
+            timeout: Seconds the command may run before it is interrupted
+                (defaults to COMMAND_TIMEOUT; 0 means no limit)
 
         Returns:
             str: The command output or error message
         """
+        if timeout is None:
+            timeout = config.command_timeout
+        self.reclaim_channels()
         try:
             # If not connected and this is an SSH command, try to connect first
             if not self.client and command.strip().lower().startswith('ssh'):
@@ -82,14 +146,40 @@ class SSHManager:
                 return error_msg
 
             logger.info(f"Executing SSH command: {command}")
-            stdin, stdout, stderr = self.client.exec_command(command)
-            output = stdout.read().decode()
-            error = stderr.read().decode()
+            # The steps of SSHClient.exec_command, each timed on its own
+            with tracer.span('ssh.open_channel'):
+                channel = self.client.get_transport().open_session()
+            running = RunningCommand(channel, command, cancel_event,
+                                     time.monotonic() + timeout if timeout else None)
+            with self._lock:
+                self._running[id(channel)] = running
+                if self._reaper is None:
+                    self._reaper = threading.Thread(target=self._reclaim_loop, name='ssh-reclaim', daemon=True)
+                    self._reaper.start()
+            try:
+                with tracer.span('ssh.exec'):
+                    channel.exec_command(command)
+                    # The terminal cannot send input, so commands reading stdin get EOF
+                    channel.shutdown_write()
+                with tracer.span('ssh.read') as span:
+                    stdout, stderr, stopped = self._read_output(channel, cancel_event, timeout)
+                    if span is not None:
+                        span.set_attribute('ssh.output_bytes', len(stdout) + len(stderr))
+                        if stopped:
+                            span.set_attribute('ssh.stopped', stopped)
+            finally:
+                with self._lock:
+                    self._running.pop(id(channel), None)
+                channel.close()
+            output = stdout.decode(errors='replace')
+            error = stderr.decode(errors='replace')
 
             if error:
                 logger.warning(f"Command produced error output: {error}")
 
             result = output if output else error
+            if stopped == 'timed_out':
+                result += f"\nCommand interrupted after running for {timeout:g} seconds."
             logger.debug(f"Command result: {result[:100]}...")
             return result
         except Exception as e:
@@ -97,6 +187,141 @@ class SSHManager:
             logger.error(error_msg)
             return error_msg
 
+    def _read_output(self, channel, cancel_event: Optional[threading.Event],
+                     timeout: float) -> Tuple[bytes, bytes, Optional[str]]:
+        """
+        Read a command's output until it exits, interrupting it if it is cancelled or overdue.
+
+        Args:
+            channel: The command's channel
+            cancel_event: Interrupts the command when set
+            timeout: Seconds the command may run (0 means no limit)
+
+        Returns:
+            Tuple[bytes, bytes, Optional[str]]: stdout, stderr, and 'cancelled'
+            or 'timed_out' if the command was interrupted
+        """
+        stdout: List[bytes] = []
+        stderr: List[bytes] = []
+        deadline = time.monotonic() + timeout if timeout else None
+        stopped = None
+        give_up_at = None
+        channel.settimeout(READ_POLL_INTERVAL)
+        while True:
+            while channel.recv_stderr_ready():
+                stderr.append(channel.recv_stderr(READ_CHUNK))
+            try:
+                data = channel.recv(READ_CHUNK)
+                if not data:
+                    break
+                stdout.append(data)
+            except socket.timeout:
+                pass
+
+            if stopped is None:
+                if cancel_event is not None and cancel_event.is_set():
+                    stopped = 'cancelled'
+                elif deadline is not None and time.monotonic() >= deadline:
+                    stopped = 'timed_out'
+                if stopped:
+                    with self._lock:
+                        self.counters['interrupted' if stopped == 'cancelled' else stopped] += 1
+                    logger.info(f"Interrupting command ({stopped.replace('_', ' ')})")
+                    self._send_signal(channel, 'INT')
+                    give_up_at = time.monotonic() + INTERRUPT_GRACE
+            elif time.monotonic() >= give_up_at:
+                logger.warning("Interrupted command did not exit; closing its channel")
+                break
+        while channel.recv_stderr_ready():
+            stderr.append(channel.recv_stderr(READ_CHUNK))
+        return b''.join(stdout), b''.join(stderr), stopped
+
+    def _send_signal(self, channel, name: str) -> None:
+        """
+        Ask the server to send a signal to a channel's command (RFC 4254, section 6.9).
+
+        paramiko has no call for this request, so it is built the way
+        Channel.send_exit_status builds its own. Servers that do not support
+        it ignore it, and the channel is closed after INTERRUPT_GRACE instead.
+        """
+        try:
+            message = paramiko.Message()
+            message.add_byte(cMSG_CHANNEL_REQUEST)
+            message.add_int(channel.remote_chanid)
+            message.add_string('signal')
+            message.add_boolean(False)
+            message.add_string(name)
+            channel.transport._send_user_message(message)
+        except Exception as e:
+            logger.warning(f"Could not send SIG{name} to command: {e}")
+
+    def reclaim_channels(self) -> int:
+        """
+        Close the channels of commands whose threads have not closed them in time.
+
+        A command's channel is reclaimed RECLAIM_AFTER seconds past its
+        deadline, or past being cancelled; closing it wakes a thread stuck
+        waiting on the server.
+
+        Returns:
+            int: Number of channels closed
+        """
+        now = time.monotonic()
+        overdue = []
+        with self._lock:
+            for running in self._running.values():
+                if running.cancel_event is not None and running.cancel_event.is_set():
+                    cancelled_by = now + RECLAIM_AFTER
+                    if running.reclaim_at is None or cancelled_by < running.reclaim_at:
+                        running.reclaim_at = cancelled_by
+                if running.reclaim_at is not None and now >= running.reclaim_at:
+                    overdue.append(running)
+            for running in overdue:
+                del self._running[id(running.channel)]
+            self.counters['reclaimed'] += len(overdue)
+        for running in overdue:
+            logger.warning(f"Reclaiming channel of abandoned command after {now - running.started:.0f}s")
+            try:
+                running.channel.close()
+            except Exception as e:
+                logger.error(f"Error closing abandoned channel: {e}")
+        return len(overdue)
+
+    def _reclaim_loop(self) -> None:
+        """Reclaim channels every RECLAIM_INTERVAL seconds until no command is running."""
+        while True:
+            time.sleep(RECLAIM_INTERVAL)
+            try:
+                self.reclaim_channels()
+            except Exception as e:
+                logger.error(f"Error reclaiming channels: {e}")
+            with self._lock:
+                if not self._running:
+                    self._reaper = None
+                    return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get counters for the commands run over SSH.
+
+        Returns:
+            Dict[str, Any]: 'open_channels' and the age of the oldest in
+            seconds, and counts of commands 'interrupted' (cancelled),
+            'timed_out' and 'reclaimed' (channels closed from outside their thread)
+        """
+        self.reclaim_channels()
+        now = time.monotonic()
+        with self._lock:
+            ages = [now - running.started for running in self._running.values()]
+            counters = dict(self.counters)
+        return {
+            'open_channels': len(ages),
+            'oldest_channel_seconds': round(max(ages), 1) if ages else 0,
+            'interrupted': counters.get('interrupted', 0),
+            'timed_out': counters.get('timed_out', 0),
+            'reclaimed': counters.get('reclaimed', 0),
+        }
+
     def close(self) -> None:
         """Close the SSH connection."""
         if self.client:
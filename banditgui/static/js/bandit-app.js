@@ -10,7 +10,9 @@ class BanditApp {
         this.isConnected = false;
         this.currentLevel = null;
         this.currentLevelDescription = null; // Added for Ask-a-Pro
+        this.hintTiers = {}; // Hint tiers already shown, by level
         this.serverStatus = 'unknown';
+        this.commandController = null; // Interrupts the command running in the terminal
 
         // Initialize components
         this.initChat();
@@ -154,7 +156,6 @@ class BanditApp {
                 const selectedLlm = this.llmDropdown.value;
                 const levelName = this.currentLevel;
                 const levelDescription = this.currentLevelDescription;
-                const commandHistory = this.history;
 
                 if (levelName === null || !levelDescription) {
                     this.addAssistantMessage("Please make sure you have started a level and its information is displayed before using Ask-a-Pro. Try using the 'level' or 'start' command in the chat.");
@@ -163,8 +164,8 @@ class BanditApp {
 
                 const escapeHTML = (str) => str == null ? '' : String(str).replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;").replace(/"/g, "&quot;").replace(/'/g, "&#039;");
                 const safeLevelDescription = escapeHTML(levelDescription);
-                const safeCommandHistoryString = commandHistory.length > 0 ? commandHistory.map(cmd => escapeHTML(cmd)).join(', ') : 'empty';
-                this.addUserMessage(`Asking the Pro about Level ${levelName}: '${safeLevelDescription}' (Command history: ${safeCommandHistoryString})`);
+                // The server adds the commands this session ran on the level
+                this.addUserMessage(`Asking the Pro about Level ${levelName}: '${safeLevelDescription}'`);
                 this.addMentorMessage(`Thinking like a Pro with ${selectedLlm.split('/')[1]}...`);
 
 
@@ -178,7 +179,6 @@ class BanditApp {
                             llm: selectedLlm,
                             level_name: levelName,
                             level_description: levelDescription,
-                            command_history: commandHistory,
                         }),
                     });
 
@@ -424,7 +424,10 @@ Type <code>level</code> in this chat to see the current level instructions.
     }
 
     /**
-     * Show hints for the current level
+     * Show the next hint for the current level
+     *
+     * Each call reveals one more tier of the level's hints, from a general
+     * nudge to a near-complete walkthrough.
      */
     async showLevelHints() {
         if (!this.currentLevel && this.currentLevel !== 0) {
@@ -432,43 +435,27 @@ Type <code>level</code> in this chat to see the current level instructions.
             return;
         }
 
+        const level = parseInt(this.currentLevel || 0);
+        const tier = (this.hintTiers[level] || 0) + 1;
+
         try {
-            // Get the level information from the server
-            const response = await fetch('/level-info', {
+            const response = await fetch('/chat/hint', {
                 method: 'POST',
                 headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({ level: this.currentLevel || 0 })
+                body: JSON.stringify({ level: level, tier: tier })
             });
 
             const data = await response.json();
 
             if (data.status === 'success') {
-                const levelInfo = data.levelInfo;
+                this.hintTiers[level] = data.tier;
 
-                // Create a hint message based on the level
                 let hintMessage = `<div class="level-hint">
-<h4>Hints for Level ${levelInfo.level}</h4>
-`;
-
-                // Add level-specific hints
-                switch(parseInt(levelInfo.level)) {
-                    case 0:
-                        hintMessage += `<p>For this level, you just need to log in. Use the SSH command shown and the password 'bandit0'.</p>
-<p>Once logged in, you can use <code>ls</code> to list files and <code>cat</code> to read file contents.</p>`;
-                        break;
-                    case 1:
-                        hintMessage += `<p>The password is stored in a file called 'readme' in the home directory.</p>
-<p>Use <code>ls</code> to see the file and <code>cat readme</code> to read its contents.</p>`;
-                        break;
-                    case 2:
-                        hintMessage += `<p>The password is stored in a file called '-' which is a special character in Linux.</p>
-<p>To read files with special characters in their names, you can use <code>cat ./-</code> or <code>cat < -</code>.</p>`;
-                        break;
-                    default:
-                        hintMessage += `<p>For this level, carefully read the goal and think about which commands might help.</p>
-<p>Remember to use <code>man [command]</code> to read the manual for any command you're not familiar with.</p>`;
+<h4>Hint ${data.tier} of ${data.totalTiers} for Level ${level}</h4>
+<p>${marked.parseInline(data.hint)}</p>`;
+                if (data.tier < data.totalTiers) {
+                    hintMessage += `<p class="hint-prompt">Type <code>hint</code> again for a more specific hint.</p>`;
                 }
-
                 hintMessage += `</div>`;
 
                 this.addAssistantMessage(hintMessage);
@@ -588,7 +575,9 @@ Type <code>level</code> in this chat to see the current level instructions.
         const ev = e.domEvent;
         const printable = !ev.altKey && !ev.ctrlKey && !ev.metaKey;
 
-        if (ev.keyCode === 13) { // Enter key
+        if (ev.ctrlKey && ev.keyCode === 67) { // Ctrl-C
+            this.handleInterrupt();
+        } else if (ev.keyCode === 13) { // Enter key
             this.handleTerminalEnter();
         } else if (ev.keyCode === 8) { // Backspace
             if (this.currentCommand.length > 0) {
@@ -624,6 +613,21 @@ Type <code>level</code> in this chat to see the current level instructions.
         this.writePrompt();
     }
 
+    /**
+     * Handle Ctrl-C: interrupt the running command, or discard the line being typed
+     */
+    handleInterrupt() {
+        this.term.write('^C');
+        if (this.commandController) {
+            // runCommand cancels the job and reports the command cancelled
+            this.commandController.abort();
+            return;
+        }
+        this.currentCommand = '';
+        this.term.write('\r\n');
+        this.writePrompt();
+    }
+
     /**
      * Navigate command history
      */
@@ -645,17 +649,25 @@ Type <code>level</code> in this chat to see the current level instructions.
         this.term.write(this.prompt + newCommand);
     }
 
+    /**
+     * Run a command on the server and wait for its result.
+     * Ctrl+C interrupts it from the moment it is sent.
+     */
+    async runCommand(payload) {
+        this.commandController = new AbortController();
+        try {
+            return await runCommand(payload, this.commandController.signal);
+        } finally {
+            this.commandController = null;
+        }
+    }
+
     /**
      * Execute a command on the server
      */
     async executeCommand(command) {
         try {
-            const response = await fetch('/execute', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({ command })
-            });
-            const data = await response.json();
+            const data = await this.runCommand({ command, level: this.currentLevel });
 
             if (data.status === 'success') {
                 if (data.output) {
@@ -668,6 +680,8 @@ Type <code>level</code> in this chat to see the current level instructions.
                     // Notify the user about the level change
                     this.term.write(`\r\n\x1b[33mYou are now on level ${this.currentLevel}\x1b[0m\r\n`);
                 }
+            } else if (data.status === 'cancelled') {
+                this.writeLine(`\r\n\x1b[33m${data.message}\x1b[0m\r\n`);
             } else if (data.status === 'error') {
                 this.writeLine(`\r\n\x1b[31m${data.message}\x1b[0m\r\n`);
             }
@@ -1,3 +1,5 @@
+// Needs command-runner.js loaded before it for runCommand
+
 class BanditTerminal {
     constructor() {
         this.history = [];
@@ -26,6 +28,10 @@ class BanditTerminal {
         }
     }
 
+    runCommand(payload) {
+        return runCommand(payload);
+    }
+
     async executeCommand(command) {
         if (!command) return;
         this.history.push(command);
@@ -43,12 +49,7 @@ class BanditTerminal {
         }
 
         try {
-            const response = await fetch('/execute', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({ command })
-            });
-            const data = await response.json();
+            const data = await this.runCommand({ command });
 
             // Display the command that was entered
             this.displayOutput('$', command);
@@ -64,7 +65,7 @@ class BanditTerminal {
                 if (data.output) {
                     this.displayOutput('', data.output);
                 }
-            } else if (data.status === 'error') {
+            } else if (data.status === 'error' || data.status === 'cancelled') {
                 this.displayOutput('Error:', data.message, 'error-message');
             }
 
@@ -0,0 +1,74 @@
+/**
+ * Command Runner for BanditGUI
+ *
+ * Runs terminal commands through the /execute job API. Commands run in the
+ * background on the server; their jobs are polled with short requests and a
+ * growing delay between them, so a slow command never ties up a server
+ * request thread for its whole runtime.
+ */
+
+// How long the first request waits for a quick command to finish, in seconds
+const COMMAND_FIRST_WAIT = 1;
+
+// Delay between polls of a running job, in milliseconds
+const COMMAND_POLL_INITIAL = 250;
+const COMMAND_POLL_MAX = 2000;
+const COMMAND_POLL_BACKOFF = 1.5;
+
+// Result of a command the user interrupted, whatever it printed
+const COMMAND_CANCELLED = { status: 'cancelled', message: 'Command cancelled' };
+
+/**
+ * Wait for a delay, or until the signal is aborted.
+ */
+function pauseCommandPoll(delay, signal) {
+    return new Promise((resolve) => {
+        const timer = setTimeout(resolve, delay);
+        if (signal) {
+            signal.addEventListener('abort', () => {
+                clearTimeout(timer);
+                resolve();
+            }, { once: true });
+        }
+    });
+}
+
+/**
+ * Run a command on the server and wait for its result.
+ *
+ * Aborting the signal interrupts the command, even before the server has
+ * answered with its job: the job is cancelled as soon as its ID arrives, and
+ * a command that finished in the meantime has its output dropped.
+ *
+ * @param {Object} payload - The /execute request body (command, level, ...)
+ * @param {AbortSignal} [signal] - Aborted when the user interrupts the command
+ * @returns {Promise<Object>} The command's result
+ */
+async function runCommand(payload, signal) {
+    const interrupted = () => Boolean(signal && signal.aborted);
+
+    let response = await fetch('/execute', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({ ...payload, wait: COMMAND_FIRST_WAIT })
+    });
+    let data = await response.json();
+
+    let delay = COMMAND_POLL_INITIAL;
+    while (data.status === 'pending') {
+        if (!interrupted()) {
+            await pauseCommandPoll(delay, signal);
+            delay = Math.min(delay * COMMAND_POLL_BACKOFF, COMMAND_POLL_MAX);
+        }
+        // The server interrupts a cancelled command; the DELETE answers with its result
+        response = interrupted()
+            ? await fetch(`/execute/${data.jobId}`, { method: 'DELETE' })
+            : await fetch(`/execute/${data.jobId}?wait=0`);
+        data = await response.json();
+    }
+
+    if (interrupted() && data.status !== 'cancelled') {
+        return COMMAND_CANCELLED;
+    }
+    return data;
+}
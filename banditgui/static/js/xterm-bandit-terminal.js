@@ -1,3 +1,5 @@
+// Needs command-runner.js loaded before it for runCommand
+
 class XtermBanditTerminal {
     constructor() {
         this.history = [];
@@ -5,6 +7,7 @@ class XtermBanditTerminal {
         this.currentCommand = '';
         this.prompt = '$ ';
         this.isConnected = false;
+        this.commandController = null;
         this.init();
     }
 
@@ -69,7 +72,9 @@ class XtermBanditTerminal {
         const ev = e.domEvent;
         const printable = !ev.altKey && !ev.ctrlKey && !ev.metaKey;
 
-        if (ev.keyCode === 13) { // Enter key
+        if (ev.ctrlKey && ev.keyCode === 67) { // Ctrl-C
+            this.handleInterrupt();
+        } else if (ev.keyCode === 13) { // Enter key
             this.handleEnter();
         } else if (ev.keyCode === 8) { // Backspace
             if (this.currentCommand.length > 0) {
@@ -100,6 +105,18 @@ class XtermBanditTerminal {
         this.writePrompt();
     }
 
+    handleInterrupt() {
+        this.term.write('^C');
+        if (this.commandController) {
+            // runCommand cancels the job and reports the command cancelled
+            this.commandController.abort();
+            return;
+        }
+        this.currentCommand = '';
+        this.term.write('\r\n');
+        this.writePrompt();
+    }
+
     navigateHistory(direction) {
         if (direction === 'up' && this.historyIndex > 0) {
             this.historyIndex--;
@@ -118,6 +135,16 @@ class XtermBanditTerminal {
         this.term.write(this.prompt + newCommand);
     }
 
+    async runCommand(payload) {
+        // Ctrl+C interrupts the command from the moment it is sent
+        this.commandController = new AbortController();
+        try {
+            return await runCommand(payload, this.commandController.signal);
+        } finally {
+            this.commandController = null;
+        }
+    }
+
     async executeCommand(command) {
         // Handle connect command specially
         if (command === 'connect') {
@@ -141,12 +168,7 @@ class XtermBanditTerminal {
         }
 
         try {
-            const response = await fetch('/execute', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({ command })
-            });
-            const data = await response.json();
+            const data = await this.runCommand({ command });
 
             if (data.status === 'clear') {
                 this.clearTerminal();
@@ -154,6 +176,8 @@ class XtermBanditTerminal {
                 if (data.output) {
                     this.writeLine(data.output);
                 }
+            } else if (data.status === 'cancelled') {
+                this.writeLine(`\r\n\x1b[33m${data.message}\x1b[0m\r\n`);
             } else if (data.status === 'error') {
                 this.writeLine(`\r\n\x1b[31m${data.message}\x1b[0m\r\n`);
             }
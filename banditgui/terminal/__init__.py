@@ -2,6 +2,8 @@
 Terminal-related functionality for BanditGUI.
 """
 
+from banditgui.terminal.command_log import CommandLog
+from banditgui.terminal.command_usage import CommandUsageTracker, parse_command_tools
 from banditgui.terminal.terminal_manager import TerminalManager
 
-__all__ = ['TerminalManager']
+__all__ = ['CommandLog', 'CommandUsageTracker', 'TerminalManager', 'parse_command_tools']
@@ -0,0 +1,174 @@
+"""
+Command log for BanditGUI.
+
+This module keeps the commands each session ran in the terminal, grouped by
+level, so Ask-a-Pro can look them up by session and instructors can export
+them.
+"""
+
+import csv
+import io
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional
+
+from banditgui.config.logging import get_logger
+
+logger = get_logger('terminal.command_log')
+
+
+class CommandEntry:
+    """A command run by a session."""
+
+    __slots__ = ('command', 'level', 'created_at')
+
+    def __init__(self, command: str, level: Optional[int], created_at: float):
+        """
+        Initialize a command entry.
+
+        Args:
+            command: The command line
+            level: The level the session was on, if known
+            created_at: Seconds since the epoch when the command ran
+        """
+        self.command = command
+        self.level = level
+        self.created_at = created_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the entry for export.
+
+        Returns:
+            Dict[str, Any]: 'command', 'level' and 'timestamp' (epoch seconds)
+        """
+        return {'command': self.command, 'level': self.level, 'timestamp': self.created_at}
+
+
+class CommandLog:
+    """
+    Bounded per-session, per-level command history.
+
+    Each level of a session keeps its last ``max_commands_per_level`` commands.
+    The least recently active session is dropped once more than
+    ``max_sessions`` are held.
+    """
+
+    def __init__(self, max_commands_per_level: int = 100, max_sessions: int = 1000):
+        """
+        Initialize the command log.
+
+        Args:
+            max_commands_per_level: Number of commands kept per session and level
+            max_sessions: Number of sessions kept
+        """
+        self.max_commands_per_level = max_commands_per_level
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, Dict[Optional[int], Deque[CommandEntry]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        logger.debug("CommandLog initialized")
+
+    def record(self, session_id: Optional[str], command: str, level: Optional[int] = None) -> None:
+        """
+        Record a command run by a session.
+
+        Args:
+            session_id: The session that ran the command
+            command: The command line
+            level: The level the session was on, if known
+        """
+        if not session_id or not command:
+            return
+        entry = CommandEntry(command, level, time.time())
+        with self._lock:
+            levels = self._sessions.get(session_id)
+            if levels is None:
+                levels = self._sessions[session_id] = {}
+                if len(self._sessions) > self.max_sessions:
+                    evicted, _ = self._sessions.popitem(last=False)
+                    logger.debug(f"Dropped command log of session {evicted}")
+            else:
+                self._sessions.move_to_end(session_id)
+            history = levels.get(level)
+            if history is None:
+                history = levels[level] = deque(maxlen=self.max_commands_per_level)
+            history.append(entry)
+
+    def get_entries(self, session_id: str, level: Optional[int] = None) -> List[CommandEntry]:
+        """
+        Get a session's command entries, oldest first.
+
+        Args:
+            session_id: The session
+            level: Only return commands run on this level (if None, all levels)
+
+        Returns:
+            List[CommandEntry]: The entries
+        """
+        with self._lock:
+            levels = self._sessions.get(session_id)
+            if not levels:
+                return []
+            if level is not None:
+                return list(levels.get(level, ()))
+            entries = [entry for history in levels.values() for entry in history]
+        entries.sort(key=lambda entry: entry.created_at)
+        return entries
+
+    def get_commands(self, session_id: str, level: Optional[int] = None, count: int = 0) -> List[str]:
+        """
+        Get the command lines a session ran, oldest first.
+
+        Args:
+            session_id: The session
+            level: Only return commands run on this level (if None, all levels)
+            count: Only return the last ``count`` commands (0 for all)
+
+        Returns:
+            List[str]: The command lines
+        """
+        entries = self.get_entries(session_id, level)
+        if count > 0:
+            entries = entries[-count:]
+        return [entry.command for entry in entries]
+
+    def export(self, session_id: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Export the log for instructors.
+
+        Args:
+            session_id: Only export this session (if None, all sessions)
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Serialized entries keyed by session ID
+        """
+        with self._lock:
+            session_ids = [session_id] if session_id else list(self._sessions)
+        return {
+            sid: [entry.to_dict() for entry in self.get_entries(sid)]
+            for sid in session_ids
+        }
+
+    def export_csv(self, session_id: Optional[str] = None) -> str:
+        """
+        Export the log as CSV with one row per command.
+
+        Args:
+            session_id: Only export this session (if None, all sessions)
+
+        Returns:
+            str: CSV text with session, level, timestamp and command columns
+        """
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(['session', 'level', 'timestamp', 'command'])
+        for sid, entries in self.export(session_id).items():
+            for entry in entries:
+                writer.writerow([
+                    sid,
+                    '' if entry['level'] is None else entry['level'],
+                    time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['timestamp'])),
+                    entry['command']
+                ])
+        return output.getvalue()
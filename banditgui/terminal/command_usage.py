@@ -0,0 +1,310 @@
+"""
+Command usage tracking for BanditGUI.
+
+This module counts which tools each session has run in the terminal, so the
+command catalog's 'used' flags can be shown per user.
+"""
+
+import itertools
+import json
+import os
+import shlex
+import threading
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from banditgui.config.logging import get_logger
+from banditgui.utils.fileio import atomic_write
+
+logger = get_logger('terminal.command_usage')
+
+# Commands that run the command given as their argument, with their options
+# that take a separate value (e.g. `sudo -u root ls`)
+WRAPPER_OPTIONS_WITH_VALUE: Dict[str, frozenset] = {
+    'sudo': frozenset({'-u', '--user', '-g', '--group', '-C', '--close-from', '-D', '--chdir',
+                       '-h', '--host', '-p', '--prompt', '-r', '--role', '-t', '--type',
+                       '-T', '--command-timeout', '-U', '--other-user'}),
+    'env': frozenset({'-u', '--unset', '-C', '--chdir', '-S', '--split-string'}),
+    'exec': frozenset({'-a'}),
+    'nice': frozenset({'-n', '--adjustment'}),
+    'nohup': frozenset(),
+    'time': frozenset({'-f', '--format', '-o', '--output'}),
+    'xargs': frozenset({'-a', '--arg-file', '-d', '--delimiter', '-E', '-I', '-L', '--max-lines',
+                        '-n', '--max-args', '-P', '--max-procs', '-s', '--max-chars'}),
+}
+WRAPPER_COMMANDS = frozenset(WRAPPER_OPTIONS_WITH_VALUE)
+
+
+def parse_command_tools(command: str) -> List[str]:
+    """
+    Split a shell command line into the tools it runs.
+
+    Pipelines and command lists (``|``, ``&&``, ``||``, ``;``, ``&``) are split
+    into their stages, leading ``VAR=value`` assignments and redirections are
+    skipped, and wrappers such as ``sudo`` count along with the command they
+    run, with the wrapper's own options and their values skipped.
+
+    Args:
+        command: The command line
+
+    Returns:
+        List[str]: Tool names in the order they appear
+    """
+    try:
+        lexer = shlex.shlex(command, posix=True, punctuation_chars=True)
+        lexer.whitespace_split = True
+        tokens = list(lexer)
+    except ValueError:
+        # Unbalanced quotes; fall back to a plain split
+        tokens = command.split()
+
+    tools = []
+    expect_tool = True
+    skip_next = False
+    for token in tokens:
+        if skip_next:
+            skip_next = False
+            continue
+        if token and set(token) <= set('<>'):
+            # Redirection operator; the next token is its target
+            skip_next = True
+            continue
+        if token and set(token) <= set('|&;()'):
+            expect_tool = True
+            continue
+        if not expect_tool:
+            continue
+        name, sep, _ = token.partition('=')
+        if sep and name.isidentifier():
+            continue
+        if token.startswith('-') and tools and tools[-1] in WRAPPER_COMMANDS:
+            # The wrapper's option; skip its value too if it takes one
+            skip_next = token in WRAPPER_OPTIONS_WITH_VALUE[tools[-1]]
+            continue
+
+        tool = os.path.basename(token)
+        if not tool:
+            continue
+        tools.append(tool)
+        expect_tool = tool in WRAPPER_COMMANDS
+
+    return tools
+
+
+class CommandUsageTracker:
+    """
+    Per-session command usage counters with batched flushes to disk.
+
+    Counts are kept in memory and written, one JSON file per session, by a
+    background thread every ``flush_interval`` seconds for the sessions that
+    changed since the last flush. At most ``max_sessions`` sessions are kept
+    in memory; the least recently used ones are dropped once their counts
+    are on disk, and read back from there when they record again.
+    """
+
+    def __init__(self, usage_dir: Path, flush_interval: Optional[float] = 30.0, max_sessions: int = 1000):
+        """
+        Initialize the usage tracker.
+
+        Args:
+            usage_dir: Directory to store per-session usage files in
+            flush_interval: Seconds between flushes, or None to only flush on demand
+            max_sessions: Number of sessions whose counts are kept in memory
+        """
+        self.usage_dir = Path(usage_dir)
+        self.flush_interval = flush_interval
+        self.max_sessions = max_sessions
+        # Sessions in memory, least recently used first
+        self._counts: "OrderedDict[str, Counter]" = OrderedDict()
+        # Versions come from one sequence, so a session read back from disk
+        # never repeats a version it had before it was dropped
+        self._version_sequence = itertools.count(1)
+        self._versions: Dict[str, int] = {}
+        # Version of every session not in memory; it changes whenever a
+        # session is dropped, as that session's file may have changed
+        self._disk_version = 0
+        self._dirty = set()
+        # Sessions whose counts a flush is writing out
+        self._writing = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        if flush_interval:
+            self._thread = threading.Thread(
+                target=self._flush_loop, name='command-usage-flush', daemon=True
+            )
+            self._thread.start()
+
+        logger.debug("CommandUsageTracker initialized")
+
+    def _session_file(self, session_id: str) -> Path:
+        return self.usage_dir / f"{session_id}.json"
+
+    def _load_counts(self, session_id: str) -> Counter:
+        """Read a session's counts from disk."""
+        counts = Counter()
+        path = self._session_file(session_id)
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    counts.update(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable usage file {path}: {e}")
+        return counts
+
+    def _session_counts(self, session_id: str) -> Counter:
+        """Get the counter for a session, loading it from disk if it is not in memory. Caller holds the lock."""
+        counts = self._counts.get(session_id)
+        if counts is None:
+            counts = self._load_counts(session_id)
+            self._counts[session_id] = counts
+            self._versions[session_id] = next(self._version_sequence)
+        else:
+            self._counts.move_to_end(session_id)
+        return counts
+
+    def _evict(self) -> None:
+        """Drop the least recently used sessions beyond max_sessions whose counts are on disk. Caller holds the lock."""
+        excess = len(self._counts) - self.max_sessions
+        if excess <= 0:
+            return
+        evicted = list(itertools.islice(
+            (session_id for session_id in self._counts
+             if session_id not in self._dirty and session_id not in self._writing), excess))
+        for session_id in evicted:
+            del self._counts[session_id]
+            del self._versions[session_id]
+        if evicted:
+            self._disk_version = next(self._version_sequence)
+
+    def record(self, session_id: Optional[str], command: str) -> None:
+        """
+        Record the tools run by a command for a session.
+
+        Args:
+            session_id: The session that ran the command
+            command: The command line
+        """
+        if not session_id or not command:
+            return
+        tools = parse_command_tools(command)
+        if not tools:
+            return
+        with self._lock:
+            self._session_counts(session_id).update(tools)
+            self._versions[session_id] = next(self._version_sequence)
+            self._dirty.add(session_id)
+            self._evict()
+
+    def get_counts(self, session_id: str) -> Dict[str, int]:
+        """
+        Get the tool counts for a session.
+
+        Args:
+            session_id: The session
+
+        Returns:
+            Dict[str, int]: Number of times each tool was run
+        """
+        with self._lock:
+            counts = self._counts.get(session_id)
+            if counts is not None:
+                return dict(counts)
+        return dict(self._load_counts(session_id))
+
+    def get_version(self, session_id: str) -> int:
+        """
+        Get a number that changes whenever the session's counts change.
+
+        Args:
+            session_id: The session
+
+        Returns:
+            int: The session's usage version
+        """
+        with self._lock:
+            return self._versions.get(session_id, self._disk_version)
+
+    def get_usage(self, session_id: str, catalog: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Merge a session's counts into the command catalog.
+
+        Args:
+            session_id: The session
+            catalog: Command catalog entries with 'name', 'url' and 'used'
+
+        Returns:
+            Tuple[int, List[Dict[str, Any]]]: The usage version and the catalog
+            entries with 'used' and 'count' filled in for this session
+        """
+        with self._lock:
+            counts = self._counts.get(session_id)
+            version = self._versions.get(session_id, self._disk_version)
+            if counts is not None:
+                counts = dict(counts)
+        if counts is None:
+            # Sessions that are not in memory are read without being cached
+            counts = self._load_counts(session_id)
+        lowered = {}
+        for tool, count in counts.items():
+            lowered[tool.lower()] = lowered.get(tool.lower(), 0) + count
+
+        usage = []
+        for entry in catalog:
+            count = lowered.get(entry['name'].lower(), 0)
+            usage.append(dict(entry, used=count > 0, count=count))
+        return version, usage
+
+    def flush(self) -> int:
+        """
+        Write the usage of sessions that changed since the last flush.
+
+        Returns:
+            int: Number of session files written
+        """
+        with self._lock:
+            pending = {session_id: dict(self._counts[session_id]) for session_id in self._dirty}
+            self._dirty.clear()
+            self._writing.update(pending)
+
+        if not pending:
+            return 0
+
+        written = set()
+        try:
+            os.makedirs(self.usage_dir, exist_ok=True)
+            for session_id, counts in pending.items():
+                try:
+                    atomic_write(self._session_file(session_id), [json.dumps(counts, indent=2)])
+                    written.add(session_id)
+                except OSError as e:
+                    logger.error(f"Error writing command usage for session {session_id}: {e}")
+        except OSError as e:
+            logger.error(f"Error creating usage directory {self.usage_dir}: {e}")
+        finally:
+            with self._lock:
+                # Sessions that were not written are flushed again next time
+                self._dirty.update(pending.keys() - written)
+                self._writing.difference_update(pending)
+                self._evict()
+
+        logger.debug(f"Flushed command usage for {len(written)} sessions")
+        return len(written)
+
+    def _flush_loop(self) -> None:
+        """Flush every flush_interval seconds until the tracker is closed."""
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing command usage: {e}")
+
+    def close(self) -> None:
+        """Stop the flush thread and write any pending usage."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
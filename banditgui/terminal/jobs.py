@@ -0,0 +1,242 @@
+"""
+Background command jobs for BanditGUI.
+
+A command sent to /execute runs as a job on a bounded worker pool, so a slow
+remote command holds a pool thread instead of the request thread that
+submitted it. Clients get the job's ID back and poll for the result. Each
+session may only have a few jobs unfinished at once, so one student's slow
+commands cannot take over the pool.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from banditgui.config.logging import get_logger, request_id_var
+from banditgui.exceptions import JobLimitError
+from banditgui.utils.tracing import tracer
+
+logger = get_logger('terminal.jobs')
+
+# Job states; the last three are final
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINAL_STATES = frozenset({DONE, FAILED, CANCELLED})
+
+
+class Job:
+    """A command waiting for, or running on, a pool thread."""
+
+    __slots__ = ('id', 'session_id', 'command', 'level', 'request_id', 'status', 'result',
+                 'created_at', 'finished_at', 'future', 'cancel_event', 'done_event')
+
+    def __init__(self, session_id: str, command: str, level: Optional[int] = None,
+                 request_id: Optional[str] = None):
+        """
+        Initialize a job.
+
+        Args:
+            session_id: The session that submitted the command
+            command: The command line
+            level: The level the session is on
+            request_id: ID of the request that submitted the job, for its logs and trace
+        """
+        self.id = uuid.uuid4().hex
+        self.session_id = session_id
+        self.command = command
+        self.level = level
+        self.request_id = request_id
+        self.status = QUEUED
+        self.result: Optional[Dict[str, Any]] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.future: Optional[Future] = None
+        # Set when the job is cancelled, for runners that can stop early
+        self.cancel_event = threading.Event()
+        self.done_event = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self.status in FINAL_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the job's state, without its result."""
+        return {
+            'jobId': self.id,
+            'status': self.status,
+            'command': self.command,
+            'createdAt': self.created_at,
+            'finishedAt': self.finished_at,
+        }
+
+
+class JobManager:
+    """Runs jobs on a worker pool and keeps their results for a while."""
+
+    def __init__(self, runner: Callable[[Job], Dict[str, Any]], max_workers: int = 8,
+                 max_per_session: int = 2, result_ttl: float = 300.0):
+        """
+        Initialize the job manager.
+
+        Args:
+            runner: Runs a job's command and returns its result
+            max_workers: Number of jobs run at once across all sessions
+            max_per_session: Number of unfinished jobs a session may have
+            result_ttl: Seconds a finished job's result is kept for polling
+        """
+        self.runner = runner
+        self.max_workers = max_workers
+        self.max_per_session = max_per_session
+        self.result_ttl = result_ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='command-job')
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        logger.debug(f"JobManager initialized with {max_workers} workers")
+
+    def submit(self, command: str, session_id: str, level: Optional[int] = None) -> Job:
+        """
+        Queue a command to run.
+
+        Args:
+            command: The command line
+            session_id: The session running the command
+            level: The level the session is on
+
+        Returns:
+            Job: The queued job
+
+        Raises:
+            JobLimitError: If the session already has max_per_session jobs unfinished
+        """
+        job = Job(session_id, command, level, request_id_var.get())
+        with self._lock:
+            self._expire()
+            # A cancelled job still holds its thread until the command returns
+            busy = sum(1 for other in self._jobs.values()
+                       if other.session_id == session_id and not other.future.done())
+            if busy >= self.max_per_session:
+                raise JobLimitError(
+                    f"You already have {busy} command(s) running; wait for one to finish or cancel it"
+                )
+            job.future = self._executor.submit(self._run, job)
+            self._jobs[job.id] = job
+        logger.debug(f"Queued job {job.id} for session {session_id}")
+        return job
+
+    def get(self, job_id: str, session_id: str) -> Optional[Job]:
+        """
+        Get one of a session's jobs.
+
+        Args:
+            job_id: The job's ID
+            session_id: The session asking, which must be the one that submitted the job
+
+        Returns:
+            Optional[Job]: The job, or None if there is no such job for the session
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job if job is not None and job.session_id == session_id else None
+
+    def wait(self, job: Job, timeout: float) -> bool:
+        """
+        Wait for a job to finish.
+
+        Args:
+            job: The job
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            bool: True if the job has finished
+        """
+        return job.done_event.wait(timeout)
+
+    def cancel(self, job_id: str, session_id: str) -> Optional[Job]:
+        """
+        Cancel one of a session's jobs.
+
+        A queued job never runs. A running job is marked cancelled and its
+        cancel_event is set; its result is discarded when the command returns.
+
+        Args:
+            job_id: The job's ID
+            session_id: The session asking, which must be the one that submitted the job
+
+        Returns:
+            Optional[Job]: The job, or None if there is no such job for the session
+        """
+        job = self.get(job_id, session_id)
+        if job is None:
+            return None
+        with self._lock:
+            if job.finished:
+                return job
+            job.cancel_event.set()
+            job.future.cancel()
+            self._finish(job, CANCELLED, {'status': 'cancelled', 'message': 'Command cancelled'})
+        logger.info(f"Cancelled job {job.id}")
+        return job
+
+    def _run(self, job: Job) -> None:
+        """Run a job on a pool thread."""
+        with self._lock:
+            if job.finished:
+                return
+            job.status = RUNNING
+
+        # The job gets its own trace, sharing the submitting request's ID
+        span, *tokens = tracer.start_trace('job execute', request_id=job.request_id,
+                                           attributes={'job.id': job.id})
+        error = None
+        try:
+            result, status = self.runner(job), DONE
+        except Exception as e:
+            logger.error(f"Error running job {job.id}: {e}", exc_info=True)
+            result, status, error = {'status': 'error', 'message': f"Error: {e}"}, FAILED, e
+        finally:
+            tracer.finish_trace(span, *tokens, error=error)
+
+        with self._lock:
+            if not job.finished:
+                self._finish(job, status, result)
+
+    def _finish(self, job: Job, status: str, result: Dict[str, Any]) -> None:
+        """Record a job's final state and wake its waiters (call with the lock held)."""
+        job.status = status
+        job.result = result
+        job.finished_at = time.time()
+        job.done_event.set()
+
+    def _expire(self) -> None:
+        """Forget jobs that finished more than result_ttl ago (call with the lock held)."""
+        cutoff = time.time() - self.result_ttl
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished and job.finished_at < cutoff and job.future.done()]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get job counts.
+
+        Returns:
+            Dict[str, int]: 'queued', 'running', 'abandoned' (cancelled jobs
+            whose command still holds a pool thread) and 'kept' (jobs whose
+            state can still be polled)
+        """
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+            abandoned = sum(1 for job in self._jobs.values()
+                            if job.status == CANCELLED and job.future.running())
+        return {'queued': statuses.count(QUEUED), 'running': statuses.count(RUNNING),
+                'abandoned': abandoned, 'kept': len(statuses)}
+
+    def close(self) -> None:
+        """Stop the worker pool, dropping queued jobs."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -2,102 +2,241 @@
 Terminal Manager for BanditGUI.
 
 This module provides functionality for handling terminal commands.
+
+Commands in the local command registry (help, level, clear, ...) are answered
+in this process, before anything is sent to the SSH server. More local
+commands can be added by plugins: modules named in TERMINAL_PLUGINS that
+define ``register(terminal_manager)`` and call register_command() from it.
 """
 
-from typing import List
+import importlib
+import re
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
 
 from banditgui.config.logging import get_logger
 from banditgui.config.settings import config
+from banditgui.ssh.ssh_command import parse_ssh_command
 from banditgui.utils import get_available_levels, get_general_info, get_level_info
+from banditgui.utils.tracing import tracer
 
 logger = get_logger('terminal.terminal_manager')
 
+# Words echo prints the same way a shell would: no variables, quoting, globs,
+# redirection or options
+PLAIN_WORD = re.compile(r'[\w.,:/@+=%][\w.,:/@+=%-]*')
+
+
+def no_args(args: List[str]) -> bool:
+    """Handle a command locally only when it has no arguments."""
+    return not args
+
+
+def plain_words(args: List[str]) -> bool:
+    """Handle a command locally only when its arguments need no shell to interpret them."""
+    return all(PLAIN_WORD.fullmatch(arg) for arg in args)
+
+
+class LocalCommand:
+    """A command answered by the terminal manager instead of the SSH server."""
+
+    __slots__ = ('name', 'handler', 'usage', 'summary', 'applies')
+
+    def __init__(self, name: str, handler: Callable[[List[str]], str], usage: str, summary: str,
+                 applies: Optional[Callable[[List[str]], bool]] = None):
+        """
+        Initialize a local command.
+
+        Args:
+            name: The program name that selects the command
+            handler: Called with the command's arguments, returns its output
+            usage: Usage line shown by help
+            summary: Description shown by help
+            applies: Called with the arguments; when it returns False the
+                command runs on the SSH server instead (default: always local)
+        """
+        self.name = name
+        self.handler = handler
+        self.usage = usage
+        self.summary = summary
+        self.applies = applies
+
 
 class TerminalManager:
     """
     Manager for terminal commands and interactions.
     """
 
-    def __init__(self, ssh_manager=None):
+    def __init__(self, ssh_manager=None, usage_tracker=None, command_log=None):
         """
         Initialize the terminal manager.
 
         Args:
             ssh_manager: The SSH manager to use for SSH commands
+            usage_tracker: Optional CommandUsageTracker to record executed commands in
+            command_log: Optional CommandLog to keep each session's commands in
         """
         self.ssh_manager = ssh_manager
+        self.usage_tracker = usage_tracker
+        self.command_log = command_log
         self.ssh_connected = False
-        self.available_levels = []
+        self._available_levels = None  # Loaded on first use
         self.current_level = None
 
-        # Initialize commands dictionary
-        self.commands = {
-            'help': self.help_command,
-            'info': self.info_command,
-            'clear': self.clear_command,
-            'echo': self.echo_command,
-            'level': self.level_command,
-            'general': self.general_command
-        }
-
-        # Load level information
-        self._load_level_info()
+        # Local commands by name, in the order help lists them. Names shared
+        # with programs on the server only run locally for the arguments
+        # where both would print the same thing.
+        self.commands: Dict[str, LocalCommand] = {}
+        self.register_command('help', self.help_command, summary='Display this help message', applies=no_args)
+        self.register_command('info', self.info_command, summary='Display information about the Bandit server',
+                              applies=no_args)
+        self.register_command('clear', self.clear_command, summary='Clear the terminal screen')
+        self.register_command('echo', self.echo_command, usage='echo [text]', summary='Print text',
+                              applies=plain_words)
+        self.register_command('level', self.level_command, usage='level [number]',
+                              summary='Display information about a specific level')
+        self.register_command('general', self.general_command,
+                              summary='Display general information about the Bandit wargame')
 
         logger.debug("TerminalManager initialized")
 
+    def register_command(self, name: str, handler: Callable[[List[str]], str], usage: Optional[str] = None,
+                         summary: str = '', applies: Optional[Callable[[List[str]], bool]] = None,
+                         replace: bool = False) -> None:
+        """
+        Add a command answered locally, without a round trip to the SSH server.
+
+        Handlers run on the command job's thread and must not block on the network.
+
+        Args:
+            name: The program name that selects the command
+            handler: Called with the command's arguments, returns its output
+            usage: Usage line shown by help (defaults to the name)
+            summary: Description shown by help
+            applies: Called with the arguments; when it returns False the
+                command runs on the SSH server instead (default: always local)
+            replace: Allow replacing a command that is already registered
+
+        Raises:
+            ValueError: If the name is invalid, reserved for ssh, or already registered
+        """
+        name = name.lower()
+        if not name or name != name.strip() or len(name.split()) != 1 or name == 'ssh':
+            raise ValueError(f"Invalid local command name: {name!r}")
+        if name in self.commands and not replace:
+            raise ValueError(f"Local command already registered: {name}")
+        self.commands[name] = LocalCommand(name, handler, usage or name, summary, applies)
+        logger.debug(f"Registered local command: {name}")
+
+    def load_plugins(self, modules: Iterable[str]) -> List[str]:
+        """
+        Import plugin modules and let each register its local commands.
+
+        A plugin that cannot be imported, has no register() function or fails
+        to register is logged and skipped.
+
+        Args:
+            modules: Module names, each defining ``register(terminal_manager)``
+
+        Returns:
+            List[str]: The modules that were loaded
+        """
+        loaded = []
+        for module_name in modules:
+            try:
+                module = importlib.import_module(module_name)
+                module.register(self)
+            except Exception as e:
+                logger.error(f"Error loading terminal plugin {module_name}: {e}")
+                continue
+            loaded.append(module_name)
+            logger.info(f"Loaded terminal plugin {module_name}")
+        return loaded
+
+    @property
+    def available_levels(self) -> List[int]:
+        """Level numbers, loaded from the level data on first use."""
+        if self._available_levels is None:
+            self._load_level_info()
+        return self._available_levels
+
+    def warmup(self) -> None:
+        """Load the level information now rather than on the first command that needs it."""
+        self._load_level_info()
+
     def _load_level_info(self) -> None:
         """Load level information."""
         try:
-            # Import here to avoid circular imports
-            self.available_levels = get_available_levels()
-            logger.info(f"Loaded {len(self.available_levels)} available levels")
+            self._available_levels = get_available_levels()
+            logger.info(f"Loaded {len(self._available_levels)} available levels")
         except Exception as e:
             logger.error(f"Error loading level information: {e}")
-            self.available_levels = [0, 1]
+            self._available_levels = [0, 1]
             logger.warning("Using default levels [0, 1]")
 
-    def execute_command(self, command: str) -> str:
+    def execute_command(self, command: str, session_id: Optional[str] = None, level: Optional[int] = None,
+                        cancel_event: Optional[threading.Event] = None) -> str:
         """
         Execute a terminal command.
 
         Args:
             command: The command to execute
+            session_id: The session running the command, for usage tracking and the command log
+            level: The level the session is on (defaults to the current SSH level)
+            cancel_event: Interrupts a remote command when set
 
         Returns:
             str: The command output
         """
         if not command:
             return ""
+        if level is None:
+            level = self.current_level
 
         logger.info(f"Executing command: {command}")
         cmd_parts = command.split()
-        cmd = cmd_parts[0].lower()
+        cmd = cmd_parts[0].lower() if cmd_parts else ''
+        # Only the program name is recorded; arguments may hold passwords
+        with tracer.span('terminal.execute_command', **{'command.name': cmd, 'bandit.level': level}):
+            return self._dispatch(command, cmd, session_id, level, cancel_event)
 
-        # Only handle clear command locally
-        if cmd == 'clear':
-            logger.debug("Executing clear command")
-            return "<clear>"
+    def _dispatch(self, command: str, cmd: str, session_id: Optional[str], level: Optional[int],
+                  cancel_event: Optional[threading.Event] = None) -> str:
+        """
+        Run a command locally or on the SSH server.
+
+        Args:
+            command: The command line
+            cmd: The lowercased program name
+            session_id: The session running the command
+            level: The level the session is on
+            cancel_event: Interrupts a remote command when set
+
+        Returns:
+            str: The command output
+        """
+        # Local commands answer without touching the network
+        local = self.commands.get(cmd)
+        if local is not None:
+            args = command.split()[1:]
+            if local.applies is None or local.applies(args):
+                self._record_command(session_id, command, level)
+                return local.handler(args)
 
         # Handle SSH command specially
         if cmd == 'ssh':
             logger.debug(f"Handling SSH command: {command}")
+            self._record_command(session_id, command, level)
             # Let the SSH command go through to the SSH manager
-            result = self.ssh_manager.execute_command(command)
+            result = self.ssh_manager.execute_command(command, cancel_event=cancel_event)
 
             # Check if the command was successful and update connection status
             if not self.ssh_connected and "Permission denied" not in result and "Error" not in result:
                 self.ssh_connected = True
-                # Try to extract level from command
-                try:
-                    if 'bandit' in command:
-                        level_part = command.split('bandit')[1].split('@')[0]
-                        self.current_level = int(level_part)
-                    else:
-                        self.current_level = 0
-                    logger.info(f"Connected to SSH server, level set to {self.current_level}")
-                except (ValueError, IndexError):
-                    self.current_level = 0
-                    logger.info("Connected to SSH server, level set to 0")
+                # Take the level from a Bandit user name, if the command has one
+                target = parse_ssh_command(command)
+                self.current_level = target.level if target is not None and target.level is not None else 0
+                logger.info(f"Connected to SSH server, level set to {self.current_level}")
 
             return result
 
@@ -105,11 +244,25 @@ class TerminalManager:
         if self.ssh_connected:
             # Execute the command on the SSH server
             logger.debug(f"Forwarding command to SSH: {command}")
-            return self.ssh_manager.execute_command(command)
+            self._record_command(session_id, command, level)
+            return self.ssh_manager.execute_command(command, cancel_event=cancel_event)
         else:
             # Not connected, show helpful message with a nerdy reference
             return "Not connected to the SSH server. As Yoda would say: 'Connect first, you must.'"
 
+    def _record_command(self, session_id: Optional[str], command: str, level: Optional[int]) -> None:
+        """Record an executed command with the usage tracker and command log, if there are any."""
+        if self.usage_tracker:
+            try:
+                self.usage_tracker.record(session_id, command)
+            except Exception as e:
+                logger.error(f"Error recording command usage: {e}")
+        if self.command_log:
+            try:
+                self.command_log.record(session_id, command, level)
+            except Exception as e:
+                logger.error(f"Error recording command in the command log: {e}")
+
     def help_command(self, args: List[str]) -> str:
         """
         Display help information.
@@ -121,17 +274,10 @@ class TerminalManager:
             str: Help information
         """
         logger.debug("Executing help command")
-        return """
-Available commands:
-  help                - Display this help message
-  info                - Display information about the Bandit server
-  clear               - Clear the terminal screen
-  level [number]      - Display information about a specific level
-  general             - Display general information about the Bandit wargame
-  ssh [options]       - Connect to SSH server
-
-All other commands will be executed directly on the SSH server.
-"""
+        lines = [f"  {local.usage:<20}- {local.summary}" for local in self.commands.values()]
+        lines.append(f"  {'ssh [options]':<20}- Connect to SSH server")
+        return "\nAvailable commands:\n" + "\n".join(lines) + \
+            "\n\nAll other commands will be executed directly on the SSH server.\n"
 
     def info_command(self, args: List[str]) -> str:
         """
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the OverTheWire Bandit website.
+
+This module serves the recorded pages in fixtures/bandit over HTTP under the
+same paths as the live site, so get_data.py can be exercised and benchmarked
+without network access. Run it as a script to re-record the fixtures (and the
+expected JSON output) from the live site.
+"""
+
+import argparse
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from banditgui.utils import get_data  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "bandit"
+EXPECTED_DIR = FIXTURES_DIR / "expected"
+SITE_PATH = "/wargames/bandit/"
+
+
+def load_pages(fixtures_dir: Path = FIXTURES_DIR) -> Dict[str, bytes]:
+    """
+    Load the recorded pages keyed by the URL path they are served under.
+
+    Args:
+        fixtures_dir: Directory containing index.html and banditN.html
+
+    Returns:
+        Dict[str, bytes]: Page bodies keyed by URL path
+    """
+    pages = {SITE_PATH: (fixtures_dir / "index.html").read_bytes()}
+    for path in fixtures_dir.glob("bandit*.html"):
+        pages[SITE_PATH + path.name] = path.read_bytes()
+    return pages
+
+
+class BanditSite:
+    """
+    Local HTTP server serving the recorded Bandit pages.
+
+    Use it as a context manager; ``base_url`` can be passed straight to
+    ``get_data.fetch_all_data``.
+    """
+
+    def __init__(self, fixtures_dir: Path = FIXTURES_DIR):
+        """
+        Initialize the stand-in site.
+
+        Args:
+            fixtures_dir: Directory containing the recorded pages
+        """
+        self.pages = load_pages(fixtures_dir)
+        self.server = None
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL equivalent to get_data.BASE_URL."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{SITE_PATH}"
+
+    def start(self) -> "BanditSite":
+        """Start serving on a free local port in a background thread."""
+        pages = self.pages
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = pages.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def __enter__(self) -> "BanditSite":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def record_fixtures(base_url: str = get_data.BASE_URL, fixtures_dir: Path = FIXTURES_DIR) -> int:
+    """
+    Download the Bandit pages and regenerate the expected output.
+
+    Args:
+        base_url: Site to record from
+        fixtures_dir: Directory to write the pages and expected/ output to
+
+    Returns:
+        int: Number of pages recorded
+    """
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    urls = {"index.html": base_url}
+    urls.update({f"bandit{level}.html": f"{base_url}bandit{level}.html" for level in get_data.LEVELS_RANGE})
+
+    recorded = 0
+    for name, url in urls.items():
+        html = get_data.fetch_page(url)
+        if html is None:
+            continue
+        (fixtures_dir / name).write_text(html, encoding="utf-8")
+        recorded += 1
+
+    # Re-baseline the expected output from the freshly recorded pages
+    expected_dir = fixtures_dir / "expected"
+    expected_dir.mkdir(exist_ok=True)
+    with BanditSite(fixtures_dir) as site:
+        get_data.save_data(get_data.fetch_all_data(site.base_url, delay=0), expected_dir)
+
+    return recorded
+
+
+def main() -> int:
+    """Serve the recorded pages, or re-record them with --record."""
+    parser = argparse.ArgumentParser(description="Offline stand-in for the Bandit website")
+    parser.add_argument("--record", action="store_true", help="re-record the fixtures from the live site")
+    args = parser.parse_args()
+
+    if args.record:
+        count = record_fixtures()
+        print(f"Recorded {count} pages to {FIXTURES_DIR}")
+        return 0
+
+    with BanditSite() as site:
+        print(f"Serving {len(site.pages)} recorded pages at {site.base_url} (Ctrl-C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from bandit_site import BanditSite
+
+# Keep the app's chat history, usage files and traces out of the real data
+# directory during tests; this runs before any test module imports
+# banditgui.app. test_tracing.py swaps in an exporter of its own.
+os.environ.setdefault('CHAT_BACKEND', 'memory')
+os.environ.setdefault('TRACE_EXPORTER', 'none')
+USAGE_DIR = tempfile.mkdtemp(prefix='banditgui-test-usage-')
+os.environ.setdefault('USAGE_DIR', USAGE_DIR)
+
+# Admin endpoints are disabled without a token
+os.environ.setdefault('ADMIN_TOKEN', 'test-admin-token')
+
+
+@pytest.fixture(scope="session", autouse=True)
+def remove_usage_dir():
+    """Delete the session's usage directory once the tests are done."""
+    yield
+    shutil.rmtree(USAGE_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def bandit_site():
+    """Local stand-in for overthewire.org serving the recorded Bandit pages."""
+    with BanditSite() as site:
+        yield site
+
+
+@pytest.fixture
+def admin_client():
+    """A test client that sends the admin token with every request."""
+    from banditgui import app as app_module
+    client = app_module.app.test_client()
+    client.environ_base['HTTP_X_ADMIN_TOKEN'] = app_module.config.admin_token
+    return client
@@ -0,0 +1,111 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from banditgui import app as app_module
+from banditgui.utils import assets
+from banditgui.utils.assets import AssetManifest, build_assets, minify_css
+
+
+@pytest.fixture
+def sources(tmp_path, mocker):
+    """A stylesheet that refers to a font, and a script, as asset sources."""
+    (tmp_path / 'css').mkdir()
+    (tmp_path / 'fonts').mkdir()
+    (tmp_path / 'fonts' / 'icons.woff2').write_bytes(b'font data')
+    (tmp_path / 'css' / 'site.css').write_text(
+        "/* header */\nbody {\n    color: red;\n}\n"
+        "@font-face { src: url('../fonts/icons.woff2?v=6') format('woff2'); }\n" * 20
+    )
+    (tmp_path / 'app.js').write_text("function hello() {\n    return 'hello';\n}\n" * 20)
+    mocker.patch.object(assets, 'ASSET_SOURCES', {
+        'site.css': tmp_path / 'css' / 'site.css',
+        'js/app.js': tmp_path / 'app.js',
+        'vendor/missing.js': tmp_path / 'missing.js',
+    })
+    return tmp_path
+
+
+def test_minify_css_strips_comments_and_whitespace():
+    assert minify_css("/* c */\na > b ,\n c {\n  color: red ;\n}\n") == "a>b,c{color: red;}"
+
+
+def test_minify_css_leaves_strings_alone(mocker):
+    mocker.patch.object(assets, 'rcssmin', None)
+    css = 'a::before {\n  content: "x /* y */  z" ; /* \'c\' */\n  background: url("a  b.png") ;\n}'
+    assert minify_css(css) == 'a::before{content: "x /* y */  z";background: url("a  b.png");}'
+
+
+def test_build_writes_hashed_compressed_assets(sources, tmp_path):
+    dist = tmp_path / 'dist'
+    manifest = build_assets(dist)
+
+    assert set(manifest['assets']) == {'site.css', 'js/app.js'}
+    css_file = manifest['assets']['site.css']['file']
+    assert css_file.startswith('site.') and css_file.endswith('.css')
+    assert json.loads((dist / 'manifest.json').read_text()) == manifest
+
+    css = (dist / css_file).read_text()
+    assert 'header' not in css
+    font_files = [name for name in os.listdir(dist) if name.startswith('icons.')]
+    assert len(font_files) == 1 and f"url({font_files[0]})" in css
+
+    gz = dist / f"{css_file}.gz"
+    assert gzip.decompress(gz.read_bytes()) == (dist / css_file).read_bytes()
+    assert not (dist / f"{font_files[0]}.gz").exists()
+
+
+def test_build_clean_removes_stale_files(sources, tmp_path):
+    dist = tmp_path / 'dist'
+    first = build_assets(dist)['assets']['js/app.js']['file']
+    (sources / 'app.js').write_text("function changed() {}\n")
+
+    second = build_assets(dist, clean=True)['assets']['js/app.js']['file']
+
+    assert second != first
+    assert not (dist / first).exists() and not (dist / f"{first}.gz").exists()
+    assert any(name.startswith('icons.') for name in os.listdir(dist))
+
+
+def test_manifest_ignores_assets_changed_since_build(sources, tmp_path):
+    dist = tmp_path / 'dist'
+    build_assets(dist)
+    manifest = AssetManifest(dist)
+    assert manifest.get_file('js/app.js').startswith('app.')
+    assert manifest.get_file('vendor/missing.js') is None
+
+    (sources / 'app.js').write_text("function changed() {}\n")
+    assert manifest.get_file('js/app.js') is None
+
+    build_assets(dist)
+    assert manifest.get_file('js/app.js').startswith('app.')
+
+
+def test_assets_route_serves_precompressed_files_with_long_cache(sources, tmp_path, mocker):
+    dist = tmp_path / 'dist'
+    build_assets(dist)
+    mocker.patch('banditgui.app.DIST_DIR', dist)
+    mocker.patch('banditgui.app.asset_manifest', AssetManifest(dist))
+    client = app_module.app.test_client()
+
+    with app_module.app.test_request_context():
+        url = app_module.asset_url('js/app.js')
+        assert url.startswith('/assets/app.')
+        assert app_module.asset_url('vendor/missing.js') is None
+        assert app_module.asset_url('xterm.css') == '/static/xterm.css'
+
+    response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Content-Type'].startswith('text/javascript')
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert response.cache_control.immutable and response.cache_control.max_age == app_module.ASSET_MAX_AGE
+    assert gzip.decompress(response.data) == (sources / 'app.js').read_bytes()
+
+    response = client.get(url)
+    assert 'Content-Encoding' not in response.headers
+    assert response.data == (sources / 'app.js').read_bytes()
+
+    assert client.get('/assets/../app.py').status_code == 404
@@ -0,0 +1,220 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from banditgui.chat.chat_manager import ChatManager
+from banditgui.chat.storage import (ChatMessage, ChatStore, MemoryChatStore, SQLiteChatStore, create_chat_store,
+                                    format_timestamp)
+
+
+def contents(messages):
+    return [msg['content'] if isinstance(msg, dict) else msg.content for msg in messages]
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def chat(request, tmp_path):
+    if request.param == 'memory':
+        store = MemoryChatStore()
+    else:
+        store = SQLiteChatStore(tmp_path / 'chat.db', batch_size=3, flush_interval=None)
+    manager = ChatManager(store=store)
+    yield manager
+    manager.close()
+
+
+def test_history_is_bounded_globally_and_per_level():
+    chat = ChatManager(max_messages=5, max_messages_per_level=3)
+    for i in range(8):
+        chat.add_message(f"m{i}", level=i % 2)
+
+    assert contents(chat.get_messages()) == ["m3", "m4", "m5", "m6", "m7"]
+    assert contents(chat.get_messages(level=0)) == ["m2", "m4", "m6"]
+    assert contents(chat.get_messages(level=1, count=2)) == ["m5", "m7"]
+
+
+def test_clearing_a_level_hides_it_from_the_global_history(chat):
+    chat.add_message("level 1 old", level=1)
+    chat.add_message("level 2", level=2)
+    chat.add_message("no level", level=None)
+    chat.clear_messages(level=1)
+    chat.add_message("level 1 new", level=1)
+
+    assert contents(chat.get_messages()) == ["level 2", "no level", "level 1 new"]
+    assert contents(chat.get_messages(level=1)) == ["level 1 new"]
+    assert contents(chat.get_messages(count=2)) == ["no level", "level 1 new"]
+
+
+def test_clear_all_messages(chat):
+    chat.add_message("hello", level=0)
+    chat.clear_messages()
+
+    assert chat.get_messages() == []
+    assert chat.get_messages(level=0) == []
+
+
+def test_sessions_are_partitioned(chat):
+    chat.add_message("alice", level=0, session_id="a")
+    chat.add_message("bob", level=0, session_id="b")
+    chat.clear_messages(session_id="b")
+
+    assert contents(chat.get_messages(session_id="a")) == ["alice"]
+    assert chat.get_messages(session_id="b") == []
+    assert chat.get_messages() == []
+
+
+def test_keyset_pagination_walks_back_through_history(chat):
+    for i in range(7):
+        chat.add_message(f"m{i}", level=i % 2)
+
+    page = chat.get_messages(count=3)
+    assert contents(page) == ["m4", "m5", "m6"]
+    page = chat.get_messages(count=3, before=page[0].id)
+    assert contents(page) == ["m1", "m2", "m3"]
+    page = chat.get_messages(count=3, before=page[0].id)
+    assert contents(page) == ["m0"]
+
+    level_page = chat.get_messages(level=0, count=2)
+    assert contents(level_page) == ["m4", "m6"]
+    assert contents(chat.get_messages(level=0, count=2, before=level_page[0].id)) == ["m0", "m2"]
+
+
+def test_message_ids_increase(chat):
+    for i in range(5):
+        chat.add_message(f"m{i}", level=0)
+    ids = [msg.id for msg in chat.get_messages()]
+    assert ids == sorted(ids) and len(set(ids)) == 5
+
+
+def test_sqlite_history_survives_restart(tmp_path):
+    db_path = tmp_path / 'chat.db'
+    chat = ChatManager(store=SQLiteChatStore(db_path, batch_size=100, flush_interval=None))
+    chat.add_message("before restart", level=3, session_id="s", is_system=True)
+    chat.close()
+
+    chat = ChatManager(store=SQLiteChatStore(db_path, flush_interval=None))
+    [msg] = chat.get_messages(level=3, session_id="s")
+    chat.close()
+    assert msg.content == "before restart"
+    assert msg.is_system is True
+    assert len(msg.to_dict()['timestamp']) == len("2024-01-01 00:00:00")
+
+
+def test_sqlite_inserts_in_batches_and_uses_wal(tmp_path):
+    db_path = tmp_path / 'chat.db'
+    store = SQLiteChatStore(db_path, batch_size=3, flush_interval=None)
+    reader = sqlite3.connect(str(db_path))
+    stored = lambda: reader.execute("SELECT COUNT(*) FROM chat_messages").fetchone()[0]  # noqa: E731
+
+    for i in range(2):
+        store.add("s", ChatMessage(f"m{i}", 0, False, 1.0 + i))
+    assert stored() == 0
+    store.add("s", ChatMessage("m2", 0, False, 3.0))
+    assert stored() == 3
+
+    assert reader.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    plan = reader.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM chat_messages WHERE session_id = ? AND level = ? "
+        "ORDER BY created_at DESC, id DESC", ("s", 0)
+    ).fetchall()
+    assert 'idx_chat_messages_session_level_time' in str(plan)
+    reader.close()
+    store.close()
+
+
+def test_messages_are_slotted_records_formatted_on_serialization():
+    message = ChatMessage("hi", level=2, is_system=False, created_at=1700000000.5)
+    assert not hasattr(message, '__dict__')
+    assert message.to_dict() == {
+        'id': None,
+        'content': "hi",
+        'level': 2,
+        'is_system': False,
+        'timestamp': format_timestamp(1700000000.5)
+    }
+    assert format_timestamp(1700000000.5) == format_timestamp(1700000000)
+
+
+def test_create_chat_store_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        create_chat_store('redis')
+
+
+def test_incomplete_chat_store_cannot_be_built():
+    class AddOnlyStore(ChatStore):
+        def add(self, session_id, message):
+            pass
+
+    with pytest.raises(TypeError):
+        AddOnlyStore()
+
+
+def test_sqlite_since_query_stays_within_the_session(tmp_path):
+    """Fetching new messages searches the session's own index, even from an old cursor."""
+    store = SQLiteChatStore(tmp_path / 'chat.db', flush_interval=None)
+    store.add("s", ChatMessage("m0", 0, False, 1.0))
+    statements = []
+    store._conn.set_trace_callback(statements.append)
+
+    for level in (None, 0):
+        store.get("s", level=level, since=0)
+        select = next(sql for sql in statements if sql.startswith("SELECT"))
+        plan = str(store._conn.execute(f"EXPLAIN QUERY PLAN {select}").fetchall())
+        index = 'idx_chat_messages_session_id' if level is None else 'idx_chat_messages_session_level_id'
+        assert f"{index} (session_id=?" in plan and "id>?" in plan
+        statements.clear()
+    store.close()
+
+
+def test_since_returns_only_newer_messages(chat):
+    for i in range(5):
+        chat.add_message(f"m{i}", level=i % 2)
+    cursor = chat.get_messages()[2].id
+
+    assert contents(chat.get_messages(since=cursor)) == ["m3", "m4"]
+    assert contents(chat.get_messages(since=cursor, count=1)) == ["m3"]
+    assert contents(chat.get_messages(level=0, since=cursor)) == ["m4"]
+    assert chat.get_messages(since=chat.get_messages()[-1].id) == []
+
+
+def test_wait_for_messages_wakes_on_new_message(chat):
+    chat.add_message("old", level=0)
+    since = chat.get_messages()[-1].id
+    timer = threading.Timer(0.05, chat.add_message, args=("new",), kwargs={'level': 0})
+    timer.start()
+
+    start = time.monotonic()
+    messages = chat.wait_for_messages(since, timeout=5)
+    timer.join()
+
+    assert contents(messages) == ["new"]
+    assert time.monotonic() - start < 1
+
+
+def test_wait_for_messages_times_out_empty(chat):
+    assert chat.wait_for_messages(0, timeout=0.05) == []
+
+
+def test_chat_messages_endpoint_cursors(mocker):
+    """/chat/messages is per session, pages back with before= and fetches new messages with since=."""
+    from banditgui.app import app as flask_app
+
+    mocker.patch('banditgui.app.chat_manager', ChatManager())
+    client = flask_app.test_client()
+    other = flask_app.test_client()
+    for i in range(4):
+        client.post('/chat/message', json={'message': f"m{i}", 'level': 0})
+
+    latest = client.get('/chat/messages?count=2').get_json()
+    assert contents(latest['messages']) == ["m2", "m3"]
+    older = client.get(f"/chat/messages?count=2&before={latest['nextBefore']}").get_json()
+    assert contents(older['messages']) == ["m0", "m1"]
+
+    client.post('/chat/message', json={'message': "m4", 'level': 0})
+    newer = client.get(f"/chat/messages?since={latest['lastId']}&wait=1").get_json()
+    assert contents(newer['messages']) == ["m4"]
+    empty = client.get(f"/chat/messages?since={newer['lastId']}").get_json()
+    assert empty['messages'] == [] and empty['lastId'] == newer['lastId']
+
+    assert other.get('/chat/messages').get_json()['messages'] == []
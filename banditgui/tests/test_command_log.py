@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+from banditgui.app import app as flask_app
+from banditgui.app import terminal_manager
+from banditgui.terminal.command_log import CommandLog
+
+
+def test_log_is_bounded_per_session_and_level():
+    log = CommandLog(max_commands_per_level=2, max_sessions=2)
+    for command in ("ls", "cat readme", "file ./-"):
+        log.record("a", command, level=1)
+    log.record("a", "ssh bandit0@localhost", level=0)
+
+    assert log.get_commands("a", level=1) == ["cat readme", "file ./-"]
+    assert log.get_commands("a") == ["cat readme", "file ./-", "ssh bandit0@localhost"]
+    assert log.get_commands("a", count=1) == ["ssh bandit0@localhost"]
+
+    log.record("b", "pwd")
+    log.record("c", "id")
+    assert log.get_commands("a") == []
+    assert list(log.export()) == ["b", "c"]
+
+
+def test_csv_export():
+    log = CommandLog()
+    log.record("a", 'echo "a, b"', level=3)
+    rows = log.export_csv().splitlines()
+    assert rows[0] == "session,level,timestamp,command"
+    assert rows[1].startswith("a,3,") and rows[1].endswith(',"echo ""a, b"""')
+
+
+def test_ask_a_pro_uses_the_session_command_log(mocker):
+    """Commands run through /execute reach the Ask-a-Pro prompt without the client sending them."""
+    log = CommandLog()
+    mocker.patch('banditgui.app.command_log', log)
+    mocker.patch.object(terminal_manager, 'command_log', log)
+    mocker.patch.object(terminal_manager, 'ssh_connected', True)
+    mocker.patch.object(terminal_manager, 'ssh_manager').execute_command.return_value = "readme"
+    mocker.patch('banditgui.app.os.getenv', return_value="dummy_key")
+    completion = mocker.patch('banditgui.app.completion')
+    completion.return_value.choices = [MagicMock()]
+    completion.return_value.choices[0].message.content = "advice"
+
+    client = flask_app.test_client()
+    client.post('/execute', json={'command': 'ls -la', 'level': 1, 'wait': 5})
+    client.post('/execute', json={'command': 'cat readme', 'level': 1, 'wait': 5})
+    client.post('/execute', json={'command': 'whoami', 'level': 2, 'wait': 5})
+    response = client.post('/ask-a-pro', json={
+        'llm': 'openai/gpt-4o', 'level_name': 1, 'level_description': 'Read the readme.'
+    })
+
+    assert response.status_code == 200
+    prompt = completion.call_args.kwargs['messages'][0]['content']
+    assert "- ls -la\n- cat readme" in prompt
+    assert "whoami" not in prompt
+
+    other = flask_app.test_client()
+    other.post('/ask-a-pro', json={'llm': 'openai/gpt-4o', 'level_name': 1, 'level_description': 'Read the readme.'})
+    assert "No commands executed yet." in completion.call_args.kwargs['messages'][0]['content']
+
+
+def test_command_log_export_requires_admin(mocker, admin_client):
+    log = CommandLog()
+    log.record("a" * 32, "ls", level=0)
+    mocker.patch('banditgui.app.command_log', log)
+    client = admin_client
+
+    exported = client.get('/admin/command-log').get_json()
+    assert exported['sessions']["a" * 32][0]['command'] == "ls"
+    csv_response = client.get('/admin/command-log?format=csv')
+    assert csv_response.mimetype == 'text/csv' and b",ls" in csv_response.data
+
+    anonymous = flask_app.test_client()
+    assert anonymous.get('/admin/command-log').status_code == 403
+    assert anonymous.get('/admin/command-log', headers={'X-Admin-Token': 'wrong'}).status_code == 403
+    # Werkzeug decodes non-ASCII header bytes as latin-1
+    assert anonymous.get('/admin/command-log', headers={'X-Admin-Token': 'sécret'}).status_code == 403
+    mocker.patch('banditgui.app.config.admin_token', 'sécret')
+    utf8_token = 'sécret'.encode('utf-8').decode('latin-1')
+    assert anonymous.get('/admin/command-log', headers={'X-Admin-Token': utf8_token}).status_code == 200
+
+    # Without a token configured, not even local requests are admin requests
+    mocker.patch('banditgui.app.config.admin_token', '')
+    assert client.get('/admin/command-log').status_code == 403
@@ -0,0 +1,117 @@
+import json
+
+import pytest
+
+from banditgui.app import app as flask_app
+from banditgui.app import terminal_manager
+from banditgui.terminal.command_usage import CommandUsageTracker, parse_command_tools
+
+
+@pytest.mark.parametrize("command, tools", [
+    ("ls -la", ["ls"]),
+    ("cat data.txt | sort | uniq -u", ["cat", "sort", "uniq"]),
+    ("find / -user bandit7 2>/dev/null && cat out", ["find", "cat"]),
+    ("LANG=C /usr/bin/grep -r pass . ; echo done", ["grep", "echo"]),
+    ("sudo -n xxd -r data.hex > data.bin", ["sudo", "xxd"]),
+    ("sudo -u root ls /root", ["sudo", "ls"]),
+    ("sudo -uroot -- cat x", ["sudo", "cat"]),
+    ("env -u HOME LANG=C sort data.txt", ["env", "sort"]),
+    ("nice -n 10 xargs -I {} cat {}", ["nice", "xargs", "cat"]),
+    ("echo 'a | b' | base64 -d", ["echo", "base64"]),
+    ("cat 'unterminated", ["cat"]),
+    ("", []),
+])
+def test_parse_command_tools(command, tools):
+    assert parse_command_tools(command) == tools
+
+
+def test_tracker_batches_flushes_and_reloads(tmp_path):
+    """Counts live in memory until flushed, and are reloaded from disk for a new tracker."""
+    tracker = CommandUsageTracker(tmp_path, flush_interval=None)
+    tracker.record("a" * 32, "cat readme | grep pass")
+    tracker.record("a" * 32, "cat readme")
+    tracker.record("b" * 32, "ls")
+
+    assert not list(tmp_path.iterdir())
+    assert tracker.flush() == 2
+    assert tracker.flush() == 0
+
+    reloaded = CommandUsageTracker(tmp_path, flush_interval=None)
+    assert reloaded.get_counts("a" * 32) == {"cat": 2, "grep": 1}
+    assert reloaded.get_counts("b" * 32) == {"ls": 1}
+
+
+def test_failed_flushes_are_retried(tmp_path):
+    """Sessions that could not be written stay pending for the next flush."""
+    usage_dir = tmp_path / "usage"
+    usage_dir.write_text("not a directory")
+    tracker = CommandUsageTracker(usage_dir, flush_interval=None)
+    tracker.record("a" * 32, "ls")
+
+    assert tracker.flush() == 0
+    usage_dir.unlink()
+    assert tracker.flush() == 1
+    assert json.loads((usage_dir / f"{'a' * 32}.json").read_text()) == {"ls": 1}
+
+
+def test_tracker_marks_catalog_entries_used(tmp_path):
+    tracker = CommandUsageTracker(tmp_path, flush_interval=None)
+    catalog = [{"name": "cat", "url": "", "used": False}, {"name": "ls", "url": "", "used": False}]
+    before = tracker.get_version("s" * 32)
+    tracker.record("s" * 32, "cat a | cat b")
+
+    version, usage = tracker.get_usage("s" * 32, catalog)
+    assert version != before
+    assert usage == [
+        {"name": "cat", "url": "", "used": True, "count": 2},
+        {"name": "ls", "url": "", "used": False, "count": 0},
+    ]
+    assert catalog[0]["used"] is False
+
+
+def test_tracker_keeps_only_recent_sessions_in_memory(tmp_path):
+    """Reading usage does not keep a session in memory, and flushed sessions beyond the limit are dropped."""
+    tracker = CommandUsageTracker(tmp_path, flush_interval=None, max_sessions=2)
+    assert tracker.get_version("x" * 32) == 0 and tracker.get_counts("x" * 32) == {}
+    assert not tracker._counts
+
+    for session_id in ("a" * 32, "b" * 32, "c" * 32):
+        tracker.record(session_id, "ls")
+    # Unflushed counts are never dropped
+    assert len(tracker._counts) == 3
+    versions = {session_id: tracker.get_version(session_id) for session_id in ("a" * 32, "b" * 32, "c" * 32)}
+
+    tracker.flush()
+    assert list(tracker._counts) == ["b" * 32, "c" * 32]
+    assert tracker.get_counts("a" * 32) == {"ls": 1}
+    # A dropped session's version changes, so cached responses for it are refetched
+    assert tracker.get_version("a" * 32) not in (0, versions["a" * 32])
+
+    tracker.record("a" * 32, "cat x")
+    tracker.flush()
+    assert tracker.get_counts("a" * 32) == {"ls": 1, "cat": 1}
+    assert list(tracker._counts) == ["c" * 32, "a" * 32]
+
+
+def test_commands_usage_endpoint_is_per_session_and_conditional(mocker, tmp_path):
+    """Usage recorded by /execute shows up for that session only, and unchanged usage returns 304."""
+    tracker = CommandUsageTracker(tmp_path, flush_interval=None)
+    mocker.patch('banditgui.app.usage_tracker', tracker)
+    mocker.patch.object(terminal_manager, 'usage_tracker', tracker)
+    mocker.patch.object(terminal_manager, 'ssh_connected', True)
+    mocker.patch.object(terminal_manager, 'ssh_manager').execute_command.return_value = "readme"
+    client = flask_app.test_client()
+    other = flask_app.test_client()
+
+    first = client.get('/commands/usage')
+    assert first.status_code == 200
+    assert not any(c['used'] for c in json.loads(first.data)['commands'])
+    assert client.get('/commands/usage', headers={'If-None-Match': first.headers['ETag']}).status_code == 304
+
+    client.post('/execute', json={'command': 'ls | cat', 'wait': 5})
+    second = client.get('/commands/usage', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    used = {c['name']: c['count'] for c in json.loads(second.data)['commands'] if c['used']}
+    assert used == {'cat': 1, 'ls': 1}
+
+    assert not any(c['used'] for c in json.loads(other.get('/commands/usage').data)['commands'])
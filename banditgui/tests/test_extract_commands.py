@@ -0,0 +1,34 @@
+import json
+
+from banditgui.utils import extract_commands
+from banditgui.utils.extract_commands import build_commands_catalog, get_commands_catalog
+
+
+def test_catalog_matches_commands_data_json():
+    """The in-memory catalog is the same as the one the script writes to disk."""
+    with open(extract_commands.INPUT_FILE, encoding='utf-8') as f:
+        levels_info = json.load(f)['levels_info']
+    with open(extract_commands.OUTPUT_FILE, encoding='utf-8') as f:
+        expected = f.read()
+
+    assert json.dumps(build_commands_catalog(levels_info), indent=2) == expected
+
+
+def test_catalog_filters_and_deduplicates():
+    """Only known commands are kept, once each, and a later link fills in a missing URL."""
+    levels_info = [
+        {"commands": "ls, cat\nnotacommand", "commands_links": []},
+        {"commands": "", "commands_links": [
+            {"text": "ls", "url": "https://example.com/ls"},
+            {"text": "Wikipedia", "url": "https://example.com/wiki"},
+        ]},
+    ]
+    assert build_commands_catalog(levels_info) == [
+        {'name': 'cat', 'url': '', 'used': False},
+        {'name': 'ls', 'url': 'https://example.com/ls', 'used': False},
+    ]
+
+
+def test_get_commands_catalog_is_cached_per_level_data():
+    """The catalog is only rebuilt when the loaded level data changes."""
+    assert get_commands_catalog() is get_commands_catalog()
@@ -0,0 +1,89 @@
+import json
+import os
+
+import pytest
+
+from banditgui.utils.get_data import fetch_all_data, fetch_page, parse_level_info, save_data
+from banditgui.utils.level_info import LevelInfo
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'bandit')
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_parse_level_info_matches_recorded_output():
+    """Parsing the saved pages reproduces the recorded levels_info.json byte for byte."""
+    levels = [parse_level_info(load_fixture(f'bandit{level}.html'), level) for level in range(35)]
+    assert json.dumps(levels, indent=2) == load_fixture(os.path.join('expected', 'levels_info.json'))
+
+
+@pytest.mark.parametrize("html", [
+    "<html><body><p>No content here</p></body></html>",
+    "",
+])
+def test_parse_level_info_without_content_div(html):
+    """Pages without a content div fall back to the placeholder record."""
+    info = parse_level_info(html, 7)
+    assert info['level'] == 7
+    assert info['goal'] == "Could not extract level information."
+    assert info['commands_links'] == [] and info['reading_links'] == []
+
+
+def test_parse_level_info_sections_stop_at_next_heading():
+    """Each section only collects siblings up to the next h2, whatever its id."""
+    html = """
+    <div id="content">
+      <h2 id="helpful-reading-material">Reading</h2>
+      <ul><li><a href="https://example.com/r">Read me</a></li></ul>
+      <h2 id="other">Other</h2>
+      <p><a href="https://example.com/x">ignored</a></p>
+      <h2 id="level-goal">Level Goal</h2>
+      <p>Find the <strong>password</strong>.</p>
+      <h2 id="commands-you-may-need-to-solve-this-level">Commands</h2>
+      <p><a href="https://example.com/ls">ls</a>, cat</p>
+    </div>
+    """
+    info = parse_level_info(html, 1)
+    assert info['goal'] == "Find thepassword."
+    assert info['commands'] == "ls, cat"
+    assert info['commands_links'] == [{"text": "ls", "url": "https://example.com/ls"}]
+    assert info['reading'] == "Read me"
+    assert info['reading_links'] == [{"text": "Read me", "url": "https://example.com/r"}]
+
+
+def test_fetch_and_save_against_offline_site(bandit_site, tmp_path, capsys):
+    """The full fetch -> parse -> save pipeline reproduces the recorded JSON files."""
+    data = fetch_all_data(bandit_site.base_url, delay=0)
+    save_data(data, tmp_path)
+
+    for name in ('general_info.json', 'levels_info.json', 'all_data.json'):
+        assert (tmp_path / name).read_text(encoding='utf-8') == load_fixture(os.path.join('expected', name))
+
+
+def test_fetch_page_missing_level_returns_none(bandit_site, capsys):
+    """A 404 from the site is reported and yields None rather than raising."""
+    assert fetch_page(f"{bandit_site.base_url}bandit99.html") is None
+    assert "Error fetching" in capsys.readouterr().out
+
+
+def test_save_data_is_picked_up_by_level_info_once(tmp_path, mocker, capsys):
+    """A running LevelInfo reloads exactly once after save_data replaces the files."""
+    info = LevelInfo()
+    for attr in ('GENERAL_INFO_FILE', 'LEVELS_INFO_FILE', 'ALL_DATA_FILE', 'DATA_VERSION_FILE'):
+        setattr(info, attr, tmp_path / getattr(LevelInfo, attr).name)
+    info._data_version = info._read_data_version()
+
+    level = {"level": 0, "goal": "old", "commands": "", "commands_links": [], "reading": "", "reading_links": []}
+    save_data({"general_info": {"general": "g"}, "levels_info": [level]}, tmp_path)
+    assert info.get_level_info(0)['goal'] == "old"
+
+    clear_cache = mocker.spy(info, 'clear_cache')
+    save_data({"general_info": {"general": "g"}, "levels_info": [dict(level, goal="new")]}, tmp_path)
+
+    assert info.get_level_info(0)['goal'] == "new"
+    assert info.get_available_levels() == [0]
+    assert clear_cache.call_count == 1
+    assert not list(tmp_path.glob('*.tmp'))
@@ -0,0 +1,67 @@
+import json
+
+from banditgui.utils.hints import HintEngine
+
+
+def write_hints(path, version, levels, default=("Read the goal.",)):
+    path.write_text(json.dumps({"version": version, "default": list(default), "levels": levels}), encoding='utf-8')
+
+
+def test_shipped_hints_cover_every_level_with_tiers():
+    engine = HintEngine()
+    assert engine.get_version() >= 1
+    for level in range(34):
+        assert len(engine.get_tiers(level)) >= 2, level
+
+
+def test_tiers_progress_and_clamp(tmp_path):
+    hints_file = tmp_path / 'hints.json'
+    write_hints(hints_file, 3, {"1": ["first", "second"]})
+    engine = HintEngine(hints_file)
+
+    assert engine.get_hint(1)['hint'] == "first"
+    assert engine.get_hint(1, tier=2) == {'level': 1, 'tier': 2, 'total_tiers': 2, 'hint': "second", 'version': 3}
+    assert engine.get_hint(1, tier=9)['tier'] == 2
+    assert engine.get_hint(1, tier=0)['tier'] == 1
+    assert engine.get_hints(1, up_to_tier=1) == ["first"]
+    assert engine.get_hint(99)['hint'] == "Read the goal."
+
+
+def test_hints_reload_when_file_is_replaced(tmp_path, mocker):
+    hints_file = tmp_path / 'hints.json'
+    write_hints(hints_file, 1, {"0": ["old"]})
+    engine = HintEngine(hints_file)
+    assert engine.get_hint(0)['hint'] == "old"
+
+    load = mocker.spy(json, 'load')
+    engine.get_hint(0)
+    assert load.call_count == 0
+
+    replacement = tmp_path / 'new.json'
+    write_hints(replacement, 2, {"0": ["new hint"]})
+    replacement.replace(hints_file)
+    assert engine.get_hint(0) == {'level': 0, 'tier': 1, 'total_tiers': 1, 'hint': "new hint", 'version': 2}
+
+
+def test_missing_hints_file_falls_back(tmp_path):
+    engine = HintEngine(tmp_path / 'missing.json')
+    hint = engine.get_hint(5)
+    assert hint['tier'] == 1 and hint['hint']
+
+
+def test_hint_endpoints_serve_tiers(mocker):
+    from banditgui.app import app as flask_app
+    from banditgui.chat.chat_manager import ChatManager
+
+    mocker.patch('banditgui.app.chat_manager', ChatManager())
+    client = flask_app.test_client()
+
+    first = client.post('/chat/hint', json={'level': 1}).get_json()
+    second = client.post('/chat/hint', json={'level': 1, 'tier': 2}).get_json()
+    assert first['tier'] == 1 and second['tier'] == 2
+    assert first['totalTiers'] == second['totalTiers'] >= 2
+    assert "readme" in second['hint']
+
+    all_hints = client.get('/hints/1').get_json()
+    assert all_hints['hints'][:2] == [first['hint'], second['hint']]
+    assert client.get('/hints/1?tier=1').get_json()['hints'] == [first['hint']]
@@ -0,0 +1,163 @@
+import threading
+
+import pytest
+
+from banditgui import app as app_module
+from banditgui.exceptions import JobLimitError
+from banditgui.terminal.jobs import CANCELLED, DONE, FAILED, JobManager
+
+
+class BlockingRunner:
+    """Runs jobs once released, recording which commands ran."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+        self.ran = []
+
+    def __call__(self, job):
+        self.started.release()
+        self.release.wait(5)
+        self.ran.append(job.command)
+        if job.command == 'fail':
+            raise RuntimeError('connection lost')
+        return {'status': 'success', 'output': job.command.upper()}
+
+
+@pytest.fixture
+def runner():
+    runner = BlockingRunner()
+    yield runner
+    runner.release.set()
+
+
+@pytest.fixture
+def jobs(runner):
+    manager = JobManager(runner, max_workers=2, max_per_session=2)
+    yield manager
+    manager.close()
+
+
+def test_job_runs_in_the_background(jobs, runner):
+    job = jobs.submit('ls', session_id='s1')
+    assert runner.started.acquire(timeout=5)
+    assert not jobs.wait(job, 0.01)
+
+    runner.release.set()
+    assert jobs.wait(job, 5)
+    assert job.status == DONE and job.result == {'status': 'success', 'output': 'LS'}
+    assert jobs.get(job.id, 's1') is job
+    assert jobs.get(job.id, 's2') is None
+
+
+def test_failed_job_reports_the_error(jobs, runner):
+    runner.release.set()
+    job = jobs.submit('fail', session_id='s1')
+    assert jobs.wait(job, 5)
+    assert job.status == FAILED
+    assert job.result == {'status': 'error', 'message': 'Error: connection lost'}
+
+
+def test_sessions_are_limited_to_their_own_share(jobs, runner):
+    jobs.submit('find /', session_id='s1')
+    jobs.submit('find /', session_id='s1')
+    with pytest.raises(JobLimitError):
+        jobs.submit('ls', session_id='s1')
+    # Another session is not held up by the first one's limit
+    other = jobs.submit('ls', session_id='s2')
+
+    runner.release.set()
+    assert jobs.wait(other, 5)
+    assert jobs.get_stats()['kept'] == 3
+
+
+def test_cancelled_jobs_never_run_or_discard_their_result(runner):
+    jobs = JobManager(runner, max_workers=1, max_per_session=2)
+    running = jobs.submit('sleep', session_id='s1')
+    queued = jobs.submit('ls', session_id='s1')
+    assert runner.started.acquire(timeout=5)
+
+    assert jobs.cancel(queued.id, 's1').status == CANCELLED
+    assert jobs.cancel(running.id, 's2') is None
+    jobs.cancel(running.id, 's1')
+    assert running.cancel_event.is_set() and jobs.wait(running, 0)
+    assert jobs.get_stats()['abandoned'] == 1
+
+    # The running command's thread stays busy until the command returns
+    later = jobs.submit('pwd', session_id='s1')
+    with pytest.raises(JobLimitError):
+        jobs.submit('ls', session_id='s1')
+    runner.release.set()
+    later.future.result(5)
+    jobs.close()
+
+    assert runner.ran == ['sleep', 'pwd']
+    assert running.status == CANCELLED and running.result['status'] == 'cancelled'
+
+
+def test_finished_jobs_expire(runner):
+    runner.release.set()
+    jobs = JobManager(runner, result_ttl=0)
+    job = jobs.submit('ls', session_id='s1')
+    job.future.result(5)
+
+    jobs.submit('ls', session_id='s1')
+    assert jobs.get(job.id, 's1') is None
+    jobs.close()
+
+
+class BlockingSSH:
+    """Runs SSH commands once released, signalling as each one starts."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+
+    def __call__(self, command, **kwargs):
+        self.started.release()
+        return self.release.wait(5) and f"ran {command}"
+
+
+@pytest.fixture
+def ssh(mocker):
+    """Connect the app's terminal to a mocked SSH manager that waits to be released."""
+    blocking = BlockingSSH()
+    ssh_manager = mocker.patch.object(app_module.terminal_manager, 'ssh_manager')
+    ssh_manager.execute_command.side_effect = blocking
+    mocker.patch.object(app_module.terminal_manager, 'ssh_connected', True)
+    yield blocking
+    blocking.release.set()
+
+
+def test_execute_returns_a_job_to_poll(ssh):
+    client = app_module.app.test_client()
+
+    response = client.post('/execute', json={'command': 'find / -size 33c'})
+    assert response.status_code == 202
+    job_id = response.get_json()['jobId']
+    assert client.get(f'/execute/{job_id}').get_json() == {'status': 'pending', 'jobId': job_id}
+
+    ssh.release.set()
+    result = client.get(f'/execute/{job_id}?wait=5').get_json()
+    assert result['status'] == 'success' and result['output'] == 'ran find / -size 33c'
+
+    # Jobs belong to the session that started them
+    assert app_module.app.test_client().get(f'/execute/{job_id}').status_code == 404
+
+
+def test_execute_jobs_can_be_cancelled_and_are_limited(ssh, admin_client):
+    client = admin_client
+    job_ids = [client.post('/execute', json={'command': 'nc -l 4444'}).get_json()['jobId']
+               for _ in range(app_module.config.job_max_per_session)]
+
+    response = client.post('/execute', json={'command': 'ls'})
+    assert response.status_code == 429
+
+    # Cancel a job that is running, not one still queued
+    assert ssh.started.acquire(timeout=5)
+    response = client.delete(f'/execute/{job_ids[0]}')
+    assert response.get_json()['status'] == 'cancelled'
+    assert client.delete('/execute/unknown').status_code == 404
+
+    stats = client.get('/admin/terminal').get_json()
+    assert stats['jobs']['abandoned'] >= 1 and 'open_channels' in stats['ssh']
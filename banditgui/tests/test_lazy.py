@@ -0,0 +1,57 @@
+import subprocess
+import sys
+import threading
+
+from banditgui.terminal.terminal_manager import TerminalManager
+from banditgui.utils import lazy
+from banditgui.utils.lazy import LazyProvider
+
+
+def test_provider_builds_once_on_first_use(mocker):
+    mocker.patch.object(lazy, '_warmup_hooks', [])
+    factory = mocker.Mock(side_effect=lambda: object())
+    provider = LazyProvider(factory, 'thing')
+    assert not provider.loaded and factory.call_count == 0
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(provider.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert factory.call_count == 1
+    assert all(result is results[0] for result in results)
+
+    provider.reset()
+    assert provider.get() is not results[0]
+
+
+def test_warmup_all_runs_hooks_and_survives_failures(mocker):
+    mocker.patch.object(lazy, '_warmup_hooks', [])
+    provider = LazyProvider(dict, 'mapping')
+    lazy.register_warmup('broken', mocker.Mock(side_effect=OSError("missing file")))
+
+    timings = lazy.warmup_all()
+
+    assert set(timings) == {'mapping', 'broken'}
+    assert provider.loaded
+
+
+def test_importing_modules_does_not_load_data():
+    code = (
+        "import banditgui.utils.quotes as quotes, banditgui.utils.level_info as level_info\n"
+        "assert not quotes.quote_manager_provider.loaded and not level_info.level_info_provider.loaded\n"
+        "assert quotes.quote_manager.quotes and quotes.quote_manager_provider.loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_terminal_manager_loads_levels_on_demand(mocker):
+    get_levels = mocker.patch('banditgui.terminal.terminal_manager.get_available_levels', return_value=[0, 1, 2])
+    manager = TerminalManager()
+    assert get_levels.call_count == 0
+
+    assert manager.available_levels == [0, 1, 2]
+    assert manager.available_levels == [0, 1, 2]
+    assert get_levels.call_count == 1
@@ -0,0 +1,144 @@
+import json
+import logging
+import queue
+import sys
+import threading
+
+import pytest
+
+from banditgui.config import logging as log_config
+from banditgui.config.logging import (
+    DroppingQueueHandler,
+    JsonFormatter,
+    SamplingFilter,
+    get_logger,
+    get_logging_stats,
+    parse_sampling,
+    setup_logging,
+    stop_logging,
+)
+
+
+def make_record(name='banditgui.test', level=logging.INFO, msg='hello %s', args=('world',), **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def pipeline():
+    """
+    Run a fresh logging pipeline for the test, then restore the app's.
+
+    Tests list this before capsys, so the restored pipeline writes to the
+    session's stdout rather than the test's, which is closed afterwards.
+    """
+    yield
+    # Stopped first so the pipeline is rebuilt even if the test left the same settings
+    stop_logging()
+    setup_logging('INFO')
+
+
+def test_json_formatter_includes_extra_fields_and_traceback():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = make_record(request_id='abc123')
+        record.exc_info = sys.exc_info()
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry['message'] == 'hello world'
+    assert entry['level'] == 'INFO' and entry['logger'] == 'banditgui.test'
+    assert entry['request_id'] == 'abc123'
+    assert 'ValueError: boom' in entry['exc']
+
+
+def test_queue_handler_drops_and_counts_when_full():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+    for level in (logging.INFO, logging.INFO, logging.INFO, logging.ERROR):
+        handler.handle(make_record(level=level))
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == {'INFO': 1, 'ERROR': 1}
+    queued = handler.queue.get_nowait()
+    assert queued.getMessage() == 'hello world' and queued.args is None
+
+
+def test_sampling_filter_only_samples_below_warning():
+    sampler = SamplingFilter(parse_sampling('ssh=0,app=1'))
+
+    assert not sampler.filter(make_record('banditgui.ssh.ssh_manager'))
+    assert sampler.filter(make_record('banditgui.ssh.ssh_manager', level=logging.WARNING))
+    assert sampler.filter(make_record('banditgui.app'))
+    assert sampler.filter(make_record('banditgui.chat'))
+    assert sampler.sampled_out == 1
+
+
+@pytest.mark.parametrize('spec', ['ssh', 'ssh=2', '=0.5', 'ssh=abc'])
+def test_parse_sampling_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        parse_sampling(spec)
+
+
+def test_setup_logging_writes_json_from_the_listener_thread(pipeline, capsys):
+    setup_logging('DEBUG', log_format='json', queue_size=100, sampling='noisy=0')
+    logger = get_logger('test.pipeline')
+
+    logger.info("command %s ran", 'ls', extra={'session': 's1'})
+    get_logger('noisy').debug("sampled out")
+    stop_logging()
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    entry = next(line for line in lines if line['logger'] == 'banditgui.test.pipeline')
+    assert entry['message'] == 'command ls ran' and entry['session'] == 's1'
+    assert entry['thread'] == 'MainThread'
+    assert not any(line['logger'] == 'banditgui.noisy' for line in lines)
+
+    stats = get_logging_stats()
+    assert stats['capacity'] == 100 and stats['sampled_out'] == 1
+    assert log_config._listener is None
+
+
+def test_setup_logging_does_not_stack_handlers(pipeline):
+    logger = logging.getLogger('banditgui')
+    setup_logging('INFO')
+    listener = log_config._listener
+    handlers = len(logger.handlers)
+    threads = threading.active_count()
+
+    for _ in range(5):
+        setup_logging('INFO')
+    assert log_config._listener is listener
+
+    setup_logging('DEBUG')
+    assert log_config._listener is listener and logger.level == logging.DEBUG
+
+    setup_logging('INFO', log_format='json')
+    setup_logging('INFO')
+    assert log_config._listener is not listener
+
+    assert len(logger.handlers) == handlers
+    assert [h.get_name() for h in logger.handlers].count(log_config.QUEUE_HANDLER_NAME) == 1
+    assert len(log_config._listener.handlers) == 1
+    assert threading.active_count() == threads
+
+
+def test_admin_logging_changes_levels_live(pipeline, admin_client):
+    client = admin_client
+    child = logging.getLogger('banditgui.ssh.ssh_manager')
+
+    response = client.put('/admin/logging', json={'level': 'debug', 'logger': 'ssh.ssh_manager'})
+    assert response.status_code == 200
+    assert response.get_json()['levels']['banditgui.ssh.ssh_manager'] == 'DEBUG'
+    assert child.isEnabledFor(logging.DEBUG)
+
+    assert client.put('/admin/logging', json={'level': 'LOUD'}).status_code == 400
+    assert client.put('/admin/logging', json={'level': None}).status_code == 400
+
+    response = client.put('/admin/logging', json={'level': None, 'logger': 'ssh.ssh_manager'})
+    assert 'banditgui.ssh.ssh_manager' not in response.get_json()['levels']
+    assert child.level == logging.NOTSET
+
+    response = client.get('/admin/logging')
+    assert response.get_json()['logging']['capacity'] > 0
@@ -0,0 +1,119 @@
+import pytest
+
+from banditgui import app as app_module
+from banditgui.utils.profiling import RequestProfiler
+
+
+def busy_work():
+    return sum(i * i for i in range(2000))
+
+
+def profile_once(profiler, **info):
+    profile, name = profiler.start()
+    busy_work()
+    assert profiler.stop(profile, name, dict({'method': 'GET', 'path': '/test'}, **info))
+    return name
+
+
+def test_profiles_are_saved_listed_and_reported(tmp_path):
+    profiler = RequestProfiler(str(tmp_path / 'profiles'))
+    assert profiler.list_profiles() == []
+
+    name = profile_once(profiler, status=200)
+
+    [info] = profiler.list_profiles()
+    assert info['name'] == name and info['status'] == 200 and info['size'] > 0
+    report = profiler.summary(name, sort='tottime')
+    assert 'busy_work' in report
+    with pytest.raises(ValueError):
+        profiler.summary(name, sort='bogus')
+    assert profiler.summary('../../etc/passwd') is None
+    assert profiler.path('20240101-000000-000000-beef') is None
+
+
+def test_profile_directory_is_bounded(tmp_path):
+    profiler = RequestProfiler(str(tmp_path), max_profiles=3)
+
+    names = [profile_once(profiler) for _ in range(5)]
+
+    assert [p['name'] for p in profiler.list_profiles()] == names[:1:-1]
+    assert len(list(tmp_path.iterdir())) == 6
+
+
+def test_only_one_request_is_profiled_at_a_time(tmp_path):
+    profiler = RequestProfiler(str(tmp_path))
+    profile, name = profiler.start()
+    assert profiler.start() is None
+    profiler.stop(profile, name, {})
+    profile, name = profiler.start()
+    profiler.stop(profile, name, {})
+
+
+def test_armed_profiling_counts_down_for_its_endpoint(tmp_path):
+    profiler = RequestProfiler(str(tmp_path))
+    profiler.arm(2, endpoint='execute')
+
+    assert profiler.start('ask_a_pro', requested=False) is None
+    for _ in range(2):
+        started = profiler.start('execute', requested=False)
+        assert started is not None
+        profiler.stop(*started, {})
+    assert profiler.start('execute', requested=False) is None
+    started = profiler.start('execute', requested=True)
+    assert started is not None
+    profiler.stop(*started, {})
+    with pytest.raises(ValueError):
+        profiler.arm(-1)
+
+
+def test_busy_profiler_keeps_the_armed_slot(tmp_path):
+    profiler = RequestProfiler(str(tmp_path))
+    busy = profiler.start()
+    profiler.arm(1)
+
+    assert profiler.start('execute', requested=False) is None
+    assert profiler.armed()['count'] == 1
+    profiler.stop(*busy, {})
+    started = profiler.start('execute', requested=False)
+    assert started is not None and profiler.armed()['count'] == 0
+    profiler.stop(*started, {})
+
+
+@pytest.fixture
+def profiler(tmp_path, mocker):
+    profiler = RequestProfiler(str(tmp_path))
+    mocker.patch.object(app_module, 'profiler', profiler)
+    return profiler
+
+
+def test_admin_can_profile_a_request_by_header(profiler, mocker, admin_client):
+    client = admin_client
+
+    response = client.get('/quotes/random', headers={'X-Profile': '1'})
+
+    name = response.headers['X-Profile-ID']
+    listing = client.get('/admin/profiles').get_json()
+    [info] = listing['profiles']
+    assert info['name'] == name and info['endpoint'] == 'random_quote'
+    assert info['request_id'] == response.headers['X-Request-ID']
+    assert 'function calls' in client.get(f'/admin/profiles/{name}').get_data(as_text=True)
+    raw = client.get(f'/admin/profiles/{name}?format=pstats')
+    assert raw.status_code == 200 and raw.get_data() == (profiler.directory / f'{name}.prof').read_bytes()
+    assert client.get('/admin/profiles/20240101-000000-000000-beef').status_code == 404
+
+    # Without the admin token the header is ignored
+    mocker.patch.object(app_module.config, 'admin_token', 'secret')
+    response = client.get('/quotes/random', headers={'X-Profile': '1'})
+    assert 'X-Profile-ID' not in response.headers
+
+
+def test_admin_can_arm_profiling(profiler, admin_client):
+    client = admin_client
+
+    response = client.post('/admin/profiles', json={'count': 1, 'endpoint': 'random_quote'})
+    assert response.get_json()['armed'] == {'count': 1, 'endpoint': 'random_quote'}
+
+    assert 'X-Profile-ID' in client.get('/quotes/random').headers
+    assert 'X-Profile-ID' not in client.get('/quotes/random').headers
+    assert client.post('/admin/profiles', json={'count': 'all'}).status_code == 400
+    assert client.post('/admin/profiles', json={'count': -1}).status_code == 400
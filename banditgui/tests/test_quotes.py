@@ -0,0 +1,53 @@
+import random
+from collections import Counter
+
+from banditgui.app import app as flask_app
+from banditgui.utils.quotes import QuoteManager
+
+
+def make_manager(quotes):
+    manager = QuoteManager()
+    manager.quotes = quotes
+    manager._build_indexes()
+    return manager
+
+
+QUOTES = [
+    {"text": "Live long and prosper.", "source": "Star Trek", "character": "Spock"},
+    {"text": "Make it so.", "source": "Star Trek: TNG", "character": "Picard"},
+    {"text": "The cake is a lie.", "source": "Portal", "character": "Game"},
+    {"text": "I am Groot.", "source": "Guardians of the Galaxy", "character": "Groot"},
+]
+
+
+def test_quotes_are_preformatted_and_indexed():
+    manager = make_manager(QUOTES)
+    assert manager.formatted[2] == '"The cake is a lie."'
+    assert [q["character"] for q in manager.get_quotes_by_source("star trek")] == ["Spock", "Picard"]
+    assert [q["text"] for q in manager.get_quotes_by_character("GROOT")] == ["I am Groot."]
+    assert manager.get_quotes_by_source("portal") == [QUOTES[2]]
+    assert manager.get_quotes_by_source("missing") == []
+
+
+def test_no_repeats_within_a_session_until_all_seen():
+    manager = make_manager(QUOTES)
+    shown = manager.get_welcome_quotes(3, session_id="a") + manager.get_welcome_quotes(1, session_id="a")
+    assert sorted(shown) == sorted(manager.formatted)
+
+    # Every quote has been seen, so the next sample starts a new cycle
+    assert len(manager.get_welcome_quotes(2, session_id="a")) == 2
+    assert len(manager.get_welcome_quotes(10)) == len(QUOTES)
+
+
+def test_sampling_follows_weights():
+    random.seed(1234)
+    manager = make_manager([dict(QUOTES[0], weight=9), dict(QUOTES[1], weight=1)])
+    picks = Counter(manager.get_welcome_quotes(1)[0] for _ in range(2000))
+    assert picks['"Live long and prosper."'] > 5 * picks['"Make it so."']
+
+
+def test_welcome_quotes_endpoint_is_cacheable():
+    response = flask_app.test_client().get('/quotes/welcome?count=2')
+    assert response.get_json()['status'] == 'success'
+    assert len(response.get_json()['quotes']) == 2
+    assert response.cache_control.private and response.cache_control.max_age > 0
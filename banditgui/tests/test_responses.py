@@ -0,0 +1,123 @@
+import datetime
+import decimal
+import gzip
+import json
+import math
+
+import pytest
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.datastructures import Accept
+from werkzeug.http import parse_accept_header
+
+from banditgui import app as app_module
+from banditgui.utils import responses
+from banditgui.utils.responses import FastJSONProvider, compress_response
+
+PAYLOAD = {
+    'status': 'success',
+    'levels': {3: 'three', 1: 'one'},
+    'when': datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.timezone.utc),
+    'price': decimal.Decimal('1.50'),
+    'nested': [{'b': 2, 'a': [1.5, None, True]}],
+}
+
+
+def accept(header):
+    return parse_accept_header(header, Accept)
+
+
+@pytest.fixture
+def flask_app():
+    return Flask(__name__)
+
+
+@pytest.mark.skipif(responses.orjson is None, reason="orjson is not installed")
+@pytest.mark.parametrize('debug', [False, True])
+def test_fast_provider_matches_default_provider(flask_app, debug):
+    flask_app.debug = debug
+    fast, default = FastJSONProvider(flask_app), DefaultJSONProvider(flask_app)
+
+    assert fast.dumps(PAYLOAD) == default.dumps(PAYLOAD, separators=(',', ':'))
+    with flask_app.app_context():
+        assert fast.response(PAYLOAD).get_data() == default.response(PAYLOAD).get_data()
+
+
+@pytest.mark.skipif(responses.orjson is None, reason="orjson is not installed")
+def test_orjson_and_fallback_paths_agree(flask_app, mocker):
+    provider = FastJSONProvider(flask_app)
+    payload = dict(PAYLOAD, greeting='héllo ✓', missing=float('nan'))
+
+    def encode():
+        with flask_app.app_context():
+            return provider.dumps(payload), provider.response(payload).get_data()
+
+    fast = encode()
+    mocker.patch.object(responses, 'orjson', None)
+    fallback = encode()
+
+    decoded = [json.loads(text) for text in fast + fallback]
+    # orjson writes non-finite floats as null, the standard library as NaN
+    missing = [value.pop('missing') for value in decoded]
+    assert missing[:2] == [None, None] and all(math.isnan(value) for value in missing[2:])
+    assert all(value == decoded[0] for value in decoded)
+
+
+def test_fast_provider_falls_back_for_values_orjson_rejects(flask_app):
+    provider = FastJSONProvider(flask_app)
+    assert provider.dumps({'big': 2 ** 70}) == '{"big": 1180591620717411303424}'
+    assert provider.dumps([1, 2], indent=1) == '[\n 1,\n 2\n]'
+
+
+def make_response(size, mimetype='application/json'):
+    return Response(b'x' * size, mimetype=mimetype)
+
+
+def test_compress_response_gzips_large_bodies():
+    response = make_response(4096)
+    response.set_etag('abc')
+
+    compress_response(response, accept('gzip, deflate'), min_size=1024)
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.get_data()) == b'x' * 4096
+    assert int(response.headers['Content-Length']) == len(response.get_data())
+    assert 'Accept-Encoding' in response.vary
+    assert response.get_etag() == ('abc', True)
+
+
+@pytest.mark.parametrize('response, header', [
+    (make_response(512), 'gzip'),
+    (make_response(4096), 'identity'),
+    (make_response(4096, mimetype='image/png'), 'gzip'),
+])
+def test_compress_response_leaves_other_responses_alone(response, header):
+    compress_response(response, accept(header), min_size=1024)
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_data() == b'x' * len(response.get_data())
+
+
+def test_compress_response_prefers_brotli_when_available(mocker):
+    brotli = mocker.patch.object(responses, 'brotli')
+    brotli.compress.return_value = b'br'
+    assert responses.choose_encoding(accept('gzip, br')) == 'br'
+
+    response = compress_response(make_response(4096), accept('gzip, br'))
+    assert response.headers['Content-Encoding'] == 'br' and response.get_data() == b'br'
+
+    mocker.patch.object(responses, 'brotli', None)
+    assert responses.choose_encoding(accept('gzip, br')) == 'gzip'
+
+
+def test_usage_etag_still_revalidates_when_compressed(mocker):
+    mocker.patch.object(app_module.config, 'compression_min_size', 0)
+    client = app_module.app.test_client()
+
+    first = client.get('/commands/usage', headers={'Accept-Encoding': 'gzip'})
+    assert first.headers['Content-Encoding'] == 'gzip'
+    assert first.headers['ETag'].startswith('W/')
+
+    second = client.get('/commands/usage', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': first.headers['ETag']
+    })
+    assert second.status_code == 304
@@ -0,0 +1,103 @@
+import random
+import shlex
+import string
+
+import pytest
+
+from banditgui import app as app_module
+from banditgui.ssh.ssh_command import SSHTarget, _parse_tokens, parse_ssh_command
+
+HOST = 'bandit.labs.overthewire.org'
+
+
+@pytest.mark.parametrize('command, expected', [
+    ('ssh bandit0@bandit.labs.overthewire.org', SSHTarget('bandit0', HOST, None, 0)),
+    ('ssh bandit3@bandit.labs.overthewire.org -p 2220', SSHTarget('bandit3', HOST, 2220, 3)),
+    ('ssh -p 2220 bandit3@bandit.labs.overthewire.org', SSHTarget('bandit3', HOST, 2220, 3)),
+    ('  ssh -p2220 bandit12@localhost  ', SSHTarget('bandit12', 'localhost', 2220, 12)),
+    ('ssh -i sshkey.private bandit14@localhost -p 2220', SSHTarget('bandit14', 'localhost', 2220, 14)),
+    ('ssh -l bandit5 -p 2220 localhost', SSHTarget('bandit5', 'localhost', 2220, 5)),
+    ('ssh -o Port=2220 -o User=bandit6 localhost', SSHTarget('bandit6', 'localhost', 2220, 6)),
+    ('ssh -vp2220 bandit7@localhost', SSHTarget('bandit7', 'localhost', 2220, 7)),
+    ('ssh ssh://bandit8@localhost:2220', SSHTarget('bandit8', 'localhost', 2220, 8)),
+    ('ssh bandit18@localhost -p 2220 cat readme', SSHTarget('bandit18', 'localhost', 2220, 18)),
+    ('ssh bandit18@localhost cat -p 1 readme', SSHTarget('bandit18', 'localhost', None, 18)),
+    ('ssh -p 2220 -p 22 bandit1@localhost', SSHTarget('bandit1', 'localhost', 2220, 1)),
+    ('ssh -l bandit2 bandit9@localhost', SSHTarget('bandit2', 'localhost', None, 2)),
+    ("ssh 'bandit4'@localhost", SSHTarget('bandit4', 'localhost', None, 4)),
+    ('ssh -p 99999 bandit1@localhost', SSHTarget('bandit1', 'localhost', None, 1)),
+    ('ssh localhost', SSHTarget(None, 'localhost', None, None)),
+    ('ssh root@localhost', SSHTarget('root', 'localhost', None, None)),
+    ('ssh banditx@localhost', SSHTarget('banditx', 'localhost', None, None)),
+    ('ssh', SSHTarget(None, None, None, None)),
+    ('ssh -p', SSHTarget(None, None, None, None)),
+    ('ssh "bandit1@localhost', SSHTarget('"bandit1', 'localhost', None, None)),
+])
+def test_ssh_commands_are_parsed(command, expected):
+    assert parse_ssh_command(command) == expected
+
+
+@pytest.mark.parametrize('command', ['', 'ls -la', 'sshpass -p x ssh bandit1@localhost', 'echo ssh bandit1@h'])
+def test_other_commands_are_not_ssh_commands(command):
+    assert parse_ssh_command(command) is None
+
+
+def random_word(rng, alphabet=string.ascii_lowercase + string.digits, size=8):
+    return rng.choice(string.ascii_lowercase) + ''.join(rng.choice(alphabet) for _ in range(rng.randrange(size)))
+
+
+def random_ssh_command(rng):
+    """Build a random ssh command line along with the target it connects to."""
+    level = rng.choice([None, rng.randrange(35)])
+    user = f"bandit{level}" if level is not None else rng.choice([None, random_word(rng)])
+    host = rng.choice([HOST, 'localhost', random_word(rng, string.ascii_lowercase + '.-')])
+    port = rng.choice([None, 22, 2220, rng.randrange(1, 65536)])
+
+    options = [rng.choice([['-v'], ['-4'], ['-i', 'sshkey.private'], ['-oStrictHostKeyChecking=no'], ['-q']])
+               for _ in range(rng.randrange(3))]
+    destination = f"{user}@{host}" if user and rng.random() < 0.8 else host
+    if user and destination == host:
+        options.append(rng.choice([['-l', user], [f"-l{user}"], ['-o', f"User={user}"]]))
+    if port is not None:
+        options.append(rng.choice([['-p', str(port)], [f"-p{port}"], ['-o', f"Port={port}"], ['-vp', str(port)]]))
+    rng.shuffle(options)
+
+    split = rng.randrange(len(options) + 1)
+    words = ['ssh'] + sum(options[:split], []) + [destination] + sum(options[split:], [])
+    if rng.random() < 0.3:
+        words += ['cat', '-p', '1', 'readme']
+    quote = shlex.quote if rng.random() < 0.5 else str
+    command = rng.choice([' ', '  ']).join(quote(word) for word in words)
+    return command, SSHTarget(user, host, port, level)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_ssh_commands_are_parsed(seed):
+    rng = random.Random(seed)
+    for _ in range(50):
+        command, expected = random_ssh_command(rng)
+        assert parse_ssh_command(command) == expected, command
+        # The regular expression fast path agrees with full tokenizing
+        assert _parse_tokens(shlex.split(command)) == expected, command
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_parsing_never_fails(seed):
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + ' -@:/"\'\\=[]'
+    for _ in range(200):
+        command = 'ssh ' + ''.join(rng.choice(alphabet) for _ in range(rng.randrange(30)))
+        target = parse_ssh_command(command)
+        assert target is not None
+        assert target.port is None or 0 < target.port < 65536
+
+
+def test_execute_takes_the_level_from_ssh_options(mocker):
+    mocker.patch.object(app_module.terminal_manager, 'ssh_manager').execute_command.return_value = ''
+    mocker.patch.object(app_module.terminal_manager, 'ssh_connected', True)
+    mocker.patch.object(app_module.terminal_manager, 'current_level', 0)
+
+    response = app_module.app.test_client().post(
+        '/execute', json={'command': 'ssh -p 2220 bandit3@localhost', 'wait': 5})
+
+    assert response.get_json()['currentLevel'] == 3
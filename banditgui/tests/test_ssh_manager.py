@@ -0,0 +1,167 @@
+import socket
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from banditgui.ssh import ssh_manager as ssh_module
+from banditgui.ssh.ssh_manager import SSHManager
+
+
+class FakeChannel:
+    """A channel whose command prints some chunks, then runs until it exits or is signalled."""
+
+    remote_chanid = 7
+
+    def __init__(self, chunks=(), stderr=b'', exits=True, obeys_signals=True, hangs_on_exec=False):
+        self.chunks = list(chunks)
+        self.stderr = stderr
+        self.exits = exits
+        self.obeys_signals = obeys_signals
+        self.hangs_on_exec = hangs_on_exec
+        self.timeout = None
+        self.signals = []
+        self.closed = threading.Event()
+        self.transport = MagicMock()
+        self.transport._send_user_message.side_effect = self._on_message
+
+    def _on_message(self, message):
+        # The request name and signal follow the channel ID and want-reply flag
+        message.rewind()
+        message.get_byte(), message.get_int()
+        assert message.get_text() == 'signal' and not message.get_boolean()
+        self.signals.append(message.get_text())
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def exec_command(self, command):
+        if self.hangs_on_exec and self.closed.wait(5):
+            raise EOFError('Channel closed.')
+
+    def shutdown_write(self):
+        pass
+
+    def recv_stderr_ready(self):
+        return bool(self.stderr)
+
+    def recv_stderr(self, size):
+        data, self.stderr = self.stderr, b''
+        return data
+
+    def recv(self, size):
+        if self.chunks:
+            return self.chunks.pop(0)
+        if self.exits or self.closed.is_set() or (self.signals and self.obeys_signals):
+            return b''
+        time.sleep(self.timeout)
+        raise socket.timeout()
+
+    def close(self):
+        self.closed.set()
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(mocker):
+    mocker.patch.object(ssh_module, 'READ_POLL_INTERVAL', 0.01)
+    mocker.patch.object(ssh_module, 'INTERRUPT_GRACE', 0.1)
+    mocker.patch.object(ssh_module, 'RECLAIM_AFTER', 0.2)
+    mocker.patch.object(ssh_module, 'RECLAIM_INTERVAL', 0.05)
+
+
+def connected(*channels):
+    manager = SSHManager()
+    manager.client = MagicMock()
+    manager.client.get_transport.return_value.open_session.side_effect = channels
+    return manager
+
+
+def test_command_output_is_read_until_the_command_exits():
+    channel = FakeChannel([b'read', b'me\n'])
+    manager = connected(channel)
+
+    assert manager.execute_command('ls', timeout=5) == 'readme\n'
+    assert channel.closed.is_set() and not channel.signals
+
+    channel = FakeChannel(stderr=b'cat: x: No such file or directory\n')
+    assert connected(channel).execute_command('cat x', timeout=5).startswith('cat: x')
+
+
+def test_overdue_command_is_interrupted():
+    channel = FakeChannel([b'listening\n'], exits=False)
+    manager = connected(channel)
+
+    result = manager.execute_command('nc -l 4444', timeout=0.05)
+
+    assert channel.signals == ['INT']
+    assert result == 'listening\n\nCommand interrupted after running for 0.05 seconds.'
+    assert manager.get_stats()['timed_out'] == 1
+
+
+def test_cancelled_command_is_interrupted():
+    channel = FakeChannel(exits=False)
+    manager = connected(channel)
+    cancel_event = threading.Event()
+    threading.Timer(0.05, cancel_event.set).start()
+
+    manager.execute_command('sleep 100', cancel_event=cancel_event, timeout=0)
+
+    assert channel.signals == ['INT'] and channel.closed.is_set()
+    assert manager.get_stats()['interrupted'] == 1
+
+
+def test_command_ignoring_the_interrupt_has_its_channel_closed():
+    channel = FakeChannel(exits=False, obeys_signals=False)
+    manager = connected(channel)
+
+    start = time.monotonic()
+    manager.execute_command('trap "" INT; sleep 100', timeout=0.05)
+
+    assert channel.signals == ['INT'] and channel.closed.is_set()
+    assert time.monotonic() - start < 2
+
+
+def test_stuck_channels_are_reclaimed(mocker):
+    # Reclaim by hand here, without the background thread
+    mocker.patch.object(ssh_module, 'RECLAIM_INTERVAL', 60)
+    channel = FakeChannel(hangs_on_exec=True)
+    manager = connected(channel)
+    cancel_event = threading.Event()
+    thread = threading.Thread(target=manager.execute_command, args=('ls',),
+                              kwargs={'cancel_event': cancel_event, 'timeout': 0})
+    thread.start()
+
+    time.sleep(0.05)
+    assert manager.get_stats()['open_channels'] == 1
+    cancel_event.set()
+    manager.reclaim_channels()
+    assert not channel.closed.is_set()
+
+    time.sleep(0.25)
+    assert manager.reclaim_channels() == 1
+    thread.join(5)
+    assert not thread.is_alive()
+    stats = manager.get_stats()
+    assert stats['open_channels'] == 0 and stats['reclaimed'] == 1
+
+
+def test_abandoned_channels_are_reclaimed_without_further_commands():
+    channel = FakeChannel(hangs_on_exec=True)
+    manager = connected(channel)
+    cancel_event = threading.Event()
+    thread = threading.Thread(target=manager.execute_command, args=('ls',),
+                              kwargs={'cancel_event': cancel_event, 'timeout': 0})
+    thread.start()
+    time.sleep(0.05)
+
+    cancel_event.set()
+    assert channel.closed.wait(5)
+    thread.join(5)
+    assert manager.counters['reclaimed'] == 1
+
+    # The reclaiming thread stops once no command is running
+    deadline = time.monotonic() + 5
+    while manager._reaper is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert manager._reaper is None
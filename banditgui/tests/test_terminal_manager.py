@@ -0,0 +1,75 @@
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+from banditgui.terminal.terminal_manager import TerminalManager
+
+
+@pytest.fixture
+def terminal():
+    """A terminal connected to a mocked SSH manager."""
+    ssh_manager = MagicMock()
+    ssh_manager.execute_command.side_effect = lambda command, **kwargs: f"remote: {command}"
+    terminal = TerminalManager(ssh_manager, command_log=MagicMock())
+    terminal.ssh_connected = True
+    return terminal
+
+
+@pytest.mark.parametrize('command', ['help', 'info', 'clear', 'level', 'level 3', 'general', 'echo hello world'])
+def test_local_commands_never_reach_the_server(terminal, command):
+    result = terminal.execute_command(command, session_id='s1', level=0)
+
+    assert not result.startswith('remote:')
+    terminal.ssh_manager.execute_command.assert_not_called()
+    terminal.command_log.record.assert_called_once_with('s1', command, 0)
+
+
+def test_local_commands_work_while_disconnected(terminal):
+    terminal.ssh_connected = False
+
+    assert 'LEVEL 0' in terminal.execute_command('level 0')
+    assert terminal.execute_command('echo hello') == 'hello'
+    assert terminal.execute_command('clear') == '<clear>'
+
+
+@pytest.mark.parametrize('command', ['echo $HOME', 'echo "a b"', 'echo -n x', 'echo x > file', 'echo *',
+                                     'info ls', 'help cd', 'ls -la'])
+def test_commands_the_shell_must_interpret_go_to_the_server(terminal, command):
+    assert terminal.execute_command(command) == f"remote: {command}"
+
+
+def test_help_lists_registered_commands(terminal):
+    terminal.register_command('flag', lambda args: 'no', usage='flag', summary='Ask for the flag')
+
+    lines = terminal.execute_command('help').splitlines()
+    assert '  flag                - Ask for the flag' in lines
+    assert lines.index('  level [number]      - Display information about a specific level') < \
+        lines.index('  ssh [options]       - Connect to SSH server')
+
+
+def test_register_command_checks_names(terminal):
+    with pytest.raises(ValueError):
+        terminal.register_command('ssh', lambda args: '')
+    with pytest.raises(ValueError):
+        terminal.register_command('two words', lambda args: '')
+    with pytest.raises(ValueError):
+        terminal.register_command('level', lambda args: '')
+    terminal.register_command('level', lambda args: 'replaced', replace=True)
+    assert terminal.execute_command('level 3') == 'replaced'
+
+
+def test_plugins_register_local_commands(terminal, monkeypatch):
+    plugin = types.ModuleType('terminal_plugin_example')
+    plugin.register = lambda manager: manager.register_command(
+        'whoami', lambda args: 'a student', applies=lambda args: not args)
+    monkeypatch.setitem(sys.modules, plugin.__name__, plugin)
+    broken = types.ModuleType('terminal_plugin_broken')
+    monkeypatch.setitem(sys.modules, broken.__name__, broken)
+
+    loaded = terminal.load_plugins([plugin.__name__, broken.__name__, 'no_such_terminal_plugin'])
+
+    assert loaded == [plugin.__name__]
+    assert terminal.execute_command('whoami') == 'a student'
+    assert terminal.execute_command('whoami --help') == 'remote: whoami --help'
@@ -0,0 +1,190 @@
+import json
+import logging
+import queue
+from unittest.mock import MagicMock
+
+import pytest
+
+from banditgui import app as app_module
+from banditgui.config.logging import DroppingQueueHandler, JsonFormatter
+from banditgui.utils.tracing import FileSpanExporter, Tracer, tracer
+
+
+class ListExporter:
+    def __init__(self):
+        self.traces = []
+
+    def export(self, trace):
+        self.traces.append(trace)
+
+    def close(self):
+        pass
+
+
+def run_trace(tracer_, child=None, error=None, **kwargs):
+    span, *tokens = tracer_.start_trace('GET /test', **kwargs)
+    if child:
+        with tracer_.span(child, key='value'):
+            pass
+    tracer_.finish_trace(span, *tokens, error=error)
+    return span
+
+
+def test_spans_nest_under_the_current_span():
+    exporter = ListExporter()
+    traced = Tracer(exporter, sample_rate=1.0)
+
+    root, *tokens = traced.start_trace('GET /test')
+    with traced.span('outer') as outer:
+        with traced.span('inner') as inner:
+            assert traced.current_span() is inner
+    traced.finish_trace(root, *tokens)
+
+    assert outer.parent_id == root.span_id and inner.parent_id == outer.span_id
+    assert [s.name for s in exporter.traces[0].spans] == ['GET /test', 'outer', 'inner']
+    assert all(s.end_ns is not None for s in exporter.traces[0].spans)
+    assert traced.current_span() is None
+
+
+def test_span_outside_a_trace_records_nothing():
+    with Tracer(ListExporter()).span('orphan') as span:
+        assert span is None
+
+
+def test_only_sampled_slow_or_failed_traces_are_kept(mocker):
+    exporter = ListExporter()
+    traced = Tracer(exporter, sample_rate=0.0, slow_ms=1000)
+
+    run_trace(traced, child='fast')
+    assert exporter.traces == []
+
+    run_trace(traced, error=RuntimeError('boom'))
+    assert exporter.traces[-1].spans[0].error == 'boom'
+
+    root, *tokens = traced.start_trace('GET /slow')
+    root.start_ns -= 2_000_000_000
+    traced.finish_trace(root, *tokens)
+    assert exporter.traces[-1].spans[0] is root
+
+    root, *tokens = traced.start_trace('GET /chat/messages')
+    traced.exempt_from_slow()
+    root.start_ns -= 2_000_000_000
+    traced.finish_trace(root, *tokens)
+    assert len(exporter.traces) == 2
+
+    with pytest.raises(ValueError):
+        root, *tokens = traced.start_trace('GET /test')
+        try:
+            with traced.span('ssh.exec'):
+                raise ValueError('channel closed')
+        finally:
+            traced.finish_trace(root, *tokens)
+    assert exporter.traces[-1].spans[1].error == 'channel closed'
+    assert traced.exported == 3
+
+
+def test_traceparent_continues_the_callers_trace():
+    exporter = ListExporter()
+    traced = Tracer(exporter, sample_rate=0.0)
+    traceparent = '00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01'
+
+    span = run_trace(traced, traceparent=traceparent, request_id='client-42')
+
+    assert span.trace.trace_id == '0af7651916cd43dd8448eb211c80319c'
+    assert span.parent_id == 'b7ad6b7169203331'
+    assert span.trace.request_id == 'client-42'
+    assert exporter.traces == [span.trace]
+
+
+@pytest.mark.parametrize('traceparent, request_id', [
+    ('garbage', 'has spaces'),
+    ('00-00000000000000000000000000000000-b7ad6b7169203331-01', 'x' * 65),
+])
+def test_invalid_headers_start_a_fresh_trace(traceparent, request_id):
+    span = run_trace(Tracer(None), traceparent=traceparent, request_id=request_id)
+    assert span.parent_id is None
+    assert span.trace.request_id == span.trace.trace_id
+    assert len(span.trace.trace_id) == 32
+
+
+def test_file_exporter_writes_json_lines_and_rotates(tmp_path):
+    path = tmp_path / 'traces' / 'traces.jsonl'
+    exporter = FileSpanExporter(str(path))
+    traced = Tracer(exporter, sample_rate=1.0)
+
+    first = run_trace(traced, child='ssh.exec')
+    line = json.loads(path.read_text().splitlines()[0])
+    assert line['traceId'] == first.trace.trace_id and line['requestId'] == first.trace.request_id
+    assert [s['name'] for s in line['spans']] == ['GET /test', 'ssh.exec']
+    assert line['spans'][1]['parentSpanId'] == first.span_id
+    assert line['spans'][1]['attributes'] == {'key': 'value'}
+
+    exporter.max_bytes = path.stat().st_size + 1
+    second = run_trace(traced)
+    rotated = tmp_path / 'traces' / 'traces.jsonl.1'
+    assert len(rotated.read_text().splitlines()) == 2
+    assert path.read_text() == ''
+
+    run_trace(traced)
+    exporter.close()
+    assert json.loads(rotated.read_text().splitlines()[1])['traceId'] == second.trace.trace_id
+    assert len(path.read_text().splitlines()) == 1
+
+
+def test_log_records_carry_the_request_id():
+    handler = DroppingQueueHandler(queue.Queue())
+    traced = Tracer(None)
+
+    root, *tokens = traced.start_trace('GET /test', request_id='req-1')
+    handler.handle(logging.LogRecord('banditgui.test', logging.INFO, __file__, 1, 'inside', None, None))
+    traced.finish_trace(root, *tokens)
+    handler.handle(logging.LogRecord('banditgui.test', logging.INFO, __file__, 1, 'outside', None, None))
+
+    inside, outside = (json.loads(JsonFormatter().format(handler.queue.get_nowait())) for _ in range(2))
+    assert inside['request_id'] == 'req-1'
+    assert 'request_id' not in outside
+
+
+@pytest.fixture
+def exported(mocker):
+    """Keep every trace the app makes and return them."""
+    exporter = ListExporter()
+    mocker.patch.object(tracer, 'exporter', exporter)
+    mocker.patch.object(tracer, 'sample_rate', 1.0)
+    return exporter.traces
+
+
+def test_responses_carry_a_request_id(exported):
+    client = app_module.app.test_client()
+
+    response = client.get('/quotes/random')
+    assert response.headers['X-Request-ID'] == exported[-1].request_id
+
+    response = client.get('/quotes/random', headers={'X-Request-ID': 'abc-123'})
+    assert response.headers['X-Request-ID'] == 'abc-123'
+    assert exported[-1].spans[0].attributes['http.route'] == '/quotes/random'
+
+
+def test_execute_is_traced_through_terminal_and_ssh(exported, mocker):
+    client = MagicMock()
+    channel = client.get_transport.return_value.open_session.return_value
+    channel.recv.side_effect = [b'readme\n', b'']
+    channel.recv_stderr_ready.return_value = False
+    mocker.patch.object(app_module.ssh_manager, 'client', client)
+    mocker.patch.object(app_module.terminal_manager, 'ssh_connected', True)
+
+    response = app_module.app.test_client().post('/execute', json={'command': 'ls -la', 'level': 0, 'wait': 5})
+
+    assert response.get_json()['output'] == 'readme\n'
+    # The command runs as a job with its own trace, sharing the request's ID
+    request_trace, job_trace = sorted(exported[-2:], key=lambda trace: trace.spans[0].name)
+    assert request_trace.request_id == job_trace.request_id == response.headers['X-Request-ID']
+    assert request_trace.spans[0].attributes['job.id'] == job_trace.spans[0].attributes['job.id']
+    spans = {span.name: span for span in job_trace.spans}
+    assert list(spans) == ['job execute', 'terminal.execute_command',
+                           'ssh.open_channel', 'ssh.exec', 'ssh.read']
+    assert spans['terminal.execute_command'].attributes['command.name'] == 'ls'
+    assert spans['ssh.exec'].parent_id == spans['terminal.execute_command'].span_id
+    assert spans['ssh.read'].attributes['ssh.output_bytes'] == 7
+    assert request_trace.spans[0].attributes['http.status_code'] == 200
+    channel.close.assert_called_once()
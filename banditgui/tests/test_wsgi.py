@@ -0,0 +1,30 @@
+import importlib
+
+from banditgui.config.settings import Config
+
+
+def test_wsgi_application_is_the_flask_app():
+    from banditgui.app import app
+    from banditgui.wsgi import application
+    assert application is app
+
+
+def test_gunicorn_settings_follow_config(monkeypatch):
+    monkeypatch.setenv('HOST', '0.0.0.0')
+    monkeypatch.setenv('PORT', '8080')
+    monkeypatch.setenv('THREADS', '32')
+    monkeypatch.setattr('banditgui.config.settings.config', Config())
+
+    import banditgui.config.gunicorn as gunicorn_settings
+    gunicorn_settings = importlib.reload(gunicorn_settings)
+
+    assert gunicorn_settings.bind == '0.0.0.0:8080'
+    assert gunicorn_settings.workers == 1
+    assert gunicorn_settings.threads == 32
+    assert gunicorn_settings.worker_class == 'gthread'
+    assert gunicorn_settings.preload_app is False
+
+
+def test_validate_rejects_unsupported_server_settings(monkeypatch):
+    monkeypatch.setenv('THREADS', '0')
+    assert 'THREADS' in Config().validate()
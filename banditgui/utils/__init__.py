@@ -11,11 +11,16 @@ from banditgui.utils.level_info import (
     get_all_levels_info,
     clear_cache
 )
+from banditgui.utils.extract_commands import get_commands_catalog
+from banditgui.utils.hints import get_hint, get_hints
 
 __all__ = [
     'get_general_info',
     'get_available_levels',
     'get_level_info',
     'get_all_levels_info',
-    'clear_cache'
+    'clear_cache',
+    'get_commands_catalog',
+    'get_hint',
+    'get_hints'
 ]
@@ -0,0 +1,330 @@
+"""
+Static asset pipeline for BanditGUI.
+
+The build step copies the stylesheets and scripts the page loads into
+static/dist under content-hashed names, minifies them, and writes gzip (and,
+if the brotli package is installed, brotli) copies next to them. Because a
+file's name changes whenever its content does, the app serves these files
+with a far-future, immutable Cache-Control.
+
+Run the build after changing a static file or installing Node.js packages:
+
+    python -m banditgui.utils.assets [--clean]
+
+A file whose source changed since the last build is served from its
+unhashed static URL until the next build.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from banditgui.config.logging import get_logger
+from banditgui.utils.fileio import atomic_write
+
+try:
+    import brotli
+except ImportError:  # brotli copies are optional
+    brotli = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+logger = get_logger('utils.assets')
+
+STATIC_DIR = Path(__file__).parent.parent / "static"
+DIST_DIR = STATIC_DIR / "dist"
+NODE_MODULES_DIR = Path(__file__).parent.parent.parent / "node_modules"
+MANIFEST_NAME = "manifest.json"
+
+# Files the page loads, by asset name; vendor/ assets come from `npm install`
+ASSET_SOURCES: Dict[str, Path] = {
+    'bandit-terminal.css': STATIC_DIR / 'bandit-terminal.css',
+    'xterm.css': STATIC_DIR / 'xterm.css',
+    'xterm-custom.css': STATIC_DIR / 'xterm-custom.css',
+    'js/xterm.js': STATIC_DIR / 'js' / 'xterm.js',
+    'js/xterm-addon-fit.js': STATIC_DIR / 'js' / 'xterm-addon-fit.js',
+    'js/xterm-addon-web-links.js': STATIC_DIR / 'js' / 'xterm-addon-web-links.js',
+    'js/quote-manager.js': STATIC_DIR / 'js' / 'quote-manager.js',
+    'js/command-runner.js': STATIC_DIR / 'js' / 'command-runner.js',
+    'js/bandit-app.js': STATIC_DIR / 'js' / 'bandit-app.js',
+    'vendor/marked.min.js': NODE_MODULES_DIR / 'marked' / 'marked.min.js',
+    'vendor/fontawesome/all.min.css':
+        NODE_MODULES_DIR / '@fortawesome' / 'fontawesome-free' / 'css' / 'all.min.css',
+}
+
+# Extensions worth precompressing (woff/woff2 and images are compressed already)
+COMPRESSIBLE = {'.css', '.js', '.json', '.svg', '.ttf', '.eot', '.txt'}
+
+# Length of the content hash in built file names
+HASH_LENGTH = 12
+
+# A quoted string, kept as is, or a comment, dropped
+CSS_STRING_OR_COMMENT = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?(?:\*/|$)', re.DOTALL)
+CSS_SPACE = re.compile(r'\s+')
+CSS_PUNCTUATION_SPACE = re.compile(r'\s*([{};,>])\s*')
+CSS_URL = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+
+def minify_css(text: str) -> str:
+    """
+    Minify a stylesheet.
+
+    Uses rcssmin when it is installed; otherwise strips comments and the
+    whitespace around braces, semicolons, commas and child combinators,
+    leaving quoted strings untouched.
+
+    Args:
+        text: The stylesheet
+
+    Returns:
+        str: The minified stylesheet
+    """
+    if rcssmin is not None:
+        return rcssmin.cssmin(text)
+    parts = []
+    position = 0
+    for match in CSS_STRING_OR_COMMENT.finditer(text):
+        if match.group(1) is None:
+            # A comment separates what is around it like whitespace
+            continue
+        parts.append(_squeeze_css(text[position:match.start()]))
+        parts.append(match.group(1))
+        position = match.end()
+    parts.append(_squeeze_css(text[position:]))
+    return ''.join(parts).strip()
+
+
+def _squeeze_css(text: str) -> str:
+    """Drop the comments and collapse the whitespace in CSS holding no strings."""
+    text = CSS_STRING_OR_COMMENT.sub(' ', text)
+    text = CSS_SPACE.sub(' ', text)
+    return CSS_PUNCTUATION_SPACE.sub(r'\1', text)
+
+
+def minify_js(text: str) -> str:
+    """
+    Minify a script with rjsmin when it is installed.
+
+    Without rjsmin the script is returned unchanged: stripping JavaScript
+    safely needs a tokenizer, and gzip recovers most of the difference.
+
+    Args:
+        text: The script
+
+    Returns:
+        str: The minified script
+    """
+    if rjsmin is not None:
+        return rjsmin.jsmin(text)
+    return text
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write a built file, replacing any earlier copy in one step."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _write_hashed(data: bytes, name: str, out_dir: Path, produced: Set[str]) -> str:
+    """
+    Write a file under a content-hashed name, with compressed copies.
+
+    Args:
+        data: The file contents
+        name: The original file name, e.g. 'bandit-app.js'
+        out_dir: Directory to write to
+        produced: Set the names of the files belonging to this build are added to
+
+    Returns:
+        str: The hashed file name, e.g. 'bandit-app.0123456789ab.js'
+    """
+    stem, dot, ext = name.rpartition('.')
+    if not dot:
+        stem, ext = name, ''
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    filename = f"{stem}.{digest}.{ext}" if ext else f"{stem}.{digest}"
+    path = out_dir / filename
+    if not path.is_file():
+        _write_bytes(path, data)
+        if f".{ext}" in COMPRESSIBLE:
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(compressed) < len(data):
+                _write_bytes(out_dir / f"{filename}.gz", compressed)
+            if brotli is not None:
+                compressed = brotli.compress(data, quality=11)
+                if len(compressed) < len(data):
+                    _write_bytes(out_dir / f"{filename}.br", compressed)
+    produced.update((filename, f"{filename}.gz", f"{filename}.br"))
+    return filename
+
+
+def _rewrite_css_urls(text: str, source: Path, out_dir: Path, produced: Set[str]) -> str:
+    """Build the files a stylesheet refers to and point its url()s at them."""
+    def replace(match):
+        ref = match.group(2).strip()
+        if ref.startswith(('data:', 'http:', 'https:', '//', '/', '#')):
+            return match.group(0)
+        cut = min((i for i in (ref.find('?'), ref.find('#')) if i >= 0), default=len(ref))
+        target = (source.parent / ref[:cut]).resolve()
+        if not target.is_file():
+            logger.warning(f"{source.name} refers to missing file {ref}")
+            return match.group(0)
+        # Query strings are cache busters, which the hash replaces; keep #fragments
+        fragment = ref[cut:] if ref[cut:cut + 1] == '#' else ''
+        return f"url({_write_hashed(target.read_bytes(), target.name, out_dir, produced)}{fragment})"
+
+    return CSS_URL.sub(replace, text)
+
+
+def _source_stamp(path: Path) -> Optional[tuple]:
+    """Modification time and size of a source file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def build_assets(out_dir: Optional[Path] = None, clean: bool = False) -> Dict[str, Any]:
+    """
+    Build the fingerprinted, minified and precompressed assets.
+
+    Assets whose source is missing (e.g. vendor files before `npm install`)
+    are skipped, and the page keeps loading them from their fallback URL.
+
+    Args:
+        out_dir: Directory to build into (defaults to static/dist)
+        clean: Delete files left over from earlier builds
+
+    Returns:
+        Dict[str, Any]: The manifest that was written
+    """
+    out_dir = Path(out_dir) if out_dir else DIST_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    assets = {}
+    produced = {MANIFEST_NAME}
+    for name, source in ASSET_SOURCES.items():
+        stamp = _source_stamp(source)
+        if stamp is None:
+            logger.warning(f"Skipping {name}: {source} not found")
+            continue
+        data = source.read_bytes()
+        if not source.name.endswith(('.min.js', '.min.css')):
+            text = data.decode('utf-8')
+            text = minify_css(text) if source.suffix == '.css' else minify_js(text)
+            data = text.encode('utf-8')
+        if source.suffix == '.css':
+            data = _rewrite_css_urls(data.decode('utf-8'), source, out_dir, produced).encode('utf-8')
+        filename = _write_hashed(data, source.name, out_dir, produced)
+        assets[name] = {
+            'file': filename,
+            'size': len(data),
+            'source_mtime_ns': stamp[0],
+            'source_size': stamp[1]
+        }
+        logger.info(f"Built {name} -> {filename} ({stamp[1]} -> {len(data)} bytes)")
+
+    manifest = {'version': 1, 'assets': assets}
+    atomic_write(out_dir / MANIFEST_NAME, [json.dumps(manifest, indent=2)])
+
+    if clean:
+        for name in set(os.listdir(out_dir)) - produced:
+            os.remove(out_dir / name)
+            logger.info(f"Removed stale asset {name}")
+    return manifest
+
+
+class AssetManifest:
+    """
+    Lookup of built asset file names.
+
+    The manifest is read on first use and again whenever the build replaces
+    it. An asset whose source changed since the build is treated as not
+    built, so the page never gets an outdated copy.
+    """
+
+    def __init__(self, dist_dir: Optional[Path] = None):
+        """
+        Initialize the manifest lookup.
+
+        Args:
+            dist_dir: Directory the assets were built into (defaults to static/dist)
+        """
+        self.dist_dir = Path(dist_dir) if dist_dir else DIST_DIR
+        self._assets: Dict[str, Dict[str, Any]] = {}
+        self._file_stamp: Optional[tuple] = None
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        """Read the manifest, or read it again if the build replaced it."""
+        path = self.dist_dir / MANIFEST_NAME
+        try:
+            stat = os.stat(path)
+            stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        if self._loaded and stamp == self._file_stamp:
+            return
+
+        self._file_stamp = stamp
+        self._loaded = True
+        self._assets = {}
+        if stamp is None:
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._assets = json.load(f).get('assets', {})
+            logger.debug(f"Loaded asset manifest with {len(self._assets)} assets")
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading asset manifest {path}: {e}")
+
+    def get_file(self, name: str) -> Optional[str]:
+        """
+        Get the built file name of an asset.
+
+        Args:
+            name: The asset name, e.g. 'js/bandit-app.js'
+
+        Returns:
+            Optional[str]: The hashed file name, or None if the asset is not
+            built or its source changed since the build
+        """
+        self._ensure_loaded()
+        entry = self._assets.get(name)
+        if entry is None:
+            return None
+        source = ASSET_SOURCES.get(name)
+        if source is not None:
+            stamp = _source_stamp(source)
+            if stamp is not None and stamp != (entry['source_mtime_ns'], entry['source_size']):
+                return None
+        return entry['file']
+
+
+def main():
+    """Build the assets from the command line."""
+    arg_parser = argparse.ArgumentParser(description="Build fingerprinted static assets.")
+    arg_parser.add_argument("--clean", action="store_true", help="delete files from earlier builds")
+    args = arg_parser.parse_args()
+
+    manifest = build_assets(clean=args.clean)
+    print(f"Built {len(manifest['assets'])} assets into {DIST_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ import re
 
 # Path to the input and output files
 from pathlib import Path
+from typing import Any, Dict, List
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 INPUT_FILE = DATA_DIR / 'all_data.json'
@@ -23,59 +24,66 @@ KNOWN_COMMANDS = [
     'strings', 'base64', 'tr', 'tar', 'gzip', 'bzip2', 'xxd', 'mkdir', 'cp', 'mv',
     'telnet', 'nc', 'ncat', 'openssl', 's_client', 'nmap', 'netstat', 'ss', 'socat',
     'diff', 'bash', 'screen', 'tmux', 'bg', 'fg', 'jobs', 'chmod', 'cron', 'crontab',
-    'vi', 'id', 'pwd', 'sh', 'more', 'less', 'head', 'tail', 'touch', 'echo', 'printf',
-    'sed', 'awk', 'cut', 'paste', 'join', 'comm', 'wc', 'git', 'wget', 'curl', 'ping',
-    'traceroute', 'ifconfig', 'ip', 'netcat', 'ps', 'top', 'kill', 'pkill', 'killall',
-    'sudo', 'su', 'chown', 'chgrp', 'chmod', 'umask', 'df', 'mount', 'umount', 'ln',
-    'stat', 'whatis', 'whereis', 'which', 'locate', 'updatedb', 'date', 'cal', 'expr',
-    'test', 'true', 'false', 'sleep', 'wait', 'history', 'clear', 'logout', 'exit',
-    'shutdown', 'reboot', 'poweroff', 'passwd', 'who', 'w', 'last', 'finger', 'uname',
-    'hostname', 'hostnamectl', 'uptime', 'free', 'vmstat', 'iostat', 'mpstat', 'sar',
-    'lsof', 'fuser', 'pgrep', 'pstree', 'nice', 'renice', 'time', 'timeout', 'watch',
-    'xargs', 'env', 'printenv', 'set', 'export', 'alias', 'unalias', 'source', 'eval',
-    'exec', 'shopt', 'ulimit', 'umask', 'getopts', 'read', 'declare', 'typeset', 'local',
-    'readonly', 'unset', 'shift', 'trap', 'wait', 'builtin', 'command', 'enable', 'help',
-    'let', 'bc', 'dc', 'factor', 'seq', 'yes', 'nl', 'fold', 'fmt', 'pr', 'od', 'hexdump',
-    'split', 'csplit', 'expand', 'unexpand', 'tee', 'script', 'wall', 'write', 'mesg',
-    'talk', 'ipcalc', 'host', 'dig', 'nslookup', 'whois', 'iptables', 'firewall-cmd',
-    'systemctl', 'service', 'journalctl', 'dmesg', 'rsync', 'scp', 'sftp', 'ftp', 'tftp',
-    'mail', 'mailx', 'mutt', 'zip', 'unzip', 'ar', 'cpio', 'rpm', 'dpkg', 'apt', 'yum',
-    'dnf', 'pacman', 'zypper', 'make', 'gcc', 'g++', 'ld', 'ar', 'nm', 'objdump', 'strip',
-    'gdb', 'strace', 'ltrace', 'ldd', 'nm', 'size', 'file', 'readelf', 'c++filt', 'addr2line',
-    'gprof', 'gcov', 'valgrind', 'perf', 'as', 'lex', 'yacc', 'bison', 'flex', 'ctags',
-    'cscope', 'indent', 'splint', 'lint', 'cppcheck', 'doxygen', 'javac', 'java', 'javadoc',
-    'jar', 'python', 'perl', 'ruby', 'php', 'node', 'npm', 'pip', 'gem', 'composer', 'cargo',
-    'go', 'rustc', 'cargo', 'dotnet', 'mono', 'mcs', 'sqlite3', 'mysql', 'psql', 'redis-cli',
-    'mongo', 'mongod', 'mongos', 'mongoexport', 'mongoimport', 'mongodump', 'mongorestore',
-    'pg_dump', 'pg_restore', 'mysqldump', 'mysqlimport', 'vacuum', 'analyze', 'explain',
-    'select', 'insert', 'update', 'delete', 'create', 'alter', 'drop', 'truncate', 'grant',
-    'revoke', 'commit', 'rollback', 'savepoint', 'begin', 'end', 'vacuum', 'analyze',
-    'explain', 'select', 'insert', 'update', 'delete', 'create', 'alter', 'drop', 'truncate',
-    'grant', 'revoke', 'commit', 'rollback', 'savepoint', 'begin', 'end'
+    'vi', 'id', 'pwd', 'sh', 'more', 'less', 'head', 'tail', 'touch', 'echo',
+    'printf', 'sed', 'awk', 'cut', 'paste', 'join', 'comm', 'wc', 'git', 'wget',
+    'curl', 'ping', 'traceroute', 'ifconfig', 'ip', 'netcat', 'ps', 'top', 'kill',
+    'pkill', 'killall', 'sudo', 'su', 'chown', 'chgrp', 'umask', 'df', 'mount',
+    'umount', 'ln', 'stat', 'whatis', 'whereis', 'which', 'locate', 'updatedb',
+    'date', 'cal', 'expr', 'test', 'true', 'false', 'sleep', 'wait', 'history',
+    'clear', 'logout', 'exit', 'shutdown', 'reboot', 'poweroff', 'passwd', 'who', 'w',
+    'last', 'finger', 'uname', 'hostname', 'hostnamectl', 'uptime', 'free', 'vmstat',
+    'iostat', 'mpstat', 'sar', 'lsof', 'fuser', 'pgrep', 'pstree', 'nice', 'renice',
+    'time', 'timeout', 'watch', 'xargs', 'env', 'printenv', 'set', 'export', 'alias',
+    'unalias', 'source', 'eval', 'exec', 'shopt', 'ulimit', 'getopts', 'read',
+    'declare', 'typeset', 'local', 'readonly', 'unset', 'shift', 'trap', 'builtin',
+    'command', 'enable', 'help', 'let', 'bc', 'dc', 'factor', 'seq', 'yes', 'nl',
+    'fold', 'fmt', 'pr', 'od', 'hexdump', 'split', 'csplit', 'expand', 'unexpand',
+    'tee', 'script', 'wall', 'write', 'mesg', 'talk', 'ipcalc', 'host', 'dig',
+    'nslookup', 'whois', 'iptables', 'firewall-cmd', 'systemctl', 'service',
+    'journalctl', 'dmesg', 'rsync', 'scp', 'sftp', 'ftp', 'tftp', 'mail', 'mailx',
+    'mutt', 'zip', 'unzip', 'ar', 'cpio', 'rpm', 'dpkg', 'apt', 'yum', 'dnf',
+    'pacman', 'zypper', 'make', 'gcc', 'g++', 'ld', 'nm', 'objdump', 'strip', 'gdb',
+    'strace', 'ltrace', 'ldd', 'size', 'readelf', 'c++filt', 'addr2line', 'gprof',
+    'gcov', 'valgrind', 'perf', 'as', 'lex', 'yacc', 'bison', 'flex', 'ctags',
+    'cscope', 'indent', 'splint', 'lint', 'cppcheck', 'doxygen', 'javac', 'java',
+    'javadoc', 'jar', 'python', 'perl', 'ruby', 'php', 'node', 'npm', 'pip', 'gem',
+    'composer', 'cargo', 'go', 'rustc', 'dotnet', 'mono', 'mcs', 'sqlite3', 'mysql',
+    'psql', 'redis-cli', 'mongo', 'mongod', 'mongos', 'mongoexport', 'mongoimport',
+    'mongodump', 'mongorestore', 'pg_dump', 'pg_restore', 'mysqldump', 'mysqlimport',
+    'vacuum', 'analyze', 'explain', 'select', 'insert', 'update', 'delete', 'create',
+    'alter', 'drop', 'truncate', 'grant', 'revoke', 'commit', 'rollback', 'savepoint',
+    'begin', 'end'
 ]
 
-def extract_commands():
-    """
-    Extract all unique commands from all_data.json and create a new JSON file
-    with each command having a 'used' field set to False.
+# Lowercased lookup set, built once for membership checks
+KNOWN_COMMANDS_SET = frozenset(cmd.lower() for cmd in KNOWN_COMMANDS)
+
+# Separators between command names in a level's 'commands' text
+COMMAND_SEPARATORS = re.compile(r'[,\s\n]+')
+
+# Catalog derived from the last levels list seen by get_commands_catalog
+_catalog_cache = (None, [])
+
+
+def build_commands_catalog(levels_info: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
-    # Read the input file
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    Build the command catalog from level information in a single pass.
 
+    Args:
+        levels_info: Level records as stored in levels_info.json
+
+    Returns:
+        List[Dict[str, Any]]: Commands sorted by name, each with 'name', 'url' and 'used'
+    """
     # Dictionary to store all unique commands and their links
     commands_dict = {}
 
-    # Process each level
-    for level in data['levels_info']:
+    for level in levels_info:
         # Extract commands from the 'commands' field
         if level['commands']:
-            # Split by commas, spaces, and newlines
-            cmd_list = re.split(r'[,\s\n]+', level['commands'])
-            for cmd in cmd_list:
-                cmd = cmd.strip()
+            for cmd in COMMAND_SEPARATORS.split(level['commands']):
                 # Only include if it's a known command
-                if cmd and cmd.lower() in [c.lower() for c in KNOWN_COMMANDS] and cmd not in commands_dict:
+                if cmd and cmd not in commands_dict and cmd.lower() in KNOWN_COMMANDS_SET:
                     commands_dict[cmd] = {
                         'name': cmd,
                         'url': '',
@@ -86,22 +94,52 @@ def extract_commands():
         for cmd_link in level['commands_links']:
             cmd_name = cmd_link['text'].strip()
             # Only include if it's a known command
-            if cmd_name and cmd_name.lower() in [c.lower() for c in KNOWN_COMMANDS]:
-                if cmd_name not in commands_dict:
-                    commands_dict[cmd_name] = {
-                        'name': cmd_name,
-                        'url': cmd_link['url'],
-                        'used': False
-                    }
-                elif cmd_name in commands_dict and not commands_dict[cmd_name]['url']:
-                    # Update URL if it wasn't set before
-                    commands_dict[cmd_name]['url'] = cmd_link['url']
-
-    # Convert dictionary to list
-    commands_list = list(commands_dict.values())
+            if not cmd_name or cmd_name.lower() not in KNOWN_COMMANDS_SET:
+                continue
+            if cmd_name not in commands_dict:
+                commands_dict[cmd_name] = {
+                    'name': cmd_name,
+                    'url': cmd_link['url'],
+                    'used': False
+                }
+            elif not commands_dict[cmd_name]['url']:
+                # Update URL if it wasn't set before
+                commands_dict[cmd_name]['url'] = cmd_link['url']
 
     # Sort by command name
-    commands_list.sort(key=lambda x: x['name'])
+    return sorted(commands_dict.values(), key=lambda x: x['name'])
+
+
+def get_commands_catalog() -> List[Dict[str, Any]]:
+    """
+    Get the command catalog for the currently loaded level information.
+
+    The catalog is derived in memory from level_info and rebuilt only when
+    the level data is reloaded.
+
+    Returns:
+        List[Dict[str, Any]]: Commands sorted by name
+    """
+    # Import here so the script runs without the banditgui package on the path
+    from banditgui.utils.level_info import get_all_levels_info
+
+    global _catalog_cache
+    levels_info = get_all_levels_info()
+    if _catalog_cache[0] is not levels_info:
+        _catalog_cache = (levels_info, build_commands_catalog(levels_info))
+    return _catalog_cache[1]
+
+
+def extract_commands():
+    """
+    Extract all unique commands from all_data.json and create a new JSON file
+    with each command having a 'used' field set to False.
+    """
+    # Read the input file
+    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    commands_list = build_commands_catalog(data['levels_info'])
 
     # Write to output file
     with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
@@ -0,0 +1,67 @@
+"""
+File helpers for BanditGUI.
+
+This module provides crash-safe writes for data files that the running
+application may be reading at the same time.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+
+def _read_umask() -> int:
+    """Read the process umask, which can only be done by setting it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode of files written by atomic_write: what open() would give a new file.
+# The umask is read once at import, before the app starts its threads, since
+# reading it briefly changes it for the whole process.
+FILE_MODE = 0o666 & ~_read_umask()
+
+
+def atomic_write(path: Path, chunks: Iterable[str]) -> None:
+    """
+    Write text to a file atomically.
+
+    The chunks are written to a temporary file in the same directory, which is
+    fsynced and then renamed over the target, so readers only ever see the old
+    or the new contents.
+
+    Args:
+        path: The file to write
+        chunks: The text to write, in order
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file as 0600; give it the usual permissions
+        os.chmod(tmp_name, FILE_MODE)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+    # Persist the rename itself (not supported on Windows)
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
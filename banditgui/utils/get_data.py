@@ -17,10 +17,12 @@ import os
 import re
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+from banditgui.utils.fileio import atomic_write
 
 # Constants
 BASE_URL = "https://overthewire.org/wargames/bandit/"
@@ -29,6 +31,17 @@ OUTPUT_DIR = Path(__file__).parent.parent / "data"
 GENERAL_OUTPUT_FILE = OUTPUT_DIR / "general_info.json"
 LEVELS_OUTPUT_FILE = OUTPUT_DIR / "levels_info.json"
 ALL_DATA_FILE = OUTPUT_DIR / "all_data.json"
+DATA_VERSION_FILE = OUTPUT_DIR / ".data_version"  # Rewritten after every save
+
+# Heading ids of the level page sections, mapped to their keys in the output
+SECTION_IDS = {
+    "level-goal": "goal",
+    "commands-you-may-need-to-solve-this-level": "commands",
+    "helpful-reading-material": "reading",
+}
+
+# Only build the tree for the page content, skipping navigation and footers
+CONTENT_STRAINER = SoupStrainer("div", id="content")
 
 # Configure requests session
 session = requests.Session()
@@ -86,10 +99,71 @@ def parse_general_info(html: str) -> Dict[str, str]:
     return {"general": general_text}
 
 
+def _collect_sections(content_div) -> Dict[str, Dict[str, Union[str, List[Dict[str, str]]]]]:
+    """
+    Collect the goal, commands and reading sections in a single traversal.
+
+    Each section is made of the siblings that follow its ``<h2>`` heading up to
+    the next ``<h2>``. Rather than walking a sibling chain per heading, the
+    children of each heading's parent are visited once and attributed to
+    whichever tracked heading precedes them.
+
+    Args:
+        content_div: The ``div#content`` tag of a level page
+
+    Returns:
+        A dictionary mapping section keys to their text and links
+    """
+    sections = {key: {"text": "", "links": []} for key in SECTION_IDS.values()}
+
+    # Keep the first heading per id, as find() would, and remember their parents
+    headings = {}
+    parents = []
+    for heading in content_div.find_all("h2", id=list(SECTION_IDS)):
+        key = SECTION_IDS[heading.get("id")]
+        if key in headings.values():
+            continue
+        headings[id(heading)] = key
+        if not any(heading.parent is parent for parent in parents):
+            parents.append(heading.parent)
+
+    for parent in parents:
+        active = None
+        for current in parent.children:
+            if getattr(current, 'name', None) == 'h2':
+                active = headings.get(id(current))
+                continue
+            if active is None:
+                continue
+
+            section = sections[active]
+            if active == "goal":
+                if hasattr(current, 'get_text'):
+                    section["text"] += current.get_text(strip=True) + "\n"
+                elif isinstance(current, str) and current.strip():
+                    section["text"] += current.strip() + "\n"
+            elif hasattr(current, 'find_all'):
+                # Extract links
+                for link in current.find_all('a'):
+                    if link.get('href') and link.text:
+                        section["links"].append({
+                            "text": link.text.strip(),
+                            "url": link.get('href')
+                        })
+                section["text"] += current.get_text(strip=True) + "\n"
+            elif isinstance(current, str) and current.strip():
+                section["text"] += current.strip() + "\n"
+
+    return sections
+
+
 def parse_level_info(html: str, level: int) -> Dict[str, Union[str, int, List[Dict[str, str]]]]:
     """
     Parse the level information from a level page.
 
+    Only ``div#content`` is built into a tree, and the three sections are
+    collected in one pass over it.
+
     Args:
         html: The HTML content of the level page
         level: The level number
@@ -97,7 +171,7 @@ def parse_level_info(html: str, level: int) -> Dict[str, Union[str, int, List[Di
     Returns:
         A dictionary containing the level information
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "html.parser", parse_only=CONTENT_STRAINER)
     content_div = soup.find("div", id="content")
 
     if not content_div:
@@ -110,75 +184,26 @@ def parse_level_info(html: str, level: int) -> Dict[str, Union[str, int, List[Di
             "reading_links": []
         }
 
-    # Extract level goal
-    goal_section = content_div.find("h2", id="level-goal")
-    goal_text = ""
-    if goal_section:
-        goal_text = ""
-        current = goal_section.next_sibling
-        while current and not (hasattr(current, 'name') and current.name == 'h2'):
-            if hasattr(current, 'get_text'):
-                goal_text += current.get_text(strip=True) + "\n"
-            elif isinstance(current, str) and current.strip():
-                goal_text += current.strip() + "\n"
-            current = current.next_sibling
-
-    # Extract commands and their links
-    commands_section = content_div.find("h2", id="commands-you-may-need-to-solve-this-level")
-    commands_text = ""
-    commands_links = []
-    if commands_section:
-        commands_text = ""
-        current = commands_section.next_sibling
-        while current and not (hasattr(current, 'name') and current.name == 'h2'):
-            if hasattr(current, 'find_all'):
-                # Extract links
-                for link in current.find_all('a'):
-                    if link.get('href') and link.text:
-                        commands_links.append({
-                            "text": link.text.strip(),
-                            "url": link.get('href')
-                        })
-                commands_text += current.get_text(strip=True) + "\n"
-            elif isinstance(current, str) and current.strip():
-                commands_text += current.strip() + "\n"
-            current = current.next_sibling
-
-    # Extract helpful reading material and their links
-    reading_section = content_div.find("h2", id="helpful-reading-material")
-    reading_text = ""
-    reading_links = []
-    if reading_section:
-        reading_text = ""
-        current = reading_section.next_sibling
-        while current and not (hasattr(current, 'name') and current.name == 'h2'):
-            if hasattr(current, 'find_all'):
-                # Extract links
-                for link in current.find_all('a'):
-                    if link.get('href') and link.text:
-                        reading_links.append({
-                            "text": link.text.strip(),
-                            "url": link.get('href')
-                        })
-                reading_text += current.get_text(strip=True) + "\n"
-            elif isinstance(current, str) and current.strip():
-                reading_text += current.strip() + "\n"
-            current = current.next_sibling
+    sections = _collect_sections(content_div)
 
     return {
         "level": level,
-        "goal": goal_text.strip(),
-        "commands": commands_text.strip(),
-        "commands_links": commands_links,
-        "reading": reading_text.strip(),
-        "reading_links": reading_links
+        "goal": sections["goal"]["text"].strip(),
+        "commands": sections["commands"]["text"].strip(),
+        "commands_links": sections["commands"]["links"],
+        "reading": sections["reading"]["text"].strip(),
+        "reading_links": sections["reading"]["links"]
     }
 
 
-def fetch_all_data() -> Dict[str, Union[Dict, List]]:
+def fetch_all_data(base_url: str = BASE_URL, delay: float = 1.0) -> Dict[str, Union[Dict, List]]:
     """
     Fetch all data from the OverTheWire Bandit website.
 
+    Args:
+        base_url: Base URL of the Bandit pages (a local stand-in can be used offline)
+        delay: Seconds to wait between level requests
+
     Returns:
         A dictionary containing all the fetched data
     """
@@ -189,7 +214,7 @@ def fetch_all_data() -> Dict[str, Union[Dict, List]]:
 
     # Fetch general information
     print("Fetching general information...")
-    general_html = fetch_page(BASE_URL)
+    general_html = fetch_page(base_url)
     if general_html:
         all_data["general_info"] = parse_general_info(general_html)
         print("General information fetched successfully.")
@@ -200,7 +225,7 @@ def fetch_all_data() -> Dict[str, Union[Dict, List]]:
     all_data["levels_info"] = []
     for level in LEVELS_RANGE:
         print(f"Fetching information for level {level}...")
-        level_url = f"{BASE_URL}bandit{level}.html"
+        level_url = f"{base_url}bandit{level}.html"
         level_html = fetch_page(level_url)
 
         if level_html:
@@ -211,32 +236,74 @@ def fetch_all_data() -> Dict[str, Union[Dict, List]]:
             print(f"Failed to fetch information for level {level}.")
 
         # Be nice to the server
-        time.sleep(1)
+        if delay:
+            time.sleep(delay)
 
     return all_data
 
 
-def save_data(data: Dict[str, Union[Dict, List]]) -> None:
+def _combined_chunks(data: Dict[str, Union[Dict, List]], serialized: Dict[str, str]) -> Iterator[str]:
+    """
+    Stream the combined JSON document from already serialized parts.
+
+    Produces the same text as ``json.dump(data, f, indent=2)``: a value nested
+    one level deep is its top-level serialization with every line indented.
+
+    Args:
+        data: The data to save
+        serialized: Top-level ``indent=2`` serializations keyed by data key
+
+    Yields:
+        str: Pieces of the combined document
+    """
+    if not data:
+        yield "{}"
+        return
+
+    yield "{"
+    for index, (key, value) in enumerate(data.items()):
+        text = serialized[key] if key in serialized else json.dumps(value, indent=2)
+        yield ("," if index else "") + "\n  " + json.dumps(key) + ": "
+        yield text.replace("\n", "\n  ")
+    yield "\n}"
+
+
+def save_data(data: Dict[str, Union[Dict, List]], output_dir: Path = OUTPUT_DIR) -> None:
     """
     Save the fetched data to JSON files.
 
+    Every file is replaced atomically, and each section is serialized once and
+    reused for all_data.json. The data version stamp is written last so a
+    running LevelInfo reloads once, after all files are in place.
+
     Args:
         data: The data to save
+        output_dir: Directory to write the JSON files to
     """
+    output_dir = Path(output_dir)
+    general_file = output_dir / GENERAL_OUTPUT_FILE.name
+    levels_file = output_dir / LEVELS_OUTPUT_FILE.name
+    all_data_file = output_dir / ALL_DATA_FILE.name
+
+    serialized = {
+        "general_info": json.dumps(data["general_info"], indent=2),
+        "levels_info": json.dumps(data["levels_info"], indent=2),
+    }
+
     # Save general information
-    with open(GENERAL_OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data["general_info"], f, indent=2)
-    print(f"General information saved to {GENERAL_OUTPUT_FILE}")
+    atomic_write(general_file, [serialized["general_info"]])
+    print(f"General information saved to {general_file}")
 
     # Save level information
-    with open(LEVELS_OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data["levels_info"], f, indent=2)
-    print(f"Level information saved to {LEVELS_OUTPUT_FILE}")
+    atomic_write(levels_file, [serialized["levels_info"]])
+    print(f"Level information saved to {levels_file}")
 
     # Save all data
-    with open(ALL_DATA_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
-    print(f"All data saved to {ALL_DATA_FILE}")
+    atomic_write(all_data_file, _combined_chunks(data, serialized))
+    print(f"All data saved to {all_data_file}")
+
+    # Tell running readers the data changed
+    atomic_write(output_dir / DATA_VERSION_FILE.name, [str(time.time_ns())])
 
 
 def main():
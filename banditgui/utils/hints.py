@@ -0,0 +1,170 @@
+"""
+Hint engine for BanditGUI.
+
+This module serves the progressive hints stored in data/hints.json. Each level
+has a list of tiers, from a gentle nudge to a near-complete walkthrough, and
+levels without hints fall back to the default tiers.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from banditgui.config.logging import get_logger
+from banditgui.utils.lazy import register_warmup
+
+logger = get_logger('utils.hints')
+
+
+class HintEngine:
+    """
+    Indexed, tiered hints for the Bandit levels.
+
+    The hints file is read once into a level -> tiers index and read again only
+    when the file is replaced on disk.
+    """
+
+    HINTS_FILE = Path(__file__).parent.parent / "data" / "hints.json"
+
+    def __init__(self, hints_file: Optional[Path] = None):
+        """
+        Initialize the hint engine.
+
+        Args:
+            hints_file: Path to the hints JSON file (defaults to data/hints.json)
+        """
+        self.hints_file = Path(hints_file) if hints_file else self.HINTS_FILE
+        self._index: Dict[int, Tuple[str, ...]] = {}
+        self._default: Tuple[str, ...] = ()
+        self._version: Optional[int] = None
+        self._file_stamp: Optional[tuple] = None
+        logger.debug("HintEngine initialized")
+
+    def _read_file_stamp(self) -> Optional[tuple]:
+        """Identity of the hints file on disk, or None if it is missing."""
+        try:
+            stat = os.stat(self.hints_file)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _ensure_loaded(self) -> None:
+        """Build the index, or rebuild it if the hints file changed since it was read."""
+        stamp = self._read_file_stamp()
+        if self._version is not None and stamp == self._file_stamp:
+            return
+
+        self._file_stamp = stamp
+        try:
+            with open(self.hints_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._index = {
+                int(level): tuple(tiers) for level, tiers in data.get('levels', {}).items() if tiers
+            }
+            self._default = tuple(data.get('default', ()))
+            self._version = data.get('version', 0)
+            logger.info(f"Loaded hints for {len(self._index)} levels (version {self._version}) from {self.hints_file}")
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading hints from {self.hints_file}: {e}")
+            self._index = {}
+            self._default = ("Read the level goal carefully and think about which commands might help.",)
+            self._version = 0
+
+    def get_version(self) -> int:
+        """
+        Get the version of the hint data.
+
+        Returns:
+            int: The 'version' field of the hints file
+        """
+        self._ensure_loaded()
+        return self._version
+
+    def get_tiers(self, level: int) -> Tuple[str, ...]:
+        """
+        Get all hint tiers for a level.
+
+        Args:
+            level: The level number
+
+        Returns:
+            Tuple[str, ...]: Hints from the most general to the most specific
+        """
+        self._ensure_loaded()
+        return self._index.get(level, self._default)
+
+    def get_hint(self, level: int, tier: int = 1) -> Dict[str, Any]:
+        """
+        Get one hint tier for a level.
+
+        Args:
+            level: The level number
+            tier: The 1-based tier to get; clamped to the tiers available
+
+        Returns:
+            Dict[str, Any]: The hint with its level, tier, total number of tiers and data version
+        """
+        tiers = self.get_tiers(level)
+        tier = min(max(tier, 1), len(tiers)) if tiers else 0
+        return {
+            'level': level,
+            'tier': tier,
+            'total_tiers': len(tiers),
+            'hint': tiers[tier - 1] if tier else "No hint available for this level.",
+            'version': self._version
+        }
+
+    def get_hints(self, level: int, up_to_tier: Optional[int] = None) -> List[str]:
+        """
+        Get the hints for a level up to a tier.
+
+        Args:
+            level: The level number
+            up_to_tier: Last tier to include (if None, all tiers)
+
+        Returns:
+            List[str]: The hints, most general first
+        """
+        tiers = self.get_tiers(level)
+        return list(tiers if up_to_tier is None else tiers[:max(up_to_tier, 0)])
+
+    def clear_cache(self) -> None:
+        """Forget the loaded hints so the next call reads the file again."""
+        self._index = {}
+        self._default = ()
+        self._version = None
+        self._file_stamp = None
+
+
+# Create a singleton instance; the hints file is read on first use
+hint_engine = HintEngine()
+register_warmup('hints.json', hint_engine.get_version)
+
+
+def get_hint(level: int, tier: int = 1) -> Dict[str, Any]:
+    """
+    Get one hint tier for a level.
+
+    Args:
+        level: The level number
+        tier: The 1-based tier to get
+
+    Returns:
+        Dict[str, Any]: The hint with its level, tier, total number of tiers and data version
+    """
+    return hint_engine.get_hint(level, tier)
+
+
+def get_hints(level: int, up_to_tier: Optional[int] = None) -> List[str]:
+    """
+    Get the hints for a level up to a tier.
+
+    Args:
+        level: The level number
+        up_to_tier: Last tier to include (if None, all tiers)
+
+    Returns:
+        List[str]: The hints, most general first
+    """
+    return hint_engine.get_hints(level, up_to_tier)
@@ -0,0 +1,106 @@
+"""
+Lazy providers for BanditGUI.
+
+This module defers building shared data managers until they are first used,
+so importing a module does not read its data files. Providers register
+themselves for ``warmup_all``, which the server calls at startup to load
+everything up front and report how long each part took.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Generic, List, Tuple, TypeVar
+
+from banditgui.config.logging import get_logger
+
+logger = get_logger('utils.lazy')
+
+T = TypeVar('T')
+
+# Warmup hooks in registration order, as (name, hook)
+_warmup_hooks: List[Tuple[str, Callable[[], object]]] = []
+
+
+def register_warmup(name: str, hook: Callable[[], object]) -> None:
+    """
+    Register a hook that loads something ahead of its first use.
+
+    Args:
+        name: Name reported in the warmup timings
+        hook: Callable that does the loading
+    """
+    _warmup_hooks.append((name, hook))
+
+
+def warmup_all() -> Dict[str, float]:
+    """
+    Run every registered warmup hook.
+
+    Returns:
+        Dict[str, float]: Seconds spent in each hook, by name
+    """
+    timings = {}
+    for name, hook in _warmup_hooks:
+        start = time.perf_counter()
+        try:
+            hook()
+        except Exception as e:
+            logger.error(f"Warmup of {name} failed: {e}")
+        timings[name] = time.perf_counter() - start
+    total = sum(timings.values())
+    logger.info(
+        f"Warmed up {len(timings)} components in {total * 1000:.1f} ms ("
+        + ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in timings.items()) + ")"
+    )
+    return timings
+
+
+class LazyProvider(Generic[T]):
+    """
+    Builds a shared instance on first use.
+
+    ``get`` is thread-safe: concurrent first calls build the instance once.
+    """
+
+    def __init__(self, factory: Callable[[], T], name: str):
+        """
+        Initialize the provider and register it for warmup.
+
+        Args:
+            factory: Callable that builds the instance
+            name: Name used in logs and warmup timings
+        """
+        self.factory = factory
+        self.name = name
+        self._instance = None
+        self._loaded = False
+        self._lock = threading.Lock()
+        register_warmup(name, self.get)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the instance has been built."""
+        return self._loaded
+
+    def get(self) -> T:
+        """
+        Get the instance, building it if needed.
+
+        Returns:
+            T: The shared instance
+        """
+        if self._loaded:
+            return self._instance
+        with self._lock:
+            if not self._loaded:
+                start = time.perf_counter()
+                self._instance = self.factory()
+                self._loaded = True
+                logger.debug(f"Loaded {self.name} in {(time.perf_counter() - start) * 1000:.1f} ms")
+        return self._instance
+
+    def reset(self) -> None:
+        """Drop the instance so the next ``get`` builds a new one."""
+        with self._lock:
+            self._instance = None
+            self._loaded = False
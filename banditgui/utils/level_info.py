@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional
 
 from banditgui.config.logging import get_logger
 from banditgui.exceptions import LevelInfoError
+from banditgui.utils.lazy import LazyProvider, register_warmup
 
 # Set up logging
 logger = get_logger('utils.level_info')
@@ -33,6 +34,7 @@ class LevelInfo:
     GENERAL_INFO_FILE = DATA_DIR / "general_info.json"
     LEVELS_INFO_FILE = DATA_DIR / "levels_info.json"
     ALL_DATA_FILE = DATA_DIR / "all_data.json"
+    DATA_VERSION_FILE = DATA_DIR / ".data_version"
 
     def __init__(self):
         """Initialize the LevelInfo class."""
@@ -40,9 +42,32 @@ class LevelInfo:
         self._general_info_cache = None
         self._levels_info_cache = None
         self._all_data_cache = None
+        self._data_version = self._read_data_version()
 
         logger.debug("LevelInfo initialized")
 
+    def _read_data_version(self) -> Optional[tuple]:
+        """
+        Read the version stamp that get_data.py rewrites after each save.
+
+        Returns:
+            Optional[tuple]: Identity of the stamp file, or None if there is none
+        """
+        try:
+            stat = os.stat(self.DATA_VERSION_FILE)
+        except OSError:
+            return None
+        # The stamp is replaced by rename, so the inode changes on every save
+        return (stat.st_ino, stat.st_mtime_ns)
+
+    def _check_data_version(self) -> None:
+        """Clear the cache once if the data files were saved since the last check."""
+        version = self._read_data_version()
+        if version != self._data_version:
+            self._data_version = version
+            logger.info("Level data changed on disk, reloading")
+            self.clear_cache()
+
     def _load_json_file(self, file_path: Path) -> Dict[str, Any]:
         """
         Load a JSON file.
@@ -125,6 +150,7 @@ class LevelInfo:
             Dict[str, str]: General information
         """
         try:
+            self._check_data_version()
             if self._general_info_cache is None:
                 # Try to load from general_info.json first
                 if os.path.exists(self.GENERAL_INFO_FILE):
@@ -153,6 +179,7 @@ class LevelInfo:
             List[int]: Available level numbers
         """
         try:
+            self._check_data_version()
             levels_data = self._get_levels_data()
 
             if levels_data:
@@ -178,6 +205,7 @@ class LevelInfo:
             Optional[Dict[str, str]]: Level information or None if not found
         """
         try:
+            self._check_data_version()
             levels_data = self._get_levels_data()
 
             for level_data in levels_data:
@@ -201,6 +229,7 @@ class LevelInfo:
             List[Dict[str, str]]: Information for all levels
         """
         try:
+            self._check_data_version()
             return self._get_levels_data()
         except Exception as e:
             error_msg = f"Error getting all levels information: {str(e)}"
@@ -218,8 +247,18 @@ class LevelInfo:
         logger.debug("Cache cleared")
 
 
-# Create a singleton instance
-level_info = LevelInfo()
+# The shared instance is built on first use
+level_info_provider = LazyProvider(LevelInfo, 'level_info')
+# Warming up also reads the level data, which LevelInfo itself loads on demand
+register_warmup('levels_info.json', lambda: level_info_provider.get().get_all_levels_info())
+
+
+def __getattr__(name: str):
+    # Keep `from banditgui.utils.level_info import level_info` working without building it at import
+    if name == 'level_info':
+        return level_info_provider.get()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Provide module-level functions that use the singleton
 def get_general_info() -> Dict[str, str]:
@@ -229,7 +268,7 @@ def get_general_info() -> Dict[str, str]:
     Returns:
         Dict[str, str]: General information
     """
-    return level_info.get_general_info()
+    return level_info_provider.get().get_general_info()
 
 
 def get_available_levels() -> List[int]:
@@ -239,7 +278,7 @@ def get_available_levels() -> List[int]:
     Returns:
         List[int]: Available level numbers
     """
-    return level_info.get_available_levels()
+    return level_info_provider.get().get_available_levels()
 
 
 def get_level_info(level: int) -> Optional[Dict[str, str]]:
@@ -252,7 +291,7 @@ def get_level_info(level: int) -> Optional[Dict[str, str]]:
     Returns:
         Optional[Dict[str, str]]: Level information or None if not found
     """
-    return level_info.get_level_info(level)
+    return level_info_provider.get().get_level_info(level)
 
 
 def get_all_levels_info() -> List[Dict[str, str]]:
@@ -262,12 +301,12 @@ def get_all_levels_info() -> List[Dict[str, str]]:
     Returns:
         List[Dict[str, str]]: Information for all levels
     """
-    return level_info.get_all_levels_info()
+    return level_info_provider.get().get_all_levels_info()
 
 
 def clear_cache() -> None:
     """Clear all cached data."""
-    level_info.clear_cache()
+    level_info_provider.get().clear_cache()
 
 
 if __name__ == "__main__":
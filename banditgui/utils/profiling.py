@@ -0,0 +1,227 @@
+"""
+Per-request profiling for BanditGUI.
+
+A request is profiled with cProfile when an admin sends the ``X-Profile``
+header, or when profiling has been armed for the next few requests through
+the admin API. Each profile is saved in pstats format (readable with
+``python -m pstats``, snakeviz or gprof2dot) next to a small JSON file
+describing the request; the oldest profiles are deleted once PROFILE_MAX_FILES
+are kept.
+
+Only one request is profiled at a time: profiling slows the request down,
+and a request that arrives while another is being profiled simply runs
+unprofiled.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from banditgui.config.logging import get_logger
+from banditgui.config.settings import config
+from banditgui.utils.fileio import atomic_write
+
+logger = get_logger('utils.profiling')
+
+# Names are the save time down to the microsecond, so they sort oldest first
+PROFILE_NAME_PATTERN = re.compile(r'\d{8}-\d{6}-\d{6}-[0-9a-f]{4}')
+
+# Orders accepted by summary(), as pstats sort keys
+SORT_KEYS = ('cumulative', 'tottime', 'ncalls', 'filename')
+
+
+class RequestProfiler:
+    """Profiles chosen requests and keeps a bounded directory of the results."""
+
+    def __init__(self, directory: str, max_profiles: int = 50):
+        """
+        Initialize the profiler; the directory is created on the first save.
+
+        Args:
+            directory: Where profiles are saved
+            max_profiles: Number of profiles kept before the oldest are deleted
+        """
+        self.directory = Path(directory)
+        self.max_profiles = max_profiles
+        self._active = threading.Lock()
+        self._lock = threading.Lock()
+        self._armed = 0
+        self._armed_endpoint: Optional[str] = None
+
+    def arm(self, count: int, endpoint: Optional[str] = None) -> None:
+        """
+        Profile the next requests without the client asking.
+
+        Args:
+            count: Number of requests to profile (0 disarms)
+            endpoint: Only count requests to this Flask endpoint, e.g. 'execute'
+
+        Raises:
+            ValueError: If count is negative
+        """
+        if count < 0:
+            raise ValueError(f"Invalid profile count: {count}")
+        with self._lock:
+            self._armed = count
+            self._armed_endpoint = endpoint or None
+        logger.info(f"Profiling armed for {count} request(s) to {endpoint or 'any endpoint'}")
+
+    def armed(self) -> Dict[str, Any]:
+        """Get the number of requests still to be profiled and the endpoint they are limited to."""
+        with self._lock:
+            return {'count': self._armed, 'endpoint': self._armed_endpoint}
+
+    def _armed_for(self, endpoint: Optional[str]) -> bool:
+        """Whether an armed slot applies to a request to the endpoint (call with the lock held)."""
+        return self._armed > 0 and self._armed_endpoint in (None, endpoint)
+
+    def start(self, endpoint: Optional[str] = None,
+              requested: bool = True) -> Optional[Tuple[cProfile.Profile, str]]:
+        """
+        Start profiling the calling thread, if the request should be profiled.
+
+        A request is profiled if an admin asked for it or an armed slot
+        applies to its endpoint. The slot is only used up once profiling has
+        started, so a request that finds the profiler busy leaves it for the
+        next one.
+
+        Args:
+            endpoint: The request's Flask endpoint
+            requested: Whether an admin asked for the request to be profiled
+
+        Returns:
+            Optional[Tuple[cProfile.Profile, str]]: The running profile and the
+            name it will be saved under, or None if the request is not to be
+            profiled or another request is already being profiled
+        """
+        if not requested:
+            with self._lock:
+                if not self._armed_for(endpoint):
+                    return None
+        if not self._active.acquire(blocking=False):
+            logger.debug("Profiler busy, request runs unprofiled")
+            return None
+        if not requested:
+            with self._lock:
+                # Another request may have taken the last slot meanwhile
+                if not self._armed_for(endpoint):
+                    self._active.release()
+                    return None
+                self._armed -= 1
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except Exception:
+            self._active.release()
+            raise
+        now = time.time()
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(now))
+        return profile, f"{stamp}-{int(now * 1e6) % 1_000_000:06d}-{os.urandom(2).hex()}"
+
+    def stop(self, profile: cProfile.Profile, name: str, info: Dict[str, Any]) -> bool:
+        """
+        Stop a profile started with start() and save it.
+
+        Args:
+            profile: The running profile
+            name: The name start() returned
+            info: Details of the request (method, path, status, ...) saved with it
+
+        Returns:
+            bool: True if the profile was saved
+        """
+        profile.disable()
+        self._active.release()
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(str(self.directory / f"{name}.prof"))
+            atomic_write(self.directory / f"{name}.json",
+                         [json.dumps(dict(info, name=name, created=time.time()))])
+            self._prune()
+        except OSError as e:
+            logger.error(f"Error saving profile {name}: {e}")
+            return False
+        logger.info(f"Saved profile {name} for {info.get('method')} {info.get('path')}")
+        return True
+
+    def _prune(self) -> None:
+        """Delete the oldest profiles beyond max_profiles."""
+        profiles = sorted(self.directory.glob('*.prof'))
+        for path in profiles[:max(len(profiles) - self.max_profiles, 0)]:
+            path.unlink(missing_ok=True)
+            path.with_suffix('.json').unlink(missing_ok=True)
+
+    def list_profiles(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Get the details of the most recent profiles.
+
+        Args:
+            limit: Maximum number of profiles to return
+
+        Returns:
+            List[Dict[str, Any]]: Newest first, each with the request details,
+            'name', 'created' and 'size' (bytes of profile data)
+        """
+        if not self.directory.is_dir():
+            return []
+        profiles = []
+        for path in sorted(self.directory.glob('*.prof'), reverse=True)[:limit]:
+            try:
+                info = json.loads(path.with_suffix('.json').read_text(encoding='utf-8'))
+                info['size'] = path.stat().st_size
+            except (OSError, ValueError):
+                # Deleted by a concurrent prune, or saved without its details
+                continue
+            profiles.append(info)
+        return profiles
+
+    def path(self, name: str) -> Optional[Path]:
+        """
+        Get the pstats file of a profile.
+
+        Args:
+            name: The profile's name
+
+        Returns:
+            Optional[Path]: The file, or None if the name is invalid or the profile is gone
+        """
+        if not PROFILE_NAME_PATTERN.fullmatch(name):
+            return None
+        path = self.directory / f"{name}.prof"
+        return path if path.is_file() else None
+
+    def summary(self, name: str, sort: str = 'cumulative', limit: int = 40) -> Optional[str]:
+        """
+        Render a profile as a pstats report.
+
+        Args:
+            name: The profile's name
+            sort: One of SORT_KEYS
+            limit: Number of functions listed
+
+        Returns:
+            Optional[str]: The report, or None if there is no such profile
+
+        Raises:
+            ValueError: If sort is not one of SORT_KEYS
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Invalid sort key: {sort}")
+        path = self.path(name)
+        if path is None:
+            return None
+        out = io.StringIO()
+        pstats.Stats(str(path), stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+
+# Create a singleton instance
+profiler = RequestProfiler(config.profile_dir, max_profiles=config.profile_max_files)
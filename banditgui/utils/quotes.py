@@ -4,12 +4,16 @@ Quotes utility for BanditGUI.
 This module provides functionality for loading and using geek pop culture quotes.
 """
 
+import heapq
 import json
 import os
 import random
-from typing import Dict, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
 
 from banditgui.config.logging import get_logger
+from banditgui.utils.lazy import LazyProvider
 
 logger = get_logger('utils.quotes')
 
@@ -17,11 +21,29 @@ logger = get_logger('utils.quotes')
 class QuoteManager:
     """
     Manager for geek pop culture quotes.
+
+    Quotes are formatted once when loaded and indexed by lowercased source and
+    character. Welcome quotes are sampled by weight (a quote's optional
+    'weight', default 1) without repeating a quote to the same session until
+    every quote has been shown.
     """
 
-    def __init__(self):
-        """Initialize the quote manager."""
+    def __init__(self, max_sessions: int = 1000):
+        """
+        Initialize the quote manager.
+
+        Args:
+            max_sessions: Number of sessions whose shown quotes are remembered
+        """
         self.quotes = []
+        self.formatted: List[str] = []
+        self._weight_exponents: List[float] = []
+        self._by_source: Dict[str, List[int]] = {}
+        self._by_character: Dict[str, List[int]] = {}
+        self._lookup_cache: Dict[tuple, List[int]] = {}
+        self.max_sessions = max_sessions
+        self._seen: "OrderedDict[str, Set[int]]" = OrderedDict()
+        self._lock = threading.Lock()
         self.load_quotes()
         logger.debug(f"QuoteManager initialized with {len(self.quotes)} quotes")
 
@@ -50,6 +72,22 @@ class QuoteManager:
             ]
             logger.warning(f"Using {len(self.quotes)} default quotes")
 
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Preformat the quotes and index them by lowercased source and character."""
+        self.formatted = [f'"{quote["text"]}"' for quote in self.quotes]
+        # Weighted sampling keys are random() ** (1 / weight)
+        self._weight_exponents = [1.0 / max(float(quote.get('weight', 1)), 1e-6) for quote in self.quotes]
+        self._by_source = {}
+        self._by_character = {}
+        self._lookup_cache = {}
+        for index, quote in enumerate(self.quotes):
+            self._by_source.setdefault(quote.get('source', '').lower(), []).append(index)
+            self._by_character.setdefault(quote.get('character', '').lower(), []).append(index)
+        with self._lock:
+            self._seen.clear()
+
     def get_random_quote(self) -> Dict:
         """
         Get a random quote.
@@ -73,10 +111,23 @@ class QuoteManager:
             str: A formatted quote string like '"Quote text"'
         """
         if quote is None:
+            if self.formatted:
+                return random.choice(self.formatted)
             quote = self.get_random_quote()
 
         return f'"{quote["text"]}"'
 
+    def _lookup(self, index: Dict[str, List[int]], key: str) -> List[Dict]:
+        """Find quotes whose lowercased index key contains ``key``, caching the match per query."""
+        key = key.lower()
+        cache_key = (id(index), key)
+        matches = self._lookup_cache.get(cache_key)
+        if matches is None:
+            # Scan the distinct keys rather than every quote
+            matches = sorted(i for name, indexes in index.items() if key in name for i in indexes)
+            self._lookup_cache[cache_key] = matches
+        return [self.quotes[i] for i in matches]
+
     def get_quotes_by_source(self, source: str) -> List[Dict]:
         """
         Get quotes from a specific source.
@@ -87,8 +138,7 @@ class QuoteManager:
         Returns:
             List[Dict]: List of quotes from the specified source
         """
-        source = source.lower()
-        return [q for q in self.quotes if source in q.get('source', '').lower()]
+        return self._lookup(self._by_source, source)
 
     def get_quotes_by_character(self, character: str) -> List[Dict]:
         """
@@ -100,12 +150,80 @@ class QuoteManager:
         Returns:
             List[Dict]: List of quotes from the specified character
         """
-        character = character.lower()
-        return [q for q in self.quotes if character in q.get('character', '').lower()]
+        return self._lookup(self._by_character, character)
+
+    def sample_indexes(self, count: int, session_id: Optional[str] = None) -> List[int]:
+        """
+        Pick distinct quotes by weight, skipping those the session has already seen.
+
+        Once a session has seen every quote, its history starts over.
+
+        Args:
+            count: Number of quotes to pick
+            session_id: The session to avoid repeats for (if None, only the sample is distinct)
+
+        Returns:
+            List[int]: Indexes into ``quotes`` and ``formatted``
+        """
+        count = min(count, len(self.quotes))
+        if count <= 0:
+            return []
+
+        with self._lock:
+            seen: Set[int] = set()
+            if session_id:
+                seen = self._seen.get(session_id)
+                if seen is None:
+                    seen = self._seen[session_id] = set()
+                    if len(self._seen) > self.max_sessions:
+                        self._seen.popitem(last=False)
+                else:
+                    self._seen.move_to_end(session_id)
+                if len(self.quotes) - len(seen) < count:
+                    seen.clear()
+
+            # Weighted sampling without replacement: keep the largest random() ** (1 / weight)
+            exponents = self._weight_exponents
+            candidates = (i for i in range(len(self.quotes)) if i not in seen)
+            picked = heapq.nlargest(count, candidates, key=lambda i: random.random() ** exponents[i])
+            if session_id:
+                seen.update(picked)
+        return picked
+
+    def get_welcome_quotes(self, count: int = 1, session_id: Optional[str] = None) -> List[str]:
+        """
+        Get formatted quotes for the terminal welcome message.
 
+        Args:
+            count: Number of quotes to return
+            session_id: The session to avoid repeats for
+
+        Returns:
+            List[str]: Formatted quote strings
+        """
+        formatted = self.formatted
+        return [formatted[i] for i in self.sample_indexes(count, session_id)]
+
+
+# The shared instance is built, and the quotes file read, on first use
+quote_manager_provider = LazyProvider(QuoteManager, 'quote_manager')
+
+
+def get_quote_manager() -> QuoteManager:
+    """
+    Get the shared quote manager, loading the quotes on first use.
+
+    Returns:
+        QuoteManager: The shared instance
+    """
+    return quote_manager_provider.get()
 
-# Create a singleton instance
-quote_manager = QuoteManager()
+
+def __getattr__(name: str):
+    # Keep `from banditgui.utils.quotes import quote_manager` working without loading at import
+    if name == 'quote_manager':
+        return quote_manager_provider.get()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_random_quote() -> Dict:
@@ -115,7 +233,7 @@ def get_random_quote() -> Dict:
     Returns:
         Dict: A random quote with text, source, and character
     """
-    return quote_manager.get_random_quote()
+    return get_quote_manager().get_random_quote()
 
 
 def get_formatted_quote() -> str:
@@ -125,27 +243,18 @@ def get_formatted_quote() -> str:
     Returns:
         str: A formatted quote string like '"Quote text"'
     """
-    return quote_manager.get_formatted_quote()
+    return get_quote_manager().get_formatted_quote()
 
 
-def get_terminal_welcome_quotes(count: int = 1) -> List[str]:
+def get_terminal_welcome_quotes(count: int = 1, session_id: Optional[str] = None) -> List[str]:
     """
     Get a list of formatted quotes for terminal welcome message.
 
     Args:
         count: Number of quotes to return
+        session_id: The session to avoid repeating quotes for
 
     Returns:
         List[str]: List of formatted quote strings
     """
-    if not quote_manager.quotes:
-        return []
-
-    # Ensure we don't request more quotes than available
-    num_to_sample = min(count, len(quote_manager.quotes))
-
-    # Select quotes randomly without replacement
-    sampled_quotes = random.sample(quote_manager.quotes, num_to_sample)
-
-    # Format the selected quotes
-    return [quote_manager.get_formatted_quote(q) for q in sampled_quotes]
+    return get_quote_manager().get_welcome_quotes(count, session_id)
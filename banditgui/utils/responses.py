@@ -0,0 +1,157 @@
+"""
+Response encoding for BanditGUI.
+
+This module provides a Flask JSON provider that encodes with orjson when it
+is installed, and compresses responses with brotli or gzip when the client
+accepts it and the body is large enough to be worth it.
+"""
+
+import gzip
+from typing import Any, Optional
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.datastructures import Accept
+
+from banditgui.config.logging import get_logger
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library encoder
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+logger = get_logger('utils.responses')
+
+# Content types worth compressing; everything else is binary or tiny
+COMPRESSIBLE_MIMETYPES = frozenset({'application/json', 'text/html', 'text/plain', 'text/csv'})
+
+# Brotli quality for dynamic responses (11 is for build-time compression only)
+BROTLI_QUALITY = 5
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes with orjson when it is installed.
+
+    Output matches the default provider's: keys are sorted, non-string keys
+    are converted to strings and dates go through ``default``. orjson writes
+    non-ASCII characters as UTF-8 rather than escaping them, and writes NaN
+    and infinite floats as ``null`` where the standard library writes the
+    non-standard ``NaN`` and ``Infinity``. Values orjson cannot encode, such
+    as integers wider than 64 bits, fall back to the standard library encoder.
+    """
+
+    def _orjson_dumps(self, obj: Any, indent: bool = False) -> Optional[bytes]:
+        """Encode with orjson, or return None if it cannot encode the value."""
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            return None
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON to a string.
+
+        Args:
+            obj: The data to serialize
+            **kwargs: Passed to :func:`json.dumps`; given any, orjson is not used
+
+        Returns:
+            str: The JSON text
+        """
+        if orjson is not None and not kwargs:
+            data = self._orjson_dumps(obj)
+            if data is not None:
+                return data.decode('utf-8')
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Serialize the arguments as a JSON response, as ``jsonify`` does.
+
+        Returns:
+            Response: The JSON response
+        """
+        if orjson is not None:
+            obj = self._prepare_response_obj(args, kwargs)
+            indent = (self.compact is None and self._app.debug) or self.compact is False
+            data = self._orjson_dumps(obj, indent)
+            if data is not None:
+                return self._app.response_class(data + b"\n", mimetype=self.mimetype)
+        return super().response(*args, **kwargs)
+
+
+def choose_encoding(accept_encodings: Accept) -> Optional[str]:
+    """
+    Pick the content encoding to compress a response with.
+
+    Args:
+        accept_encodings: The request's parsed Accept-Encoding header
+
+    Returns:
+        Optional[str]: 'br' or 'gzip', or None if the client accepts neither
+    """
+    if brotli is not None and accept_encodings['br']:
+        return 'br'
+    if accept_encodings['gzip']:
+        return 'gzip'
+    return None
+
+
+def compress_response(response: Response, accept_encodings: Accept,
+                      min_size: int = 1024, gzip_level: int = 6) -> Response:
+    """
+    Compress a response body if the client accepts it and it is large enough.
+
+    Streamed and file responses, responses that are already encoded and
+    bodies smaller than ``min_size`` are left alone. A strong ETag is made
+    weak, since the compressed bytes differ from the ones it was computed for.
+
+    Args:
+        response: The response to compress
+        accept_encodings: The request's parsed Accept-Encoding header
+        min_size: Smallest body, in bytes, worth compressing
+        gzip_level: gzip compression level (1-9)
+
+    Returns:
+        Response: The response, compressed in place if it qualified
+    """
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code < 200 or response.status_code in (204, 206, 304)
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    data = response.get_data()
+    if len(data) < min_size:
+        return response
+
+    # The body would be compressed for other clients, so caches must key on it
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(accept_encodings)
+    if encoding is None:
+        return response
+
+    if encoding == 'br':
+        compressed = brotli.compress(data, quality=BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(data, compresslevel=gzip_level, mtime=0)
+    if len(compressed) >= len(data):
+        return response
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
@@ -0,0 +1,337 @@
+"""
+Request tracing for BanditGUI.
+
+Each HTTP request gets a request ID and a trace: a root span for the request
+with child spans for the work it does (running a terminal command, opening
+an SSH channel, executing and reading the command). Spans follow the
+OpenTelemetry data model: 32-hex trace IDs, 16-hex span IDs, nanosecond
+epoch timestamps, and field names from the OTLP JSON encoding. A W3C
+``traceparent`` header continues the caller's trace.
+
+Finished traces are kept when they were sampled (TRACE_SAMPLE_RATE), were
+slower than TRACE_SLOW_MS, or failed, and are handed to an exporter that
+writes them to a local JSON-lines file or summarizes them in the log.
+"""
+
+import json
+import os
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from banditgui.config.logging import get_logger, request_id_var
+from banditgui.config.settings import config
+
+logger = get_logger('utils.tracing')
+
+# The span the current request (or thread) is working in
+_current_span: ContextVar[Optional['Span']] = ContextVar('banditgui_span', default=None)
+
+TRACEPARENT_PATTERN = re.compile(r'00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})')
+REQUEST_ID_PATTERN = re.compile(r'[A-Za-z0-9._-]{1,64}')
+
+
+class Trace:
+    """The spans of one request."""
+
+    __slots__ = ('trace_id', 'request_id', 'spans', 'sampled', 'keep_if_slow')
+
+    def __init__(self, trace_id: str, request_id: str, sampled: bool):
+        """
+        Initialize a trace.
+
+        Args:
+            trace_id: 32 hex digit trace ID
+            request_id: ID reported to the client and attached to log records
+            sampled: Whether the trace is exported regardless of its duration
+        """
+        self.trace_id = trace_id
+        self.request_id = request_id
+        self.spans: List['Span'] = []
+        self.sampled = sampled
+        self.keep_if_slow = True
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = ('trace', 'span_id', 'parent_id', 'name', 'start_ns', 'end_ns', 'attributes', 'error')
+
+    def __init__(self, trace: Trace, name: str, parent_id: Optional[str] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        """
+        Start a span.
+
+        Args:
+            trace: The trace the span belongs to
+            name: The operation, e.g. 'ssh.exec'
+            parent_id: Span ID of the enclosing span, if any
+            attributes: Initial attributes
+        """
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = dict(attributes) if attributes else {}
+        self.error: Optional[str] = None
+        trace.spans.append(self)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute, e.g. 'http.status_code'."""
+        self.attributes[key] = value
+
+    def record_error(self, error: Any) -> None:
+        """Mark the span as failed."""
+        self.error = str(error) or type(error).__name__
+
+    def end(self) -> None:
+        """End the span (ending it again has no effect)."""
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration in milliseconds, up to now if the span has not ended."""
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the span with OTLP JSON field names.
+
+        Returns:
+            Dict[str, Any]: traceId, spanId, parentSpanId, name, start and end
+            times in epoch nanoseconds, attributes and status
+        """
+        status = {'code': 'STATUS_CODE_ERROR', 'message': self.error} if self.error else {'code': 'STATUS_CODE_OK'}
+        return {
+            'traceId': self.trace.trace_id,
+            'spanId': self.span_id,
+            'parentSpanId': self.parent_id or '',
+            'name': self.name,
+            'startTimeUnixNano': self.start_ns,
+            'endTimeUnixNano': self.end_ns,
+            'attributes': self.attributes,
+            'status': status,
+        }
+
+
+class FileSpanExporter:
+    """
+    Appends each kept trace to a JSON-lines file.
+
+    When the file grows past ``max_bytes`` it is renamed to ``<path>.1``
+    (replacing the previous one) and a new file is started.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 10 * 1024 * 1024):
+        """
+        Initialize the exporter; the file is opened on the first export.
+
+        Args:
+            path: The traces file
+            max_bytes: Size at which the file is rotated
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._file = None
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        """Write a trace as one line: {traceId, requestId, spans}."""
+        line = json.dumps({
+            'traceId': trace.trace_id,
+            'requestId': trace.request_id,
+            'spans': [span.to_dict() for span in trace.spans],
+        }, default=str)
+        with self._lock:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line + '\n')
+            self._file.flush()
+            if self._file.tell() >= self.max_bytes:
+                self._file.close()
+                os.replace(self.path, f"{self.path}.1")
+                self._file = open(self.path, 'a', encoding='utf-8')
+
+    def close(self) -> None:
+        """Close the traces file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class ConsoleSpanExporter:
+    """Logs a one-line summary of each kept trace."""
+
+    def export(self, trace: Trace) -> None:
+        """Log the trace's spans with their durations."""
+        spans = ', '.join(f"{span.name} {span.duration_ms:.1f} ms" for span in trace.spans)
+        logger.info(f"Trace {trace.trace_id} (request {trace.request_id}): {spans}")
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+
+def create_exporter(kind: str, path: Optional[str] = None, max_bytes: int = 10 * 1024 * 1024):
+    """
+    Create a span exporter.
+
+    Args:
+        kind: 'file', 'console' or 'none'
+        path: The traces file, for the 'file' exporter
+        max_bytes: Size at which the traces file is rotated
+
+    Returns:
+        The exporter, or None for 'none'
+
+    Raises:
+        ValueError: If the kind is unknown
+    """
+    if kind == 'file':
+        return FileSpanExporter(path, max_bytes=max_bytes)
+    if kind == 'console':
+        return ConsoleSpanExporter()
+    if kind == 'none':
+        return None
+    raise ValueError(f"Unknown trace exporter: {kind}")
+
+
+class Tracer:
+    """
+    Creates spans and hands finished traces to an exporter.
+
+    Every request is traced; the keep decision is made when the request
+    ends, so slow and failed requests are exported even when not sampled.
+    """
+
+    def __init__(self, exporter=None, sample_rate: float = 0.1, slow_ms: float = 1000.0):
+        """
+        Initialize the tracer.
+
+        Args:
+            exporter: Receives kept traces (if None, nothing is exported)
+            sample_rate: Fraction of traces kept regardless of duration (0-1)
+            slow_ms: Traces at least this long are always kept (0 disables)
+        """
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.exported = 0
+
+    def start_trace(self, name: str, request_id: Optional[str] = None, traceparent: Optional[str] = None,
+                    attributes: Optional[Dict[str, Any]] = None) -> Tuple[Span, Token, Token]:
+        """
+        Start a trace with its root span and make it current.
+
+        Args:
+            name: Name of the root span, e.g. 'POST /execute'
+            request_id: The client's request ID, if it sent a valid one
+            traceparent: W3C traceparent header to continue, if any
+            attributes: Attributes of the root span
+
+        Returns:
+            Tuple[Span, Token, Token]: The root span and the context tokens to pass to finish_trace
+        """
+        parent_id = None
+        sampled = random.random() < self.sample_rate
+        match = TRACEPARENT_PATTERN.fullmatch(traceparent or '')
+        if match and match.group(1) != '0' * 32:
+            trace_id, parent_id = match.group(1), match.group(2)
+            sampled = sampled or int(match.group(3), 16) & 1 == 1
+        else:
+            trace_id = os.urandom(16).hex()
+        if not request_id or not REQUEST_ID_PATTERN.fullmatch(request_id):
+            request_id = trace_id
+
+        span = Span(Trace(trace_id, request_id, sampled), name, parent_id, attributes)
+        return span, _current_span.set(span), request_id_var.set(request_id)
+
+    def finish_trace(self, span: Span, span_token: Token, request_id_token: Token,
+                     error: Optional[BaseException] = None) -> None:
+        """
+        End a trace started with start_trace and export it if it is kept.
+
+        Args:
+            span: The root span
+            span_token: Context token returned by start_trace
+            request_id_token: Context token returned by start_trace
+            error: The exception the request failed with, if any
+        """
+        if error is not None:
+            span.record_error(error)
+        span.end()
+        _current_span.reset(span_token)
+        request_id_var.reset(request_id_token)
+
+        trace = span.trace
+        slow = trace.keep_if_slow and self.slow_ms > 0 and span.duration_ms >= self.slow_ms
+        failed = any(s.error for s in trace.spans)
+        if self.exporter is None or not (trace.sampled or slow or failed):
+            return
+        try:
+            self.exporter.export(trace)
+            self.exported += 1
+        except Exception as e:
+            logger.error(f"Error exporting trace {trace.trace_id}: {e}")
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """
+        Time a block as a child of the current span.
+
+        Outside a trace (e.g. in a background thread) nothing is recorded and
+        None is yielded. An exception raised in the block marks the span as
+        failed and is re-raised.
+
+        Args:
+            name: The operation, e.g. 'ssh.exec'
+            **attributes: Attributes of the span
+
+        Yields:
+            Optional[Span]: The span, or None outside a trace
+        """
+        parent = _current_span.get()
+        if parent is None:
+            yield None
+            return
+        span = Span(parent.trace, name, parent.span_id, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            span.end()
+            _current_span.reset(token)
+
+    def current_span(self) -> Optional[Span]:
+        """Get the span the caller is running in, if any."""
+        return _current_span.get()
+
+    def exempt_from_slow(self) -> None:
+        """Do not keep the current trace just for being slow, e.g. for long-polling requests."""
+        span = _current_span.get()
+        if span is not None:
+            span.trace.keep_if_slow = False
+
+    def close(self) -> None:
+        """Close the exporter."""
+        if self.exporter is not None:
+            self.exporter.close()
+
+
+# Create a singleton instance; the traces file is opened on the first export
+tracer = Tracer(
+    create_exporter(config.trace_exporter, config.trace_file, config.trace_file_max_bytes),
+    sample_rate=config.trace_sample_rate,
+    slow_ms=config.trace_slow_ms
+)
@@ -0,0 +1,22 @@
+"""WSGI entry point for BanditGUI.
+
+Production servers load ``banditgui.wsgi:application``, for example:
+
+    gunicorn -c python:banditgui.config.gunicorn banditgui.wsgi:application
+
+Importing this module validates the configuration and loads the data files,
+so a worker only starts accepting requests once it is ready to serve them.
+"""
+
+from banditgui.app import app, logger
+from banditgui.config.settings import config
+from banditgui.utils.lazy import warmup_all
+
+validation_error = config.validate()
+if validation_error:
+    raise RuntimeError(f"Configuration error: {validation_error}")
+
+warmup_all()
+logger.info("BanditGUI WSGI application ready")
+
+application = app
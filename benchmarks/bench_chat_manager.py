@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the ChatManager add_message/get_messages path.
+
+This script compares the slotted ChatMessage records with epoch timestamps
+against a reference copy of the previous dict messages, which formatted a
+datetime string on every add. It reports adds/sec, reads/sec (including
+JSON encoding, as the API does) and memory per stored message.
+
+Usage:
+    python benchmarks/bench_chat_manager.py [--messages N] [--rounds N]
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from banditgui.chat.chat_manager import ChatManager  # noqa: E402
+
+
+class LegacyChatManager:
+    """Reference copy of the dict-based ring buffer ChatManager."""
+
+    def __init__(self, max_messages: int = 1000, max_messages_per_level: int = 200):
+        self.max_messages_per_level = max_messages_per_level
+        self._messages = deque(maxlen=max_messages)
+        self._chat_history: Dict[int, deque] = {}
+        self._next_seq = 0
+
+    def add_message(self, message: str, level: Optional[int] = None, is_system: bool = False) -> None:
+        msg_obj = {
+            'content': message,
+            'level': level,
+            'is_system': is_system,
+            'timestamp': self._get_timestamp()
+        }
+        self._messages.append((self._next_seq, msg_obj))
+        self._next_seq += 1
+        if level is not None:
+            history = self._chat_history.get(level)
+            if history is None:
+                history = self._chat_history[level] = deque(maxlen=self.max_messages_per_level)
+            history.append(msg_obj)
+
+    def get_messages(self, level: Optional[int] = None, count: int = 50) -> List[Dict]:
+        history = self._chat_history.get(level, ())
+        return list(history)[-count:]
+
+    def _get_timestamp(self) -> str:
+        from datetime import datetime
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def serialize(messages) -> str:
+    """Encode messages as the /chat/messages route does."""
+    return json.dumps([msg if isinstance(msg, dict) else msg.to_dict() for msg in messages])
+
+
+def best_of(rounds: int, func: Callable[[], None]) -> float:
+    """Return the fastest of several timed calls, in seconds."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(factory: Callable, messages: int, rounds: int) -> Dict[str, float]:
+    """
+    Time adds and reads and measure the memory held per message.
+
+    Args:
+        factory: Creates a chat manager sized to hold every message
+        messages: Number of messages to add
+        rounds: Timed rounds
+
+    Returns:
+        Dict[str, float]: adds/sec, reads/sec and bytes per message
+    """
+    def add_all():
+        chat = factory()
+        for i in range(messages):
+            chat.add_message(f"message {i}", level=i % 10)
+
+    add_seconds = best_of(rounds, add_all)
+
+    chat = factory()
+    for i in range(messages):
+        chat.add_message(f"message {i}", level=i % 10)
+    reads = 1000
+    read_seconds = best_of(rounds, lambda: [serialize(chat.get_messages(level=i % 10, count=50)) for i in range(reads)])
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    chat = factory()
+    for i in range(messages):
+        chat.add_message(f"message {i}", level=i % 10)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    return {
+        'adds_per_sec': messages / add_seconds,
+        'reads_per_sec': reads / read_seconds,
+        'bytes_per_message': held / messages,
+    }
+
+
+def main() -> int:
+    """Run the benchmark and return a process exit code."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--messages", type=int, default=20000, help="messages added per round")
+    arg_parser.add_argument("--rounds", type=int, default=5, help="timed rounds")
+    args = arg_parser.parse_args()
+
+    size = {'max_messages': args.messages, 'max_messages_per_level': args.messages}
+    results = {
+        'dict': measure(lambda: LegacyChatManager(**size), args.messages, args.rounds),
+        'records': measure(lambda: ChatManager(**size), args.messages, args.rounds),
+    }
+
+    print(f"Messages: {args.messages}, best of {args.rounds} rounds")
+    print(f"  {'':<8} {'adds/s':>12} {'reads/s':>12} {'bytes/msg':>10}")
+    for name, result in results.items():
+        print(f"  {name:<8} {result['adds_per_sec']:12.0f} {result['reads_per_sec']:12.0f} "
+              f"{result['bytes_per_message']:10.0f}")
+    legacy, current = results['dict'], results['records']
+    print(f"  adds {current['adds_per_sec'] / legacy['adds_per_sec']:.2f}x, "
+          f"reads {current['reads_per_sec'] / legacy['reads_per_sec']:.2f}x, "
+          f"memory {current['bytes_per_message'] / legacy['bytes_per_message']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark for parse_level_info.
+
+This script times the single-pass level parser against the previous
+three-walk implementation over the saved fixture pages, and checks that the
+serialized output is byte-identical to the recorded levels_info.json.
+
+Usage:
+    python benchmarks/bench_parse_level_info.py [--rounds N]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from bs4 import BeautifulSoup
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from banditgui.utils.get_data import parse_level_info  # noqa: E402
+
+FIXTURES_DIR = ROOT / "banditgui" / "tests" / "fixtures" / "bandit"
+EXPECTED_FILE = FIXTURES_DIR / "expected" / "levels_info.json"
+
+
+def legacy_parse_level_info(html: str, level: int) -> Dict:
+    """
+    Reference copy of parse_level_info before the single-pass rewrite.
+
+    Args:
+        html: The HTML content of the level page
+        level: The level number
+
+    Returns:
+        A dictionary containing the level information
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    content_div = soup.find("div", id="content")
+
+    if not content_div:
+        return {
+            "level": level,
+            "goal": "Could not extract level information.",
+            "commands": "",
+            "commands_links": [],
+            "reading": "",
+            "reading_links": []
+        }
+
+    goal_section = content_div.find("h2", id="level-goal")
+    goal_text = ""
+    if goal_section:
+        current = goal_section.next_sibling
+        while current and not (hasattr(current, 'name') and current.name == 'h2'):
+            if hasattr(current, 'get_text'):
+                goal_text += current.get_text(strip=True) + "\n"
+            elif isinstance(current, str) and current.strip():
+                goal_text += current.strip() + "\n"
+            current = current.next_sibling
+
+    def walk(section):
+        text = ""
+        links = []
+        if section:
+            current = section.next_sibling
+            while current and not (hasattr(current, 'name') and current.name == 'h2'):
+                if hasattr(current, 'find_all'):
+                    for link in current.find_all('a'):
+                        if link.get('href') and link.text:
+                            links.append({"text": link.text.strip(), "url": link.get('href')})
+                    text += current.get_text(strip=True) + "\n"
+                elif isinstance(current, str) and current.strip():
+                    text += current.strip() + "\n"
+                current = current.next_sibling
+        return text, links
+
+    commands_text, commands_links = walk(
+        content_div.find("h2", id="commands-you-may-need-to-solve-this-level"))
+    reading_text, reading_links = walk(content_div.find("h2", id="helpful-reading-material"))
+
+    return {
+        "level": level,
+        "goal": goal_text.strip(),
+        "commands": commands_text.strip(),
+        "commands_links": commands_links,
+        "reading": reading_text.strip(),
+        "reading_links": reading_links
+    }
+
+
+def load_pages() -> List[tuple]:
+    """Load the saved level pages as (level, html) pairs."""
+    pages = []
+    for path in sorted(FIXTURES_DIR.glob("bandit*.html"), key=lambda p: int(p.stem[6:])):
+        pages.append((int(path.stem[6:]), path.read_text(encoding="utf-8")))
+    return pages
+
+
+def run(parser: Callable, pages: List[tuple], rounds: int) -> tuple:
+    """
+    Parse every page `rounds` times.
+
+    Returns:
+        The best time per round in seconds and the serialized output
+    """
+    best = float("inf")
+    output = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = [parser(html, level) for level, html in pages]
+        best = min(best, time.perf_counter() - start)
+        output = json.dumps(result, indent=2)
+    return best, output
+
+
+def main() -> int:
+    """Run the benchmark and return a process exit code."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--rounds", type=int, default=5, help="timed rounds per parser")
+    args = arg_parser.parse_args()
+
+    pages = load_pages()
+    expected = EXPECTED_FILE.read_text(encoding="utf-8")
+
+    legacy_time, legacy_output = run(legacy_parse_level_info, pages, args.rounds)
+    current_time, current_output = run(parse_level_info, pages, args.rounds)
+
+    print(f"Pages: {len(pages)}, best of {args.rounds} rounds")
+    print(f"  legacy      {legacy_time * 1000:8.2f} ms  ({len(pages) / legacy_time:7.1f} pages/s)")
+    print(f"  single-pass {current_time * 1000:8.2f} ms  ({len(pages) / current_time:7.1f} pages/s)")
+    print(f"  speedup     {legacy_time / current_time:8.2f}x")
+
+    failed = False
+    for name, output in (("legacy", legacy_output), ("single-pass", current_output)):
+        if output != expected:
+            print(f"Output drift: {name} output differs from {EXPECTED_FILE}")
+            failed = True
+    if not failed:
+        print("Output is byte-identical to the recorded levels_info.json")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
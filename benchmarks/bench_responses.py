@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Encode time and bytes on the wire for the API's JSON responses.
+
+Each route's payload is built from the shipped data, then encoded with
+Flask's default JSON provider and with FastJSONProvider (orjson when it is
+installed), and compressed as compress_response would for gzip and, if the
+brotli package is installed, brotli clients.
+
+Usage:
+    python benchmarks/bench_responses.py [--rounds N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from flask import Flask  # noqa: E402
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+from werkzeug.datastructures import Accept  # noqa: E402
+from werkzeug.http import parse_accept_header  # noqa: E402
+
+from banditgui.chat.storage import ChatMessage  # noqa: E402
+from banditgui.utils import responses  # noqa: E402
+from banditgui.utils.extract_commands import get_commands_catalog  # noqa: E402
+from banditgui.utils.level_info import get_level_info  # noqa: E402
+from banditgui.utils.quotes import get_terminal_welcome_quotes  # noqa: E402
+from banditgui.utils.responses import FastJSONProvider, compress_response  # noqa: E402
+
+
+def route_payloads() -> Dict[str, Any]:
+    """Build a representative payload for each JSON route."""
+    listing = "".join(
+        f"-rw-r----- 1 bandit{i % 34} bandit{i % 34} {i * 37 % 9000:5d} May  1 12:00 file{i:05d}.txt\n"
+        for i in range(1500)
+    )
+    messages = [
+        ChatMessage(f"Try `find / -user bandit7 -size 33c` for message {i}", 6, i % 5 == 0, 1714565400.0 + i, i)
+        for i in range(50)
+    ]
+    return {
+        '/execute': {'status': 'success', 'output': listing, 'currentLevel': 5},
+        '/level-info': {'status': 'success', 'levelInfo': get_level_info(5)},
+        '/commands/usage': {'status': 'success', 'commands': [
+            dict(entry, used=i % 3 == 0, count=i % 7) for i, entry in enumerate(get_commands_catalog())
+        ]},
+        '/chat/messages': {'status': 'success', 'messages': [m.to_dict() for m in messages],
+                           'nextBefore': 0, 'lastId': 49},
+        '/quotes/welcome': {'status': 'success', 'quotes': get_terminal_welcome_quotes(3)},
+    }
+
+
+def best_of(rounds: int, func: Callable[[], object], repeat: int) -> float:
+    """Return the fastest per-call time of ``func`` over several rounds, in seconds."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best
+
+
+def main() -> int:
+    """Run the benchmark and return a process exit code."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--rounds", type=int, default=5, help="timed rounds")
+    args = arg_parser.parse_args()
+
+    app = Flask(__name__)
+    default, fast = DefaultJSONProvider(app), FastJSONProvider(app)
+    encodings = ['gzip'] + (['br'] if responses.brotli is not None else [])
+
+    print(f"orjson: {'yes' if responses.orjson is not None else 'no'}, "
+          f"brotli: {'yes' if responses.brotli is not None else 'no'}; best of {args.rounds} rounds")
+    header = f"  {'route':<16} {'json':>9} {'fast':>9} {'speedup':>8} {'bytes':>8}"
+    for encoding in encodings:
+        header += f" {encoding:>8} {encoding + ' time':>10}"
+    print(header)
+
+    with app.app_context():
+        for route, payload in route_payloads().items():
+            repeat = 200
+            json_seconds = best_of(args.rounds, lambda: default.response(payload), repeat)
+            fast_seconds = best_of(args.rounds, lambda: fast.response(payload), repeat)
+            body = fast.response(payload).get_data()
+            line = (f"  {route:<16} {json_seconds * 1e6:7.1f}us {fast_seconds * 1e6:7.1f}us "
+                    f"{json_seconds / fast_seconds:7.2f}x {len(body):8d}")
+            for encoding in encodings:
+                accept = parse_accept_header(encoding, Accept)
+                compressed = compress_response(fast.response(payload), accept, min_size=0).get_data()
+                seconds = best_of(args.rounds, lambda: compress_response(
+                    fast.response(payload), accept, min_size=0), repeat // 4)
+                line += f" {len(compressed):8d} {(seconds - fast_seconds) * 1e6:8.1f}us"
+            print(line)
+    print("  bytes are uncompressed; compressed time excludes encoding")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
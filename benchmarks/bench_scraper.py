@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark for the level scraper.
+
+This script runs fetch_page -> parse_level_info -> save_data against the
+offline stand-in for the Bandit website, reports pages/sec for each stage and
+fails if the written JSON differs from the recorded expected output.
+
+Usage:
+    python benchmarks/bench_scraper.py [--rounds N]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "banditgui" / "tests"))
+
+from bandit_site import EXPECTED_DIR, BanditSite  # noqa: E402
+from banditgui.utils import get_data  # noqa: E402
+
+OUTPUT_FILES = ("general_info.json", "levels_info.json", "all_data.json")
+
+
+def run_round(base_url: str, output_dir: Path) -> dict:
+    """
+    Scrape the stand-in site once and save the result.
+
+    Returns:
+        dict: Seconds spent fetching, parsing and saving
+    """
+    timings = {"fetch": 0.0, "parse": 0.0, "save": 0.0}
+    data = {"general_info": {}, "levels_info": []}
+
+    start = time.perf_counter()
+    html = get_data.fetch_page(base_url)
+    timings["fetch"] += time.perf_counter() - start
+    start = time.perf_counter()
+    data["general_info"] = get_data.parse_general_info(html)
+    timings["parse"] += time.perf_counter() - start
+
+    for level in get_data.LEVELS_RANGE:
+        start = time.perf_counter()
+        html = get_data.fetch_page(f"{base_url}bandit{level}.html")
+        timings["fetch"] += time.perf_counter() - start
+        start = time.perf_counter()
+        data["levels_info"].append(get_data.parse_level_info(html, level))
+        timings["parse"] += time.perf_counter() - start
+
+    start = time.perf_counter()
+    get_data.save_data(data, output_dir)
+    timings["save"] = time.perf_counter() - start
+    return timings
+
+
+def check_drift(output_dir: Path) -> list:
+    """Return the names of output files that differ from the expected output."""
+    return [
+        name for name in OUTPUT_FILES
+        if (output_dir / name).read_bytes() != (EXPECTED_DIR / name).read_bytes()
+    ]
+
+
+def main() -> int:
+    """Run the benchmark and return a process exit code."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--rounds", type=int, default=5, help="timed rounds")
+    args = arg_parser.parse_args()
+
+    pages = len(get_data.LEVELS_RANGE) + 1
+    best = None
+    with BanditSite() as site, tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp)
+        for _ in range(args.rounds):
+            with contextlib.redirect_stdout(io.StringIO()):
+                timings = run_round(site.base_url, output_dir)
+            total = sum(timings.values())
+            if best is None or total < sum(best.values()):
+                best = timings
+        drifted = check_drift(output_dir)
+
+    total = sum(best.values())
+    print(f"Pages: {pages}, best of {args.rounds} rounds")
+    for stage, seconds in best.items():
+        print(f"  {stage:<6} {seconds * 1000:8.2f} ms")
+    print(f"  total  {total * 1000:8.2f} ms  ({pages / total:7.1f} pages/s)")
+
+    if drifted:
+        print(f"Output drift in: {', '.join(drifted)} (expected output in {EXPECTED_DIR})")
+        return 1
+    print("Output matches the recorded expected JSON")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Load test comparing Flask's development server with gunicorn.
+
+Each server is started in a subprocess on a free local port, then a pool of
+client threads sends requests to a few routes that do not need an SSH or LLM
+connection. It reports requests/sec and p50/p95 latency per route. gunicorn
+runs with the settings in banditgui/config/gunicorn.py and is skipped if it
+is not installed.
+
+Usage:
+    python benchmarks/bench_serving.py [--clients N] [--requests N] [--rounds N]
+"""
+
+import argparse
+import importlib.util
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import requests
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ROUTES = ("/", "/hints/5", "/quotes/random")
+
+SERVERS = {
+    'dev': [sys.executable, "-m", "banditgui.app"],
+    'gunicorn': [sys.executable, "-m", "gunicorn", "-c", "python:banditgui.config.gunicorn",
+                 "banditgui.wsgi:application"],
+}
+
+
+def free_port() -> int:
+    """Return a local port nothing is listening on."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(name: str, port: int, threads: int) -> subprocess.Popen:
+    """Start a server and wait until it answers."""
+    env = dict(os.environ, DEBUG="False", HOST="127.0.0.1", PORT=str(port), THREADS=str(threads),
+               CHAT_BACKEND="memory", LOG_LEVEL="WARNING")
+    process = subprocess.Popen(SERVERS[name], cwd=ROOT, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{name} server exited with code {process.returncode}")
+        try:
+            requests.get(f"http://127.0.0.1:{port}/", timeout=1)
+            return process
+        except requests.RequestException:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"{name} server did not start")
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    """Stop a server, waiting for it to exit."""
+    process.terminate()
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def load(url: str, clients: int, requests_per_client: int) -> Dict[str, float]:
+    """
+    Send requests from several client threads at once.
+
+    Args:
+        url: URL to request
+        clients: Number of concurrent clients
+        requests_per_client: Requests each client sends
+
+    Returns:
+        Dict[str, float]: requests/sec, p50 and p95 latency in seconds, and errors
+    """
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+    start_line = threading.Barrier(clients + 1)
+
+    def client():
+        nonlocal errors
+        session = requests.Session()
+        timings, failed = [], 0
+        start_line.wait()
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            try:
+                if session.get(url, timeout=30).status_code != 200:
+                    failed += 1
+            except requests.RequestException:
+                failed += 1
+            timings.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(timings)
+            errors += failed
+
+    pool = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in pool:
+        thread.start()
+    start_line.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    cuts = statistics.quantiles(latencies, n=20)
+    return {
+        'requests_per_sec': len(latencies) / elapsed,
+        'p50': statistics.median(latencies),
+        'p95': cuts[18],
+        'errors': errors,
+    }
+
+
+def main() -> int:
+    """Run the benchmark and return a process exit code."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--clients", type=int, default=16, help="concurrent clients")
+    arg_parser.add_argument("--requests", type=int, default=50, help="requests per client per route")
+    arg_parser.add_argument("--rounds", type=int, default=3, help="rounds per route, best kept")
+    args = arg_parser.parse_args()
+
+    names = ['dev']
+    if importlib.util.find_spec("gunicorn"):
+        names.append('gunicorn')
+    else:
+        print("gunicorn is not installed; only the development server is measured")
+
+    print(f"{args.clients} clients x {args.requests} requests, best of {args.rounds} rounds")
+    print(f"  {'server':<9} {'route':<15} {'req/s':>9} {'p50':>9} {'p95':>9} {'errors':>7}")
+    for name in names:
+        port = free_port()
+        process = start_server(name, port, threads=args.clients)
+        try:
+            for route in ROUTES:
+                url = f"http://127.0.0.1:{port}{route}"
+                load(url, args.clients, 5)  # warm up connections and caches
+                best = max((load(url, args.clients, args.requests) for _ in range(args.rounds)),
+                           key=lambda result: result['requests_per_sec'])
+                print(f"  {name:<9} {route:<15} {best['requests_per_sec']:9.0f} "
+                      f"{best['p50'] * 1000:7.2f}ms {best['p95'] * 1000:7.2f}ms {best['errors']:7d}")
+        finally:
+            stop_server(process)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
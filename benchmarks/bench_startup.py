@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Startup timing for the lazily loaded data managers.
+
+Each module is imported in a fresh interpreter, then the registered warmup
+hooks are run. The warmup time is what importing the module used to cost
+when the quote manager, level data and terminal levels were built eagerly.
+
+Usage:
+    python benchmarks/bench_startup.py [--rounds N]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = (
+    "banditgui.utils.quotes",
+    "banditgui.utils.level_info",
+    "banditgui.utils",
+    "banditgui.terminal.terminal_manager",
+)
+
+# Runs in the child interpreter; prints import and warmup seconds as JSON
+CHILD = """
+import json, logging, sys, time
+sys.path.insert(0, {root!r})
+logging.disable(logging.CRITICAL)
+import banditgui.config.logging  # shared by every module, not part of the comparison
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter() - start
+from banditgui.utils import lazy
+{extra}
+start = time.perf_counter()
+lazy.warmup_all()
+print(json.dumps({{"import": imported, "warmup": time.perf_counter() - start}}))
+"""
+
+# TerminalManager has no module-level instance; build one as the app does
+TERMINAL_SETUP = (
+    "manager = banditgui.terminal.terminal_manager.TerminalManager()\n"
+    "lazy.register_warmup('terminal_levels', manager.warmup)"
+)
+
+
+def time_module(module: str, rounds: int) -> dict:
+    """Return the best import and warmup seconds for a module over several fresh interpreters."""
+    extra = TERMINAL_SETUP if module.endswith("terminal_manager") else ""
+    best = None
+    for _ in range(rounds):
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD.format(root=str(ROOT), module=module, extra=extra)],
+            capture_output=True, text=True, check=True, cwd=ROOT
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if best is None or result["import"] + result["warmup"] < best["import"] + best["warmup"]:
+            best = result
+    return best
+
+
+def main() -> int:
+    """Run the benchmark and return a process exit code."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--rounds", type=int, default=5, help="fresh interpreters per module")
+    args = arg_parser.parse_args()
+
+    print(f"Best of {args.rounds} fresh interpreters")
+    print(f"  {'module':<38} {'import':>9} {'warmup':>9} {'eager':>9}")
+    for module in MODULES:
+        result = time_module(module, args.rounds)
+        eager = result["import"] + result["warmup"]
+        print(f"  {module:<38} {result['import'] * 1000:7.2f}ms {result['warmup'] * 1000:7.2f}ms "
+              f"{eager * 1000:7.2f}ms")
+    print("  eager = import + warmup, the import cost before loading was deferred")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
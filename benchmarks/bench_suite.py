@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the core request paths, with results saved as JSON.
+
+Each case times one path with everything outside the process faked: the SSH
+server is a stand-in that answers instantly, and the LLM behind /ask-a-pro is
+a stub. Results are written to benchmarks/results/<commit>.json; pass
+``--compare`` with an earlier results file to report the change per case and
+exit with status 1 if any case got slower than ``--threshold``.
+
+Usage:
+    python benchmarks/bench_suite.py [--rounds N] [--filter TEXT] [--output FILE]
+                                     [--compare FILE] [--threshold FRACTION]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+# Keep the app's side effects out of the repository and its logs off stdout;
+# values already set in the environment win
+os.environ.setdefault("CHAT_BACKEND", "memory")
+os.environ.setdefault("TRACE_EXPORTER", "none")
+os.environ.setdefault("USAGE_DIR", tempfile.mkdtemp(prefix="banditgui-bench-"))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from banditgui import app as app_module  # noqa: E402
+from banditgui.chat.chat_manager import ChatManager  # noqa: E402
+from banditgui.ssh.ssh_command import parse_ssh_command  # noqa: E402
+from banditgui.terminal.command_log import CommandLog  # noqa: E402
+from banditgui.terminal.command_usage import CommandUsageTracker  # noqa: E402
+from banditgui.terminal.terminal_manager import TerminalManager  # noqa: E402
+from banditgui.utils.get_data import parse_level_info  # noqa: E402
+from banditgui.utils.level_info import LevelInfo  # noqa: E402
+from banditgui.utils.quotes import get_random_quote, get_terminal_welcome_quotes  # noqa: E402
+
+FIXTURES_DIR = ROOT / "banditgui" / "tests" / "fixtures" / "bandit"
+
+# A directory listing, as a typical remote command returns
+LISTING = "".join(
+    f"-rw-r----- 1 bandit5 bandit5 {i * 37 % 9000:5d} May  1 12:00 file{i:03d}.txt\n" for i in range(40)
+)
+
+# Setup functions by case name; each returns the call to time and how many
+# times to call it per round
+CASES: Dict[str, Callable[[], tuple]] = {}
+
+
+def case(name: str):
+    """Register a benchmark case."""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+class FakeSSHManager:
+    """Stands in for SSHManager, answering every command at once."""
+
+    def execute_command(self, command: str, cancel_event=None) -> str:
+        """Return a canned listing."""
+        return LISTING
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+
+def stub_completion(**kwargs):
+    """Stands in for litellm.completion, answering at once."""
+    message = SimpleNamespace(content="Look at the files in the home directory with `ls -la`.")
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@case("execute_route")
+def setup_execute_route():
+    """POST /execute for a command forwarded to the SSH server, waiting for its job."""
+    app_module.terminal_manager.ssh_manager = FakeSSHManager()
+    app_module.terminal_manager.ssh_connected = True
+    client = app_module.app.test_client()
+    return lambda: client.post("/execute", json={"command": "ls -la", "level": 5, "wait": 5}), 200
+
+
+@case("terminal_dispatch_ssh")
+def setup_terminal_dispatch_ssh():
+    """TerminalManager.execute_command for a command forwarded to the SSH server."""
+    manager = TerminalManager(FakeSSHManager(), CommandUsageTracker(tempfile.mkdtemp(), flush_interval=None),
+                              CommandLog())
+    manager.ssh_connected = True
+    return lambda: manager.execute_command("cat readme", session_id="a" * 32, level=5), 5000
+
+
+@case("terminal_dispatch_local")
+def setup_terminal_dispatch_local():
+    """TerminalManager.execute_command for a command handled locally."""
+    manager = TerminalManager(FakeSSHManager(), CommandUsageTracker(tempfile.mkdtemp(), flush_interval=None),
+                              CommandLog())
+    return lambda: manager.execute_command("clear", session_id="a" * 32, level=5), 5000
+
+
+@case("terminal_local_level")
+def setup_terminal_local_level():
+    """TerminalManager.execute_command for the local level command, with the server disconnected."""
+    manager = TerminalManager(FakeSSHManager(), CommandUsageTracker(tempfile.mkdtemp(), flush_interval=None),
+                              CommandLog())
+    manager.execute_command("level 5", session_id="a" * 32, level=5)
+    return lambda: manager.execute_command("level 5", session_id="a" * 32, level=5), 5000
+
+
+@case("level_info_get")
+def setup_level_info_get():
+    """LevelInfo.get_level_info once its data is cached."""
+    level_info = LevelInfo()
+    level_info.get_level_info(5)
+    return lambda: level_info.get_level_info(17), 5000
+
+
+@case("chat_add_get")
+def setup_chat_add_get():
+    """ChatManager.add_message followed by get_messages on the in-memory store."""
+    manager = ChatManager()
+    for i in range(200):
+        manager.add_message(f"message {i}", level=5, session_id="a" * 32)
+
+    def add_get():
+        manager.add_message("How do I read a file named -?", level=5, session_id="a" * 32)
+        return manager.get_messages(level=5, count=50, session_id="a" * 32)
+    return add_get, 2000
+
+
+@case("quote_random")
+def setup_quote_random():
+    """Drawing a random quote."""
+    get_random_quote()
+    return get_random_quote, 20000
+
+
+@case("quote_welcome")
+def setup_quote_welcome():
+    """Drawing the terminal's welcome quotes for a session."""
+    get_terminal_welcome_quotes(3, session_id="a" * 32)
+    return lambda: get_terminal_welcome_quotes(3, session_id="a" * 32), 5000
+
+
+@case("ask_a_pro_route")
+def setup_ask_a_pro_route():
+    """POST /ask-a-pro with a stub LLM."""
+    app_module.completion = stub_completion
+    client = app_module.app.test_client()
+    payload = {
+        "llm": "openai/gpt-4o",
+        "level_name": "5",
+        "level_description": "The password is in a human-readable file in the inhere directory.",
+        "command_history": ["ls -la", "cd inhere", "file ./*"],
+    }
+    return lambda: client.post("/ask-a-pro", json=payload), 200
+
+
+@case("ssh_command_parse")
+def setup_ssh_command_parse():
+    """Parsing ssh command lines, uncached, on the fast path and with full tokenizing."""
+    commands = ["ssh bandit3@bandit.labs.overthewire.org -p 2220",
+                "ssh -i sshkey.private -o StrictHostKeyChecking=no bandit14@localhost -p 2220"]
+    return lambda: [parse_ssh_command.__wrapped__(command) for command in commands], 5000
+
+
+@case("parse_level_info")
+def setup_parse_level_info():
+    """parse_level_info over every saved level page."""
+    pages = [(int(path.stem[6:]), path.read_text(encoding="utf-8"))
+             for path in FIXTURES_DIR.glob("bandit*.html")]
+    return lambda: [parse_level_info(html, level) for level, html in pages], 1
+
+
+def measure(func: Callable[[], object], repeat: int, rounds: int) -> Dict[str, float]:
+    """
+    Time a call over several rounds.
+
+    Returns:
+        Dict[str, float]: The best and median time per call in microseconds,
+        and the calls per round
+    """
+    func()
+    per_call = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        per_call.append((time.perf_counter() - start) / repeat * 1e6)
+    return {"best_us": min(per_call), "median_us": statistics.median(per_call), "repeat": repeat}
+
+
+def git_commit() -> Optional[str]:
+    """Return the checked-out commit, with '-dirty' if tracked files were changed, or None outside git."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        changes = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT,
+                                 capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if changes else commit
+
+
+def compare(results: Dict[str, Dict], baseline_file: Path, threshold: float) -> List[str]:
+    """
+    Print each case's change from an earlier run.
+
+    Returns:
+        List[str]: The cases that got slower by more than the threshold
+    """
+    baseline = json.loads(baseline_file.read_text(encoding="utf-8"))
+    print(f"Compared with {baseline.get('commit') or baseline_file.name}:")
+    regressions = []
+    for name, result in results.items():
+        before = baseline["benchmarks"].get(name)
+        if before is None:
+            print(f"  {name:<24} new")
+            continue
+        change = result["best_us"] / before["best_us"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  SLOWER"
+        print(f"  {name:<24} {before['best_us']:10.1f}us -> {result['best_us']:10.1f}us {change:+7.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmark and return a process exit code."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--rounds", type=int, default=5, help="timed rounds per case")
+    arg_parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    arg_parser.add_argument("--output", type=Path, help="results file (default: benchmarks/results/<commit>.json)")
+    arg_parser.add_argument("--compare", type=Path, help="earlier results file to compare with")
+    arg_parser.add_argument("--threshold", type=float, default=0.25,
+                            help="slowdown of the best time, as a fraction, reported as a regression")
+    args = arg_parser.parse_args()
+
+    commit = git_commit()
+    results = {}
+    print(f"Best of {args.rounds} rounds")
+    for name, setup in CASES.items():
+        if args.filter not in name:
+            continue
+        func, repeat = setup()
+        results[name] = measure(func, repeat, args.rounds)
+        print(f"  {name:<24} {results[name]['best_us']:10.1f}us  (median {results[name]['median_us']:.1f}us)")
+
+    output = args.output or RESULTS_DIR / f"{commit or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "commit": commit,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "rounds": args.rounds,
+        "benchmarks": results,
+    }, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to {output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print(f"FAIL: slower by more than {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
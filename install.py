@@ -175,7 +175,9 @@ def install_nodejs_dependencies():
             "dependencies": {
                 "xterm": "^4.19.0",
                 "xterm-addon-fit": "^0.5.0",
-                "xterm-addon-web-links": "^0.4.0"
+                "xterm-addon-web-links": "^0.4.0",
+                "marked": "^4.3.0",
+                "@fortawesome/fontawesome-free": "6.0.0"
             }
         }
         
@@ -191,6 +193,24 @@ def install_nodejs_dependencies():
         print_error(f"Failed to install Node.js dependencies: {output}")
         return False
 
+def build_static_assets():
+    """Build the fingerprinted and precompressed static assets."""
+    print_header("Building Static Assets")
+
+    # Determine python command based on OS
+    if platform.system() == "Windows":
+        python_cmd = f"{os.path.join('venv', 'Scripts', 'python')}"
+    else:
+        python_cmd = f"{os.path.join('venv', 'bin', 'python')}"
+
+    success, output = run_command(f"{python_cmd} -m banditgui.utils.assets --clean")
+    if success:
+        print_success("Built static assets")
+        return True
+    else:
+        print_warning(f"Failed to build static assets, they will be served unbuilt: {output}")
+        return False
+
 def setup_environment_variables():
     """Set up environment variables."""
     print_header("Setting Up Environment Variables")
@@ -289,6 +309,9 @@ def main():
     else:
         print_warning("Skipping Node.js dependencies installation")
     
+    # Build static assets (vendored Node.js packages are included if installed)
+    build_static_assets()
+    
     # Set up environment variables
     setup_environment_variables()
     